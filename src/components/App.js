@@ -9,6 +9,7 @@ import InputBox from "./InputBox";
 import QueriedLyrics from "./QueriedLyrics";
 import InfoButton from "./InfoButton";
 import InfoModal from "./InfoModal";
+import catalog from "./catalog";
 
 import { ArtistName } from "./constants";
 import { isMobile, getURLQueryStrings, URL_QUERY_PARAM, convertQueriesToPlurals } from "./utils";
@@ -16,7 +17,6 @@ import { isMobile, getURLQueryStrings, URL_QUERY_PARAM, convertQueriesToPlurals
 /* -----------------------------------------------------------------------
    Build helper maps from album_map.json
    -------------------------------------------------------------------- */
-const catalog = require("../lyrics/lyrics.json");
 const albumMapRaw = (() => {
 	try {
 		return require("../lyrics/album_map.json");
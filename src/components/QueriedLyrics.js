@@ -4,8 +4,9 @@ import React from "react";
 
 import SongLyric from "./SongLyric";
 import { containsQuery, isMobile, queriesFound } from "./utils";
+import catalog from "./catalog";                        // artist → album → song
+import { candidateLines, songKey } from "./searchIndex";
 
-const catalog   = require("../lyrics/lyrics.json");   // artist → album → song
 const albumMap  = require("../lyrics/album_map.json"); // artist → album → [cats]
 const albumMeta = require("../lyrics/album_meta.json"); // album → {year,img}
 
@@ -36,6 +37,9 @@ export default function QueriedLyrics({
   const nodes = [];
   let key = 0;
 
+  /* only lines the search index says can match (null = check every line) */
+  const candidates = candidateLines(queries);
+
   for (const artistKey in catalog) {
     if (!activeArtists[artistKey]) continue;
 
@@ -46,9 +50,11 @@ export default function QueriedLyrics({
 
       for (const song in catalog[artistKey][album]) {
         const lines = catalog[artistKey][album][song];
+        const wanted = candidates ? candidates.get(songKey(artistKey, album, song)) : null;
+        if (candidates && !wanted) continue;
         let hitSong = false;
 
-        lines.forEach((line) => {
+        (wanted ? wanted.map((i) => lines[i]) : lines).forEach((line) => {
           const hitLine = queries.some(
             (q) => containsQuery(line.lyric, q).start >= 0
           );
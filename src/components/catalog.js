@@ -0,0 +1,58 @@
+// @flow
+/* -----------------------------------------------------------------------
+   Lyrics catalogue: artist → album → song → [{lyric, prev, next, multiplicity}]
+   lyrics.json ships in the compact string-table layout written by
+   lyrics/helpers/combine.py (see lyrics/compact.py), one block per artist
+   with its own string table; it is expanded once here.
+   The old nested layout (combine --pretty) is passed through as is.
+   -------------------------------------------------------------------- */
+
+export type LyricLine = {
+  lyric:        string,
+  prev:         string,
+  next:         string,
+  multiplicity: number,
+};
+
+type Albums = { [album: string]: { [song: string]: Array<LyricLine> } };
+
+const COMPACT_FORMAT = "compact-v1";
+
+/* entry = i | [i, m] | [i, m, prev, next]; short forms take prev/next from the neighbours */
+const expandSong = (entries: Array<any>, strings: Array<string>): Array<LyricLine> => {
+  const lyrics = entries.map((e) => strings[typeof e === "number" ? e : e[0]]);
+  return entries.map((e, k) => {
+    const full = typeof e !== "number" && e.length === 4;
+    return {
+      lyric: lyrics[k],
+      prev: full ? strings[e[2]] : k > 0 ? lyrics[k - 1] : "",
+      next: full ? strings[e[3]] : k + 1 < lyrics.length ? lyrics[k + 1] : "",
+      multiplicity: typeof e === "number" ? 1 : e[1],
+    };
+  });
+};
+
+const expandAlbums = (albums: Object, strings: Array<string>): Albums => {
+  const out = {};
+  for (const album in albums) {
+    out[album] = {};
+    for (const song in albums[album]) {
+      out[album][song] = expandSong(albums[album][song], strings);
+    }
+  }
+  return out;
+};
+
+export const expandCatalog = (data: Object): { [artist: string]: Albums } => {
+  if (data.format !== COMPACT_FORMAT) return data;
+  const out = {};
+  for (const artist in data.artists) {
+    const block = data.artists[artist];
+    out[artist] = expandAlbums(block.albums, block.strings);
+  }
+  return out;
+};
+
+const catalog: { [artist: string]: Albums } = expandCatalog(require("../lyrics/lyrics.json"));
+
+export default catalog;
@@ -0,0 +1,128 @@
+// @flow
+/* -----------------------------------------------------------------------
+   Prebuilt token → lines index (lyrics/search_index.json, written by
+   lyrics/helpers/combine.py). Queries are tokenised the same way the
+   lyrics were, so the lines a query can match come from intersecting
+   postings; containsQuery then only runs on those lines. Each artist has
+   its own block (songs, offsets, tokens, postings), so combine can reuse
+   the block of an artist whose lyrics did not change.
+   -------------------------------------------------------------------- */
+import { cleanLyric } from "./utils";
+
+const index = require("../lyrics/search_index.json");
+
+const SEARCH_INDEX_FORMAT = "search-v2";
+const DELIMITERS = /[()\.\-?!;:,\s\u2026"]+/;
+
+export const songKey = (artist: string, album: string, song: string): string =>
+  `${artist}\u0000${album}\u0000${song}`;
+
+type Block = {
+  songs:    Array<[string, string]>,
+  offsets:  Array<number>,
+  tokens:   Array<string>,
+  postings: Array<Array<number>>,
+};
+
+const usable = index.format === SEARCH_INDEX_FORMAT;
+const blocks: Array<{ block: Block, songKeys: Array<string>, decoded: Map<number, Array<number>> }> =
+  usable
+    ? Object.keys(index.artists).map((artist) => ({
+        block: index.artists[artist],
+        songKeys: index.artists[artist].songs.map(([al, s]) => songKey(artist, al, s)),
+        decoded: new Map(),
+      }))
+    : [];
+
+/* postings are stored as deltas; decode each token once, on first use */
+const postingsAt = (b, t: number): Array<number> => {
+  let ids = b.decoded.get(t);
+  if (!ids) {
+    let id = 0;
+    ids = b.block.postings[t].map((d) => (id += d));
+    b.decoded.set(t, ids);
+  }
+  return ids;
+};
+
+/* first token >= word (tokens are sorted in JS string order) */
+const lowerBound = (tokens: Array<string>, word: string): number => {
+  let lo = 0;
+  let hi = tokens.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (tokens[mid] < word) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+};
+
+/* ids of lines with a token equal to `word` (or starting with it, for a wildcard) */
+const lookup = (b, word: string, prefix: boolean): Set<number> => {
+  const { tokens } = b.block;
+  const lines = new Set();
+  for (let t = lowerBound(tokens, word); t < tokens.length; t++) {
+    const token = tokens[t];
+    if (prefix ? !token.startsWith(word) : token !== word) break;
+    postingsAt(b, t).forEach((id) => lines.add(id));
+  }
+  return lines;
+};
+
+/* the words an index lookup needs for `query` ([word, isPrefix]); empty if it can't narrow it ("*ing") */
+const queryWords = (query: string): Array<[string, boolean]> => {
+  const cleaned = cleanLyric(query.toLowerCase()).replace(/\u00e9/g, "e");
+  const words = [];
+  for (const raw of cleaned.split(DELIMITERS)) {
+    const star = raw.indexOf("*");
+    const word = (star >= 0 ? raw.slice(0, star) : raw).replace(/^'+|'+$/g, "");
+    if (word) words.push([word, star >= 0]);
+  }
+  return words;
+};
+
+/* every line of one artist's block containsQuery could match for the query's words */
+const queryLines = (b, words: Array<[string, boolean]>): Set<number> => {
+  let result: ?Set<number> = null;
+  for (const [word, prefix] of words) {
+    const lines = lookup(b, word, prefix);
+    result = result ? new Set([...result].filter((id) => lines.has(id))) : lines;
+    if (result.size === 0) break;
+  }
+  return result || new Set();
+};
+
+/* index of the song a line id belongs to */
+const songOf = (offsets: Array<number>, id: number): number => {
+  let lo = 0;
+  let hi = offsets.length - 1;
+  while (lo < hi) {
+    const mid = (lo + hi + 1) >> 1;
+    if (offsets[mid] <= id) lo = mid;
+    else hi = mid - 1;
+  }
+  return lo;
+};
+
+/* songKey → ascending line positions any of the queries can match;
+   null means "scan everything" (no usable index, or a query it can't narrow) */
+export const candidateLines = (queries: Array<string>): ?Map<string, Array<number>> => {
+  if (!usable) return null;
+  const wordLists = queries.map(queryWords);
+  if (wordLists.some((words) => words.length === 0)) return null;
+
+  const out: Map<string, Array<number>> = new Map();
+  for (const b of blocks) {
+    const ids: Set<number> = new Set();
+    for (const words of wordLists) queryLines(b, words).forEach((id) => ids.add(id));
+
+    const { offsets } = b.block;
+    [...ids].sort((x, y) => x - y).forEach((id) => {
+      const s = songOf(offsets, id);
+      const positions = out.get(b.songKeys[s]) || [];
+      positions.push(id - offsets[s]);
+      out.set(b.songKeys[s], positions);
+    });
+  }
+  return out;
+};
@@ -0,0 +1,146 @@
+# Where one artist's scrape artefacts live, plus the atomic writer, CSV row reader/filter/index and entry-file reader shared by the helpers that edit them (standard library only, so maintenance commands start instantly).
+
+# Example use:
+# paths = artist_paths("paramore")
+# atomic_write_text(paths["scraped"], json.dumps(data, indent=2))
+
+from __future__ import annotations
+import csv, io, os, tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Callable, Dict, Iterator, List, Optional, Set, TextIO, Tuple
+
+LYRICS_ROOT = Path(__file__).resolve().parent
+
+def artist_paths(artist: str) -> Dict[str, Path]:
+    base = LYRICS_ROOT / artist.lower()
+    return {
+        "songs":  base / "songs.csv",
+        "lyrics": base / "lyrics.csv",
+        "lyrics_json":  base / "lyrics.json",
+        "titles": base / "song_titles.txt",
+        "scraped": base / "scraped_urls.json",
+        "hashes": base / "lyric_hashes.json",
+        "versions": base / "song_versions.json",
+        "db": base / "lyrics.db",
+    }
+
+# Text file handle on a temp file in the same directory, moved over `path` with os.replace
+# only once the block finishes, so readers never see a half-written file
+@contextmanager
+def atomic_writer(path: Path) -> Iterator[TextIO]:
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            yield f
+        # mkstemp creates 0600 files; keep the permissions of the file being replaced
+        os.chmod(tmp, path.stat().st_mode & 0o777 if path.exists() else 0o644)
+        os.replace(tmp, path)
+    except BaseException:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+def atomic_write_text(path: Path, text: str) -> None:
+    with atomic_writer(path) as f:
+        f.write(text)
+
+# The given columns of every row of a CSV artefact, read lazily as plain strings
+# (a missing or empty file has no rows)
+def csv_rows(path: Path, columns: List[str]) -> Iterator[Tuple[str, ...]]:
+    if not (path.exists() and path.stat().st_size > 0):
+        return
+    with path.open(encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        positions = [header.index(column) for column in columns]
+        for row in reader:
+            yield tuple(row[i] for i in positions)
+
+# Rows of a CSV artefact looked up by one column (lyrics.csv by song) without loading them:
+# one pass records the byte range of every run of rows sharing a value, and rows(value)
+# reads back just that range. A value whose rows aren't all in one run is left out, so
+# callers rebuild it instead. No path (or a missing file) is an empty index.
+class CsvRowIndex:
+    def __init__(self, path: Optional[Path], key: str, columns: List[str]) -> None:
+        self._spans: Dict[str, Tuple[int, int]] = {}
+        self._file: Optional[BinaryIO] = None
+        if path is None or not (path.exists() and path.stat().st_size > 0):
+            return
+        self._file = path.open("rb")
+        offset = 0
+
+        # csv.reader pulls physical lines one record at a time, so the byte offset after
+        # the lines it has taken is where the next record starts
+        def lines() -> Iterator[str]:
+            nonlocal offset
+            for raw in self._file:
+                offset += len(raw)
+                yield raw.decode("utf-8")
+
+        reader = csv.reader(lines())
+        header = next(reader, [])
+        self._key = header.index(key)
+        self._positions = [header.index(column) for column in columns]
+        broken: Set[str] = set()
+        run_value, run_start, row_start = None, offset, offset
+        for row in reader:
+            if row[self._key] != run_value:
+                if run_value is not None:
+                    self._add_run(run_value, run_start, row_start, broken)
+                run_value, run_start = row[self._key], row_start
+            row_start = offset
+        if run_value is not None:
+            self._add_run(run_value, run_start, offset, broken)
+
+    def _add_run(self, value: str, start: int, end: int, broken: Set[str]) -> None:
+        if value in broken:
+            return
+        if value in self._spans:
+            del self._spans[value]
+            broken.add(value)
+        else:
+            self._spans[value] = (start, end)
+
+    def __contains__(self, value: str) -> bool:
+        return value in self._spans
+
+    def rows(self, value: str) -> List[Tuple[str, ...]]:
+        start, end = self._spans[value]
+        self._file.seek(start)
+        records = csv.reader(io.StringIO(self._file.read(end - start).decode("utf-8"), newline=""))
+        return [tuple(row[i] for i in self._positions) for row in records]
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+    def __enter__(self) -> "CsvRowIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+# Rewrites a CSV artefact without the rows `drop` matches (untouched when none do)
+# and returns the dropped rows
+def drop_csv_rows(path: Path, drop: Callable[[Dict[str, str]], bool]) -> List[Dict[str, str]]:
+    kept: List[Dict[str, str]] = []
+    dropped: List[Dict[str, str]] = []
+    with path.open(encoding="utf-8", newline="") as f:
+        reader = csv.DictReader(f)
+        for row in reader:
+            (dropped if drop(row) else kept).append(row)
+    if dropped:
+        with atomic_writer(path) as out:
+            writer = csv.DictWriter(out, fieldnames=reader.fieldnames or [], lineterminator="\n")
+            writer.writeheader()
+            writer.writerows(kept)
+    return dropped
+
+# One entry per line; blank lines and "# comments" are skipped
+def read_entries(path: Path) -> List[str]:
+    entries = []
+    for line in path.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if line and not line.startswith("#"):
+            entries.append(line)
+    return entries
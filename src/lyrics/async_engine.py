@@ -0,0 +1,235 @@
+# Async counterparts of the scraper's network calls (tracks pages over httpx, lyrics pages over httpx with Playwright's async API as fallback), bounded by one semaphore so a whole discography can be fetched in parallel.
+
+# Example use:
+# async with AsyncEngine(genius_client(), concurrency=8, headless=True) as engine:
+#     tracks = await engine.album_tracks("/albums/28192")
+#     lyrics = await engine.lyrics(tracks[0]["song"]["url"])
+
+from __future__ import annotations
+import asyncio, httpx
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict, List, Optional
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page, TimeoutError as PlaywrightTimeout
+from lyrics.client import CacheMiss, GeniusClient
+from lyrics.extract import LYRICS_SELECTOR, filter_lyric_lines, parse_lyrics_html
+
+# One browser context + page pair handed out by AsyncBrowserPool
+class _AsyncSlot:
+    def __init__(self, context: BrowserContext, page: Page) -> None:
+        self.context = context
+        self.page = page
+        self.uses = 0
+        self.crashed = False
+        page.on("crash", lambda _page: setattr(self, "crashed", True))
+
+    def usable(self) -> bool:
+        return not self.crashed and not self.page.is_closed()
+
+    async def close(self) -> None:
+        try:
+            await self.context.close()
+        except Exception:
+            pass
+
+# Async mirror of browser.BrowserPool: pages are created on demand and recycled after max_uses or a crash
+class AsyncBrowserPool:
+    def __init__(self, *, headless: bool = False, max_uses: int = 50,
+                 gate: Optional[Any] = None) -> None:
+        self.headless = headless
+        self.max_uses = max_uses
+
+        # Same cross-process browser cap as BrowserPool.gate
+        self.gate = gate
+        self._holds_gate = False
+
+        self._playwright = None
+        self._browser: Optional[Browser] = None
+        self._launch_lock = asyncio.Lock()
+        self._idle: List[_AsyncSlot] = []
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Page]:
+        slot = await self._acquire()
+        try:
+            yield slot.page
+        except Exception:
+            await slot.close()
+            raise
+        slot.uses += 1
+        if not slot.usable() or slot.uses >= self.max_uses:
+            await slot.close()
+        else:
+            self._idle.append(slot)
+
+    async def close(self) -> None:
+        for slot in self._idle:
+            await slot.close()
+        self._idle.clear()
+
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
+
+        if self._holds_gate:
+            self.gate.release()
+            self._holds_gate = False
+
+    async def _ensure_browser(self) -> Browser:
+        async with self._launch_lock:
+            if self._browser is not None and self._browser.is_connected():
+                return self._browser
+
+            if self._browser is not None:
+                print("♻️ Browser disconnected, relaunching")
+                self._idle.clear()
+
+            # Blocking acquire, so off the event loop
+            if self.gate is not None and not self._holds_gate:
+                await asyncio.to_thread(self.gate.acquire)
+                self._holds_gate = True
+
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+
+            self._browser = await self._playwright.chromium.launch(headless=self.headless)
+            return self._browser
+
+    async def _acquire(self) -> _AsyncSlot:
+        browser = await self._ensure_browser()
+        while self._idle:
+            slot = self._idle.pop()
+            if slot.usable():
+                return slot
+            await slot.close()
+
+        context = await browser.new_context()
+        return _AsyncSlot(context, await context.new_page())
+
+class AsyncEngine:
+    # ───────────────────────────── CONSTRUCTION ──────────────────────────── #
+    def __init__(
+        self,
+        client: GeniusClient,
+        *,
+        concurrency: int = 8,
+        headless: bool = False,
+        max_uses: int = 50,
+        http_fast_path: bool = True,
+        browser_gate: Optional[Any] = None,
+    ) -> None:
+        # Rate limit, retries and timeouts come from the shared client
+        self.client = client
+        self.concurrency = max(1, concurrency)
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self.http_fast_path = http_fast_path
+        self._http: Optional[httpx.AsyncClient] = None
+        self.pool = AsyncBrowserPool(headless=headless, max_uses=max_uses, gate=browser_gate)
+
+    async def __aenter__(self) -> "AsyncEngine":
+        self._http = httpx.AsyncClient(
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=self.concurrency,
+                                max_keepalive_connections=self.concurrency),
+        )
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.pool.close()
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    # ───────────────────────────── FETCHERS ──────────────────────────── #
+    # Every track of one album; pages are chained through next_page so they stay sequential per album
+    async def album_tracks(self, album_api_path: str) -> List[Dict]:
+        tracks: List[Dict] = []
+        next_page = 1
+        while next_page is not None:
+            async with self._semaphore:
+                with self.client.metrics.timer("stage_seconds", stage="api_pagination"):
+                    track_data = await self.client.aapi(
+                        self._http, album_api_path + "/tracks", params={"page": next_page})
+            tracks.extend(track_data["response"]["tracks"])
+            next_page = track_data["response"]["next_page"]
+        return tracks
+
+    # Same contract as scraper.fetch_lyrics: server HTML first, browser only when that has no lyrics
+    async def lyrics(self, url: str) -> Optional[str]:
+        if self.http_fast_path or self.client.offline:
+            with self.client.metrics.timer("stage_seconds", stage="lyrics_http"):
+                lyrics = await self.lyrics_http(url)
+            if lyrics is not None:
+                print(f"⚡ Fetched: {url}")
+                return lyrics
+            if self.client.offline:
+                return None
+            print(f"🐢 Falling back to browser: {url}")
+            self.client.metrics.inc("browser_fallbacks")
+        return await self.lyrics_browser(url)
+
+    # Lyrics from the server-rendered page, or None when the container is missing
+    async def lyrics_http(self, url: str) -> Optional[str]:
+        async with self._semaphore:
+            try:
+                # The API token only goes to the API, not to lyrics pages
+                r = await self.client.aget(self._http, url, auth=False)
+            except (httpx.HTTPError, CacheMiss) as e:
+                print(f"⚠️ HTTP fetch failed for {url}: {e}")
+                return None
+        if r.status_code != 200:
+            print(f"⚠️ HTTP {r.status_code} for {url}")
+            return None
+        return parse_lyrics_html(r.text)
+
+    # Same contract as scraper.get_lyrics_from_url: text, "" if no container, None on error
+    async def lyrics_browser(self, url: str, timeout: int = 60000) -> Optional[str]:
+        metrics = self.client.metrics
+        async with self._semaphore:
+            try:
+                async with self.pool.page() as page:
+                    print(f"🌐 Scraping: {url}")
+                    with metrics.timer("stage_seconds", stage="page_navigation"):
+                        await page.goto(url, timeout=timeout)
+
+                    # Accept cookie banners or GDPR popups
+                    try:
+                        consent = await page.query_selector("button:has-text('Accept')")
+                        if consent:
+                            await consent.click()
+                    except Exception:
+                        pass
+
+                    await asyncio.sleep(2)  # let scripts/rendering finish
+
+                    try:
+                        with metrics.timer("stage_seconds", stage="lyrics_wait"):
+                            await page.wait_for_selector(LYRICS_SELECTOR, timeout=10000)
+                    except Exception:
+                        print(f"⚠️ Lyrics container not found: {url}")
+                        metrics.inc("lyrics_container_missing", source="browser")
+                        return ""
+
+                    if self.client.cache is not None:
+                        self.client.cache.put(url, None, 200, await page.content(),
+                                              {"Content-Type": "text/html"})
+
+                    lyrics_elements = await page.locator(LYRICS_SELECTOR).all()
+                    raw_lyrics = "\n".join([(await el.inner_text()).strip()
+                                            for el in lyrics_elements])
+                    return filter_lyric_lines(raw_lyrics)
+
+            except PlaywrightTimeout:
+                print(f"❌ TimeoutError on: {url}")
+                metrics.inc("browser_errors", reason="timeout")
+                return None
+            except Exception as e:
+                print(f"❌ Error while scraping {url}: {e}")
+                metrics.inc("browser_errors", reason="error")
+                return None
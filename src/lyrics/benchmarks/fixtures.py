@@ -0,0 +1,155 @@
+# Genius-shaped fixture corpus rebuilt from what we already scraped (each artist's songs.csv, scraped_urls.json and ALBUMS), so benchmarks and load tests run without the network: album tracks pages, artist album listings, song bodies and lyrics page HTML for every real song.
+# write_response_cache() stores it in the ResponseCache format, which lets an --offline Scraper.run replay a whole scrape from it.
+
+# Example use:
+# corpus = build_corpus(["paramore", "hayley"])
+# write_response_cache(corpus, ResponseCache(tmp / "http", ttl=None), API_ROOT)
+# html = corpus.pages[corpus.songs["/songs/225310001"]["url"]]
+
+from __future__ import annotations
+import csv, html, json, re
+from pathlib import Path
+from typing import Any, Dict, List
+from lyrics.cache import ResponseCache
+from lyrics.orchestrate import load_artist
+
+LYRICS_ROOT = Path(__file__).resolve().parents[1]
+TRACKS_PER_PAGE = 20  # Genius' default page size for /albums/{id}/tracks
+ALBUMS_PER_PAGE = 20  # and for the site API's /artists/{id}/albums
+
+class Corpus:
+    def __init__(self) -> None:
+        self.artists: Dict[str, Dict[str, Any]] = {}  # folder name -> primary_artist body
+        self.albums: Dict[str, Dict[str, Any]] = {}   # "/albums/28192" -> {"name", "artist", "year", "songs": [api paths]}
+        self.songs: Dict[str, Dict[str, Any]] = {}    # "/songs/123" -> song body
+        self.pages: Dict[str, str] = {}               # song url -> lyrics page HTML
+        self.lyrics: Dict[str, str] = {}              # "/songs/123" -> lyrics as stored in songs.csv
+
+    # {api path: album name} for one artist, in the shape Scraper(albums=...) takes
+    def album_map(self, artist: str) -> Dict[str, str]:
+        return {path: a["name"] for path, a in self.albums.items() if a["artist"] == artist}
+
+    def tracks_page(self, album_path: str, page: int, per_page: int = TRACKS_PER_PAGE) -> Dict[str, Any]:
+        songs = self.albums[album_path]["songs"]
+        start = (page - 1) * per_page
+        tracks = [{"number": start + i + 1, "song": self.songs[path]}
+                  for i, path in enumerate(songs[start:start + per_page])]
+        next_page = page + 1 if start + per_page < len(songs) else None
+        return {"meta": {"status": 200}, "response": {"tracks": tracks, "next_page": next_page}}
+
+    # One page of the site API's album listing for an artist (by folder name)
+    def albums_page(self, artist: str, page: int, per_page: int = ALBUMS_PER_PAGE) -> Dict[str, Any]:
+        albums = [_album_body(path, a, self.artists[artist])
+                  for path, a in self.albums.items() if a["artist"] == artist]
+        start = (page - 1) * per_page
+        next_page = page + 1 if start + per_page < len(albums) else None
+        return {"meta": {"status": 200},
+                "response": {"albums": albums[start:start + per_page], "next_page": next_page}}
+
+# ───────────────────────────── BUILDING ──────────────────────────── #
+def build_corpus(artists: List[str], root: Path = LYRICS_ROOT) -> Corpus:
+    corpus = Corpus()
+    years = _album_years(root / "album_meta.json")
+    for artist in artists:
+        path = root / artist / "songs.csv"
+        if not path.exists():
+            print(f"⚠️ No songs.csv for {artist}")
+            continue
+        module = load_artist(artist)
+        artist_id = module.ARTIST_ID if module else 1000 + len(corpus.artists)
+        album_paths = {name: p for p, name in (module.ALBUMS if module else {}).items()}
+        urls = _scraped_urls(root / artist / "scraped_urls.json")
+
+        primary = corpus.artists[artist] = _artist_body(artist_id, artist)
+        # Albums the artist module lists keep their order, even those with no songs left
+        for album, album_path in album_paths.items():
+            corpus.albums.setdefault(album_path, {"name": album, "artist": artist,
+                                                  "year": years.get(album), "songs": []})
+        with path.open(encoding="utf-8", newline="") as f:
+            for n, row in enumerate(csv.DictReader(f), 1):
+                title, album, lyrics = row["Title"], row["Album"], row["Lyrics"]
+                album_path = album_paths.get(album) or f"/albums/{artist_id}{len(corpus.albums):03d}"
+                album_paths[album] = album_path
+                entry = corpus.albums.setdefault(album_path, {"name": album, "artist": artist,
+                                                              "year": years.get(album), "songs": []})
+
+                song_id = int(f"{artist_id}{n:04d}")
+                slug = _slug(title)
+                url = (next((u for u in urls if u.lower().endswith(f"-{slug}-lyrics")), None)
+                       or f"https://genius.com/{_slug(artist).capitalize()}-{slug}-lyrics")
+                body = _song_body(song_id, title, url, primary)
+                corpus.songs[body["api_path"]] = body
+                corpus.lyrics[body["api_path"]] = lyrics
+                corpus.pages[url] = lyrics_page(title, lyrics)
+                entry["songs"].append(body["api_path"])
+    return corpus
+
+# A server-rendered lyrics page the way Genius lays it out: header lines inside the first
+# container, curly quotes and em dashes, and the embed counter glued to the last line
+def lyrics_page(title: str, lyrics: str) -> str:
+    fancy = lyrics.replace("'", "’").replace(" - ", "—")
+    body = "<br>".join(html.escape(line, quote=False) for line in fancy.split("\n"))
+    return ("<!DOCTYPE html><html><head><title>" + html.escape(title) + " Lyrics | Genius Lyrics</title></head><body>"
+            '<div id="lyrics-root"><div data-lyrics-container="true">'
+            f"<div>12 Contributors</div><div>{html.escape(title.replace(chr(39), '’'))} Lyrics</div>"
+            f"{body}27Embed</div></div></body></html>")
+
+# Every fixture response as a cache entry: API responses under api_root, pages under their URL
+def write_response_cache(corpus: Corpus, cache: ResponseCache, api_root: str) -> int:
+    written = 0
+    for album_path, album in corpus.albums.items():
+        pages = max(1, -(-len(album["songs"]) // TRACKS_PER_PAGE))
+        for page in range(1, pages + 1):
+            cache.put(f"{api_root}{album_path}/tracks", {"page": page}, 200,
+                      json.dumps(corpus.tracks_page(album_path, page)),
+                      {"Content-Type": "application/json"})
+            written += 1
+    for api_path, body in corpus.songs.items():
+        cache.put(f"{api_root}{api_path}", None, 200,
+                  json.dumps({"meta": {"status": 200}, "response": {"song": body}}),
+                  {"Content-Type": "application/json"})
+        cache.put(body["url"], None, 200, corpus.pages[body["url"]],
+                  {"Content-Type": "text/html; charset=utf-8"})
+        written += 2
+    return written
+
+# ───────────────────────────── HELPERS ────────────────────────── #
+def _slug(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", text.lower().replace("'", "")).strip("-")
+
+# Real song URLs we scraped (the title is matched against the end of their slug)
+def _scraped_urls(path: Path) -> List[str]:
+    try:
+        return list(json.loads(path.read_text() or "{}"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        return []
+
+def _album_years(path: Path) -> Dict[str, int]:
+    try:
+        return {name: meta.get("year") for name, meta in json.loads(path.read_text()).items()}
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def _artist_body(artist_id: int, name: str) -> Dict[str, Any]:
+    return {"id": artist_id, "api_path": f"/artists/{artist_id}", "name": name.capitalize(),
+            "url": f"https://genius.com/artists/{name.capitalize()}", "header_image_url": "",
+            "image_url": "", "is_meme_verified": False, "is_verified": True}
+
+def _album_body(album_path: str, album: Dict[str, Any], artist: Dict[str, Any]) -> Dict[str, Any]:
+    album_id = int(album_path.rsplit("/", 1)[1])
+    year = album["year"]
+    return {"id": album_id, "api_path": album_path, "name": album["name"],
+            "full_title": f"{album['name']} by {artist['name']}",
+            "name_with_artist": f"{album['name']} (artist: {artist['name']})",
+            "url": f"https://genius.com/albums/{artist['name']}/{_slug(album['name']).capitalize()}",
+            "cover_art_thumbnail_url": "", "cover_art_url": "", "artist": artist,
+            "release_date_components": {"year": year, "month": None, "day": None} if year else None}
+
+def _song_body(song_id: int, title: str, url: str, artist: Dict[str, Any]) -> Dict[str, Any]:
+    return {"id": song_id, "api_path": f"/songs/{song_id}", "title": title,
+            "title_with_featured": title, "full_title": f"{title} by {artist['name']}",
+            "url": url, "path": url.replace("https://genius.com", ""),
+            "primary_artist": artist, "stats": {"unreviewed_annotations": 0, "hot": False},
+            "annotation_count": 0, "header_image_thumbnail_url": "", "header_image_url": "",
+            "lyrics_owner_id": 1, "lyrics_state": "complete", "pyongs_count": 0,
+            "song_art_image_thumbnail_url": "", "song_art_image_url": ""}
@@ -0,0 +1,249 @@
+# Local stand-in for the Genius API and lyrics pages, serving the fixture corpus (benchmarks/fixtures.py) with configurable latency, server errors and 429s, so concurrency, retries and rate limiting can be load-tested against something that is not Genius.
+# Faults are drawn from a hash of (seed, path, n-th request for that path), so a given seed fails the same requests however the client interleaves them.
+# Every 200 carries an ETag of its body and If-None-Match is honoured with a 304, like Genius' CDN, so --refresh can be exercised too.
+
+# Routes: /albums/{id}/tracks?page=, /songs/{id}, /search?q=, /artists/{id}/songs?page=&per_page=,
+# the site API's /artists/{id}/albums?page= (so WEB_API_ROOT can point here too),
+# every song's lyrics page path, and /__stats (request counts by route and status).
+
+# Example use from CLI:
+# python -m lyrics.benchmarks.genius_server --port 8765 --latency 0.05 --error-rate 0.02 --throttle-rate 0.05
+# API_ROOT=http://127.0.0.1:8765 python -m lyrics.paramore.paramore --no-cache --headless
+
+# Example use from code:
+# server = start_server(build_corpus(["paramore"]), ServerOptions(latency=0.02))
+# ... GeniusClient(api_root=server.url) ...
+# server.shutdown()
+
+from __future__ import annotations
+import argparse, hashlib, json, re, threading, time
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+from lyrics.benchmarks.fixtures import Corpus, build_corpus
+
+class ServerOptions:
+    def __init__(
+        self,
+        *,
+        latency: float = 0.0,        # seconds added to every response
+        jitter: float = 0.0,         # up to this much more, drawn per request
+        error_rate: float = 0.0,     # share of requests answered 500/502/503
+        throttle_rate: float = 0.0,  # share of requests answered 429
+        retry_after: float = 1.0,    # Retry-After sent with every 429
+        max_rps: float = 0.0,        # server-side rate limit (429 above it); 0 = none
+        seed: int = 0,
+    ) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.max_rps = max_rps
+        self.seed = seed
+
+class GeniusStandIn(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], corpus: Corpus, options: ServerOptions) -> None:
+        super().__init__(address, _Handler)
+        self.corpus = corpus
+        self.options = options
+        self.stats: Counter = Counter()
+        self._seen: Counter = Counter()
+        self._lock = threading.Lock()
+        self._tokens = float(max(1.0, options.max_rps))
+        self._updated = time.monotonic()
+
+        # Lyrics page path -> song; artist id -> songs in catalogue order
+        self.pages = {urlsplit(body["url"]).path: body for body in corpus.songs.values()}
+        self.artist_songs: Dict[int, List[Dict[str, Any]]] = {}
+        for body in corpus.songs.values():
+            self.artist_songs.setdefault(body["primary_artist"]["id"], []).append(body)
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    # The n-th request for `path` gets the same draw in [0, 1) every time for a given seed
+    def draw(self, path: str, salt: str) -> float:
+        with self._lock:
+            self._seen[path, salt] += 1
+            n = self._seen[path, salt]
+        digest = hashlib.blake2b(f"{self.options.seed}:{salt}:{path}:{n}".encode(), digest_size=8)
+        return int.from_bytes(digest.digest(), "big") / 2**64
+
+    # Server-side token bucket: False means "answer 429"
+    def admit(self) -> bool:
+        if self.options.max_rps <= 0:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(max(1.0, self.options.max_rps),
+                               self._tokens + (now - self._updated) * self.options.max_rps)
+            self._updated = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def count(self, route: str, status: int) -> None:
+        with self._lock:
+            self.stats[f"{route} {status}"] += 1
+
+def start_server(corpus: Corpus, options: Optional[ServerOptions] = None,
+                 host: str = "127.0.0.1", port: int = 0) -> GeniusStandIn:
+    server = GeniusStandIn((host, port), corpus, options or ServerOptions())
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+# ───────────────────────────── REQUESTS ──────────────────────────── #
+_ALBUM_TRACKS_RE = re.compile(r"^/albums/(\d+)/tracks$")
+_SONG_RE = re.compile(r"^/songs/(\d+)$")
+_ARTIST_SONGS_RE = re.compile(r"^/artists/(\d+)/songs$")
+_ARTIST_ALBUMS_RE = re.compile(r"^/artists/(\d+)/albums$")
+
+class _Handler(BaseHTTPRequestHandler):
+    server: GeniusStandIn
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real thing
+    disable_nagle_algorithm = True  # headers and body go out in separate writes
+
+    def log_message(self, *args) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        parts = urlsplit(self.path)
+        query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+        route, status, body, content_type = self._route(parts.path, query)
+        opts = self.server.options
+
+        # /__stats is for the load tester, so it skips latency and faults
+        if route != "stats":
+            delay = opts.latency + opts.jitter * self.server.draw(self.path, "jitter")
+            if delay:
+                time.sleep(delay)
+
+        headers = {}
+        if status < 400 and route != "stats":
+            if not self.server.admit() or self.server.draw(self.path, "429") < opts.throttle_rate:
+                status, body, content_type = 429, b'{"meta":{"status":429}}', "application/json"
+                headers["Retry-After"] = f"{opts.retry_after:g}"
+            else:
+                roll = self.server.draw(self.path, "5xx")
+                if roll < opts.error_rate:
+                    status = (500, 502, 503)[int(roll / opts.error_rate * 3) % 3]
+                    body, content_type = b"<html><body>Oops</body></html>", "text/html"
+
+        if status == 200 and route != "stats":
+            headers["ETag"] = '"' + hashlib.blake2b(body, digest_size=8).hexdigest() + '"'
+            if self.headers.get("If-None-Match") == headers["ETag"]:
+                status, body = 304, b""
+
+        self.server.count(route, status)
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    # (route label, status, body, content type) for a path; URLs point back at this server
+    def _route(self, path: str, query: Dict[str, str]) -> Tuple[str, int, bytes, str]:
+        corpus, server = self.server.corpus, self.server
+        base = f"http://{self.headers.get('Host') or server.url.split('//')[1]}"
+
+        if path == "/__stats":
+            return "stats", 200, json.dumps(dict(server.stats)).encode(), "application/json"
+
+        match = _ALBUM_TRACKS_RE.match(path)
+        if match:
+            album_path = f"/albums/{match.group(1)}"
+            if album_path not in corpus.albums:
+                return "tracks", 404, _not_found(), "application/json"
+            data = corpus.tracks_page(album_path, max(1, int(query.get("page", 1))))
+            for track in data["response"]["tracks"]:
+                track["song"] = _localize(track["song"], base)
+            return "tracks", 200, json.dumps(data).encode(), "application/json"
+
+        match = _SONG_RE.match(path)
+        if match:
+            body = corpus.songs.get(path)
+            if body is None:
+                return "song", 404, _not_found(), "application/json"
+            data = {"meta": {"status": 200}, "response": {"song": _localize(body, base)}}
+            return "song", 200, json.dumps(data).encode(), "application/json"
+
+        if path == "/search":
+            q = query.get("q", "").lower()
+            hits = [{"type": "song", "result": _localize(body, base)}
+                    for body in corpus.songs.values()
+                    if q and (q in body["title"].lower() or q in body["primary_artist"]["name"].lower())]
+            data = {"meta": {"status": 200}, "response": {"hits": hits[:10]}}
+            return "search", 200, json.dumps(data).encode(), "application/json"
+
+        match = _ARTIST_SONGS_RE.match(path)
+        if match:
+            songs = server.artist_songs.get(int(match.group(1)), [])
+            if query.get("sort") == "title":
+                songs = sorted(songs, key=lambda s: s["title"].lower())
+            per_page = min(50, max(1, int(query.get("per_page", 20))))
+            page = max(1, int(query.get("page", 1)))
+            chunk = songs[(page - 1) * per_page:page * per_page]
+            next_page = page + 1 if page * per_page < len(songs) else None
+            data = {"meta": {"status": 200},
+                    "response": {"songs": [_localize(s, base) for s in chunk], "next_page": next_page}}
+            return "artist_songs", 200, json.dumps(data).encode(), "application/json"
+
+        match = _ARTIST_ALBUMS_RE.match(path)
+        if match:
+            artist = next((name for name, body in corpus.artists.items()
+                           if body["id"] == int(match.group(1))), None)
+            if artist is None:
+                return "artist_albums", 404, _not_found(), "application/json"
+            data = corpus.albums_page(artist, max(1, int(query.get("page", 1))))
+            return "artist_albums", 200, json.dumps(data).encode(), "application/json"
+
+        song = server.pages.get(path)
+        if song is not None:
+            return "page", 200, corpus.pages[song["url"]].encode(), "text/html; charset=utf-8"
+        return "unknown", 404, _not_found(), "application/json"
+
+def _localize(body: Dict[str, Any], base: str) -> Dict[str, Any]:
+    return {**body, "url": base + urlsplit(body["url"]).path}
+
+def _not_found() -> bytes:
+    return b'{"meta":{"status":404,"message":"Not found"}}'
+
+def parse_cli():
+    ap = argparse.ArgumentParser(description="Serve the fixture corpus as a local Genius stand-in.")
+    ap.add_argument("--artists", nargs="+", default=["paramore", "hayley"])
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--latency", type=float, default=0.0, help="Seconds added to every response")
+    ap.add_argument("--jitter", type=float, default=0.0, help="Up to this many extra seconds per response")
+    ap.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered 500/502/503")
+    ap.add_argument("--throttle-rate", type=float, default=0.0, help="Share of requests answered 429")
+    ap.add_argument("--retry-after", type=float, default=1.0, help="Retry-After seconds sent with 429s")
+    ap.add_argument("--max-rps", type=float, default=0.0, help="Answer 429 above this many requests per second")
+    ap.add_argument("--seed", type=int, default=0)
+    return ap.parse_args()
+
+if __name__ == "__main__":
+    cli = parse_cli()
+    corpus = build_corpus(cli.artists)
+    options = ServerOptions(latency=cli.latency, jitter=cli.jitter, error_rate=cli.error_rate,
+                            throttle_rate=cli.throttle_rate, retry_after=cli.retry_after,
+                            max_rps=cli.max_rps, seed=cli.seed)
+    server = GeniusStandIn((cli.host, cli.port), corpus, options)
+    print(f"🎭 Genius stand-in with {len(corpus.songs)} songs on {server.url}  "
+          f"(API_ROOT={server.url}; albums: {', '.join(corpus.albums)})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        print(json.dumps(dict(server.stats), indent=2))
@@ -0,0 +1,87 @@
+# Load test of a real Scraper run against the local Genius stand-in (benchmarks/genius_server.py): for each concurrency level, scrapes every fixture album with the response cache off, then reports wall time, requests, retries and 429s from the run's metrics and checks songs.csv still matches what we scraped from Genius.
+
+# Example use from CLI:
+# python -m lyrics.benchmarks.loadtest --concurrency 1 4 8 --latency 0.05
+# python -m lyrics.benchmarks.loadtest --concurrency 8 --error-rate 0.05 --throttle-rate 0.05 --retry-after 0.1 --backoff 0.05
+# python -m lyrics.benchmarks.loadtest --concurrency 16 --latency 0.02 --max-rps 20 --rate 15
+
+from __future__ import annotations
+import argparse, contextlib, csv, io, sys, tempfile, time
+from pathlib import Path
+from typing import Any, Dict
+from lyrics.benchmarks.fixtures import LYRICS_ROOT, build_corpus
+from lyrics.benchmarks.genius_server import ServerOptions, start_server
+from lyrics.client import GeniusClient
+from lyrics.scraper import Scraper
+
+def parse_cli():
+    ap = argparse.ArgumentParser(description="Load-test the scraper against the local Genius stand-in.")
+    ap.add_argument("--artists", nargs="+", default=["paramore", "hayley"])
+    ap.add_argument("--concurrency", nargs="+", type=int, default=[1, 4, 8])
+    # server side
+    ap.add_argument("--latency", type=float, default=0.02)
+    ap.add_argument("--jitter", type=float, default=0.0)
+    ap.add_argument("--error-rate", type=float, default=0.0)
+    ap.add_argument("--throttle-rate", type=float, default=0.0)
+    ap.add_argument("--retry-after", type=float, default=0.1)
+    ap.add_argument("--max-rps", type=float, default=0.0)
+    ap.add_argument("--seed", type=int, default=0)
+    # client side
+    ap.add_argument("--rate", type=float, default=0.0, help="Client rate limit in requests/s (0 = none)")
+    ap.add_argument("--burst", type=int, default=10)
+    ap.add_argument("--retries", type=int, default=4)
+    ap.add_argument("--backoff", type=float, default=0.05)
+    return ap.parse_args()
+
+def songs_of(path: Path) -> set:
+    if not path.exists():
+        return set()
+    with path.open(encoding="utf-8", newline="") as f:
+        return {(r["Title"], r["Album"], r["Lyrics"]) for r in csv.DictReader(f)}
+
+def run_level(cli: argparse.Namespace, corpus, concurrency: int, tmp: Path) -> Dict[str, Any]:
+    server = start_server(corpus, ServerOptions(
+        latency=cli.latency, jitter=cli.jitter, error_rate=cli.error_rate,
+        throttle_rate=cli.throttle_rate, retry_after=cli.retry_after,
+        max_rps=cli.max_rps, seed=cli.seed))
+    totals = {"seconds": 0.0, "requests": 0, "retries": 0, "throttled": 0, "songs": 0, "matching": True}
+    try:
+        for artist in cli.artists:
+            base = tmp / f"{artist}-{concurrency}"
+            scraper = Scraper(artist_id=0, albums=corpus.album_map(artist), base_path=base,
+                              concurrency=concurrency, headless=True)
+            scraper.client = GeniusClient(api_root=server.url, rate=cli.rate, burst=cli.burst,
+                                          retries=cli.retries, backoff=cli.backoff, cache=None)
+            start = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                scraper.run()
+            totals["seconds"] += time.perf_counter() - start
+
+            counters = scraper.metrics.report()["counters"]
+            totals["requests"] += sum(v for k, v in counters.items() if k.startswith("http_requests{"))
+            totals["retries"] += sum(v for k, v in counters.items() if k.startswith("http_retries{"))
+            totals["throttled"] += sum(v for k, v in counters.items()
+                                       if k.startswith("http_requests{") and "status=429" in k)
+            got = songs_of(scraper.csv_path)
+            totals["songs"] += len(got)
+            totals["matching"] &= got == songs_of(LYRICS_ROOT / artist / "songs.csv")
+    finally:
+        server.shutdown()
+        server.server_close()
+    return totals
+
+if __name__ == "__main__":
+    cli = parse_cli()
+    corpus = build_corpus(cli.artists)
+    if not corpus.songs:
+        sys.exit("❌ No songs to load-test with")
+    print(f"🎭 {len(corpus.songs)} songs on {len(corpus.albums)} albums; latency {cli.latency:g}s, "
+          f"errors {cli.error_rate:.0%}, 429s {cli.throttle_rate:.0%}"
+          + (f", server limit {cli.max_rps:g} req/s" if cli.max_rps else ""))
+    print(f"  {'concurrency':>11} {'seconds':>9} {'songs/s':>9} {'requests':>9} {'retries':>8} {'429s':>6}  output")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for level in cli.concurrency:
+            r = run_level(cli, corpus, level, Path(tmp))
+            print(f"  {level:>11} {r['seconds']:9.2f} {r['songs'] / r['seconds']:9.1f} {r['requests']:>9}"
+                  f" {r['retries']:>8} {r['throttled']:>6}  {'✅ identical' if r['matching'] else '❌ differs'}")
@@ -0,0 +1,106 @@
+# Micro-benchmark for lyrics.normalize against the re.sub chain it replaced: checks both give byte-identical output on every song we have, then times them.
+
+# Example use from CLI:
+# python -m lyrics.benchmarks.normalize --artists paramore hayley --repeat 20
+
+from __future__ import annotations
+import argparse, csv, re, sys, timeit
+from pathlib import Path
+from typing import List, Tuple
+from lyrics import normalize
+
+LYRICS_ROOT = Path(__file__).resolve().parents[1]
+
+# ─────────────────────── PREVIOUS IMPLEMENTATION ───────────────────────── #
+def legacy_clean_string(string: str) -> str:
+    string = re.sub(r"\u2018|\u2019", "'", string)
+    string = re.sub(r"\u201C|\u201D", '"', string)
+    string = re.sub(r"\u200b", "", string)
+    string = re.sub(
+        r"[\u00A0\u1680\u180e\u2000-\u2009\u200a\u202f\u205f\u3000\u200e]",
+        " ",
+        string,
+    )
+    string = re.sub(r"\u0435", "e", string)
+    string = re.sub(r"\u2013|\u2014", " - ", string)
+    return string.strip(" ")
+
+def legacy_clean_lyrics(lyrics: str) -> str:
+    lines = lyrics.split("\n")
+    cleaned_lines: List[str] = []
+    started = False
+
+    for line in lines:
+        line = line.strip()
+        if not started:
+            if re.search(r"\bLyrics\b", line):
+                started = True
+                continue
+        if started:
+            cleaned_lines.append(line)
+
+    lyrics = "\n".join(cleaned_lines)
+    lyrics = legacy_clean_string(lyrics)
+
+    lyrics = re.sub(r"[0-9]*URLCopyEmbedCopy", "", lyrics)
+    lyrics = re.sub(r"[0-9]*Embed", "", lyrics)
+    lyrics = re.sub(r"[0-9]*EmbedShare", "", lyrics)
+    lyrics = re.sub(
+        r"See [\w\s]* LiveGet tickets as low as \$\d*You might also like",
+        "\n",
+        lyrics,
+    )
+    return lyrics
+
+# ───────────────────────────── CORPUS ──────────────────────────── #
+# Turns stored (already clean) songs back into something shaped like a fresh
+# Genius scrape: contributor/header lines, curly quotes, dashes, embed counter
+def load_corpus(artists: List[str]) -> Tuple[List[str], List[str]]:
+    titles, raw_lyrics = [], []
+    for artist in artists:
+        path = LYRICS_ROOT / artist / "songs.csv"
+        if not path.exists():
+            print(f"⚠️ No songs.csv for {artist}")
+            continue
+        with path.open(encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                title, lyrics = row["Title"], row["Lyrics"]
+                fancy = (lyrics.replace("'", "’")
+                               .replace(" - ", " — ")
+                               .replace("\n", " \n"))
+                titles.append(title.replace("'", "’"))
+                raw_lyrics.append(f"12 Contributors\n{title} Lyrics\n{fancy}\n27Embed")
+    return titles, raw_lyrics
+
+def parse_cli():
+    ap = argparse.ArgumentParser(description="Benchmark lyrics.normalize.")
+    ap.add_argument("--artists", nargs="+", default=["paramore", "hayley"])
+    ap.add_argument("--repeat", type=int, default=10)
+    return ap.parse_args()
+
+def bench(label: str, fn, items: List[str], repeat: int) -> float:
+    best = min(timeit.repeat(lambda: [fn(x) for x in items], number=1, repeat=repeat))
+    print(f"  {label:<28} {best * 1000:8.2f} ms  ({len(items) / best:,.0f} items/s)")
+    return best
+
+if __name__ == "__main__":
+    cli = parse_cli()
+    titles, raw_lyrics = load_corpus(cli.artists)
+    if not raw_lyrics:
+        sys.exit("❌ No songs to benchmark")
+
+    mismatches = sum(normalize.clean_lyrics(x) != legacy_clean_lyrics(x) for x in raw_lyrics)
+    mismatches += sum(normalize.clean_title(t) != legacy_clean_string(t) for t in titles)
+    if mismatches:
+        sys.exit(f"❌ {mismatches} outputs differ from the previous implementation")
+    print(f"✅ Identical output for {len(raw_lyrics)} songs and titles")
+
+    print("clean_lyrics")
+    old = bench("re.sub chain", legacy_clean_lyrics, raw_lyrics, cli.repeat)
+    new = bench("char map + compiled regex", normalize.clean_lyrics, raw_lyrics, cli.repeat)
+    print(f"  speedup: {old / new:.1f}x")
+
+    print("clean_title")
+    old = bench("re.sub chain", legacy_clean_string, titles, cli.repeat)
+    new = bench("char map", normalize.clean_title, titles, cli.repeat)
+    print(f"  speedup: {old / new:.1f}x")
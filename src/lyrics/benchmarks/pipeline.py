@@ -0,0 +1,154 @@
+# Offline benchmark of the scraper's Python hot paths on the fixture corpus (benchmarks/fixtures.py): lyrics extraction, clean_lyrics, _get_lyric_list, _songs_to_lyrics, _lyrics_to_json, combine.merge and a whole Scraper.run replayed from the response cache. Reports best time, throughput and peak traced memory per stage.
+# --json saves the numbers; --baseline compares against a saved run, so every performance change can be checked against the last one.
+
+# Example use from CLI:
+# python -m lyrics.benchmarks.pipeline
+# python -m lyrics.benchmarks.pipeline --repeat 10 --json /tmp/before.json
+# python -m lyrics.benchmarks.pipeline --only clean_lyrics scraper_run --baseline /tmp/before.json
+
+from __future__ import annotations
+import argparse, contextlib, io, json, platform, shutil, sys, tempfile, time, tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from lyrics.benchmarks.fixtures import LYRICS_ROOT, Corpus, build_corpus, write_response_cache
+from lyrics.cache import ResponseCache
+from lyrics.client import GeniusClient
+from lyrics.config import API_ROOT
+from lyrics.extract import parse_lyrics_html
+from lyrics.helpers.combine import merge
+from lyrics.scraper import Scraper
+
+BENCHMARKS = ["extract", "clean_lyrics", "get_lyric_list", "songs_to_lyrics",
+              "lyrics_to_json", "combine_merge", "scraper_run"]
+
+def parse_cli():
+    ap = argparse.ArgumentParser(description="Benchmark the scraper pipeline offline.")
+    ap.add_argument("--artists", nargs="+", default=["paramore", "hayley"])
+    ap.add_argument("--repeat", type=int, default=5, help="Timed runs per benchmark (best one counts)")
+    ap.add_argument("--only", nargs="+", choices=BENCHMARKS, help="Run just these benchmarks")
+    ap.add_argument("--concurrency", type=int, default=1, help="Scraper concurrency for scraper_run")
+    ap.add_argument("--json", type=Path, help="Write the results here")
+    ap.add_argument("--baseline", type=Path, help="Results of an earlier --json run to compare with")
+    return ap.parse_args()
+
+# ───────────────────────────── MEASURING ──────────────────────────── #
+# Best of `repeat` timed runs (setup excluded, output swallowed), then one traced run for peak memory
+def measure(setup: Callable[[], Any], fn: Callable[[Any], Any], items: int,
+            repeat: int) -> Dict[str, float]:
+    times = []
+    for _ in range(repeat):
+        state = setup()
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            fn(state)
+            times.append(time.perf_counter() - start)
+
+    state = setup()
+    tracemalloc.start()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            fn(state)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    best = min(times)
+    return {"items": items, "best_seconds": best, "mean_seconds": sum(times) / len(times),
+            "items_per_second": items / best if best else 0.0, "peak_bytes": peak}
+
+# A scratch artist folder holding copies of the given artefacts
+def workspace(tmp: Path, artist: str, files: List[str]) -> Path:
+    base = Path(tempfile.mkdtemp(dir=tmp))
+    for name in files:
+        shutil.copy(LYRICS_ROOT / artist / name, base / name)
+    return base
+
+def scraper_for(base: Path, **kwargs: Any) -> Scraper:
+    return Scraper(artist_id=0, albums=kwargs.pop("albums", {}), base_path=base, **kwargs)
+
+# ───────────────────────────── BENCHMARKS ──────────────────────────── #
+def run_benchmarks(corpus: Corpus, artists: List[str], only: List[str], repeat: int,
+                   concurrency: int, tmp: Path) -> Dict[str, Dict[str, float]]:
+    pages = list(corpus.pages.values())
+    raw = [parse_lyrics_html(page) for page in pages]
+    cleaned = [Scraper.clean_lyrics(text) for text in raw]
+    songs = len(corpus.songs)
+    results: Dict[str, Dict[str, float]] = {}
+
+    if "extract" in only:
+        results["extract"] = measure(lambda: pages, lambda p: [parse_lyrics_html(x) for x in p],
+                                     songs, repeat)
+    if "clean_lyrics" in only:
+        results["clean_lyrics"] = measure(lambda: raw, lambda r: [Scraper.clean_lyrics(x) for x in r],
+                                          songs, repeat)
+    if "get_lyric_list" in only:
+        scraper = scraper_for(tmp)
+        results["get_lyric_list"] = measure(lambda: cleaned,
+                                            lambda c: [scraper._get_lyric_list(x) for x in c],
+                                            songs, repeat)
+
+    # The artefact stages run per artist in a fresh folder each time (no lyric_hashes.json,
+    # so every song is rebuilt), the way a first scrape would
+    if "songs_to_lyrics" in only:
+        results["songs_to_lyrics"] = measure(
+            lambda: [scraper_for(workspace(tmp, a, ["songs.csv"])) for a in artists],
+            lambda scrapers: [s._songs_to_lyrics() for s in scrapers], songs, repeat)
+    if "lyrics_to_json" in only:
+        results["lyrics_to_json"] = measure(
+            lambda: [scraper_for(workspace(tmp, a, ["songs.csv", "lyrics.csv"])) for a in artists],
+            lambda scrapers: [s._lyrics_to_json() for s in scrapers], songs, repeat)
+    if "combine_merge" in only:
+        results["combine_merge"] = measure(lambda: artists, merge, songs, repeat)
+
+    # Whole scrape of every fixture album from the response cache (offline, so nothing
+    # can reach Genius or open a browser)
+    if "scraper_run" in only:
+        cache_dir = tmp / "http"
+        write_response_cache(corpus, ResponseCache(cache_dir, ttl=None), API_ROOT)
+
+        def setup() -> List[Scraper]:
+            scrapers = []
+            for artist in artists:
+                s = scraper_for(workspace(tmp, artist, []), albums=corpus.album_map(artist),
+                                concurrency=concurrency)
+                s.client = GeniusClient(api_root=API_ROOT, rate=0, offline=True,
+                                        cache=ResponseCache(cache_dir, ttl=None))
+                scrapers.append(s)
+            return scrapers
+
+        results["scraper_run"] = measure(setup, lambda scrapers: [s.run() for s in scrapers],
+                                         songs, repeat)
+    return results
+
+def print_results(results: Dict[str, Dict[str, float]],
+                  baseline: Optional[Dict[str, Dict[str, float]]]) -> None:
+    print(f"  {'benchmark':<18} {'best ms':>10} {'songs/s':>12} {'peak MiB':>10}"
+          + (f" {'vs baseline':>12}" if baseline else ""))
+    for name, r in results.items():
+        line = (f"  {name:<18} {r['best_seconds'] * 1000:10.2f} {r['items_per_second']:12,.0f}"
+                f" {r['peak_bytes'] / 2**20:10.2f}")
+        if baseline and name in baseline:
+            change = r["best_seconds"] / baseline[name]["best_seconds"] - 1
+            line += f" {change:+11.1%}"
+        print(line)
+
+if __name__ == "__main__":
+    cli = parse_cli()
+    only = cli.only or BENCHMARKS
+    corpus = build_corpus(cli.artists)
+    if not corpus.songs:
+        sys.exit("❌ No songs to benchmark")
+    print(f"✅ Fixture corpus: {len(corpus.songs)} songs on {len(corpus.albums)} albums "
+          f"({', '.join(cli.artists)})")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = run_benchmarks(corpus, cli.artists, only, cli.repeat, cli.concurrency, Path(tmp))
+
+    baseline = json.loads(cli.baseline.read_text())["results"] if cli.baseline else None
+    print_results(results, baseline)
+    if cli.json:
+        cli.json.write_text(json.dumps({
+            "python": platform.python_version(), "artists": cli.artists,
+            "repeat": cli.repeat, "concurrency": cli.concurrency, "results": results,
+        }, indent=2))
+        print(f"💾 Results → {cli.json}")
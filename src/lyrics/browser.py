@@ -0,0 +1,125 @@
+# Long-lived Playwright browser shared by every lyric fetch in a run, so Chromium starts once per run instead of once per song.
+
+# Example use:
+# with BrowserPool(headless=True) as pool:
+#     with pool.page() as page:
+#         page.goto(url)
+
+from __future__ import annotations
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Iterator, List, Optional
+
+# Playwright is only imported once a browser is actually launched
+if TYPE_CHECKING:
+    from playwright.sync_api import Browser, BrowserContext, Page
+
+# One browser context + page pair handed out by the pool
+class _Slot:
+    def __init__(self, context: BrowserContext, page: Page) -> None:
+        self.context = context
+        self.page = page
+        self.uses = 0
+        self.crashed = False
+        page.on("crash", lambda _page: setattr(self, "crashed", True))
+
+    def usable(self) -> bool:
+        return not self.crashed and not self.page.is_closed()
+
+    def close(self) -> None:
+        try:
+            self.context.close()
+        except Exception:
+            pass
+
+class BrowserPool:
+    # ───────────────────────────── CONSTRUCTION ──────────────────────────── #
+    def __init__(self, *, headless: bool = False, max_uses: int = 50,
+                 gate: Optional[Any] = None) -> None:
+        self.headless = headless
+        self.max_uses = max_uses
+
+        # Semaphore shared with other processes (lyrics/orchestrate.py): one permit is held
+        # from the first launch until close(), capping how many browsers run at once
+        self.gate = gate
+        self._holds_gate = False
+
+        self._playwright = None
+        self._browser: Optional[Browser] = None
+        self._idle: List[_Slot] = []
+
+    def __enter__(self) -> "BrowserPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ───────────────────────────── PUBLIC ENTRY POINTS ───────────────────── #
+    # Hands out a ready page; it goes back to the pool afterwards unless it crashed or hit max_uses
+    @contextmanager
+    def page(self) -> Iterator[Page]:
+        slot = self._acquire()
+        try:
+            yield slot.page
+        except Exception:
+            slot.close()
+            raise
+        slot.uses += 1
+        self._release(slot)
+
+    def close(self) -> None:
+        for slot in self._idle:
+            slot.close()
+        self._idle.clear()
+
+        if self._browser is not None:
+            try:
+                self._browser.close()
+            except Exception:
+                pass
+            self._browser = None
+
+        if self._playwright is not None:
+            self._playwright.stop()
+            self._playwright = None
+
+        if self._holds_gate:
+            self.gate.release()
+            self._holds_gate = False
+
+    # ───────────────────────────── HELPERS ────────────────────────── #
+    def _ensure_browser(self) -> Browser:
+        if self._browser is not None and self._browser.is_connected():
+            return self._browser
+
+        # Browser died underneath us: every idle slot belonged to it
+        if self._browser is not None:
+            print("♻️ Browser disconnected, relaunching")
+            self._idle.clear()
+
+        if self.gate is not None and not self._holds_gate:
+            self.gate.acquire()
+            self._holds_gate = True
+
+        if self._playwright is None:
+            from playwright.sync_api import sync_playwright
+            self._playwright = sync_playwright().start()
+
+        self._browser = self._playwright.chromium.launch(headless=self.headless)
+        return self._browser
+
+    def _acquire(self) -> _Slot:
+        browser = self._ensure_browser()
+        while self._idle:
+            slot = self._idle.pop()
+            if slot.usable():
+                return slot
+            slot.close()
+
+        context = browser.new_context()
+        return _Slot(context, context.new_page())
+
+    def _release(self, slot: _Slot) -> None:
+        if not slot.usable() or slot.uses >= self.max_uses:
+            slot.close()
+            return
+        self._idle.append(slot)
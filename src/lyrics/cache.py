@@ -0,0 +1,138 @@
+# Persistent on-disk cache for Genius responses (API JSON and lyrics page HTML), keyed by URL + query params, with a TTL and size-based LRU eviction. Also what --offline replays from.
+
+# Example use:
+# cache = ResponseCache(Path(".cache/http"), ttl=86400, max_bytes=512 * 2**20)
+# cache.put(url, params, 200, body, headers)
+# entry = cache.get(url, params)
+
+from __future__ import annotations
+import hashlib, json, os, tempfile, threading, time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+# Response headers worth replaying (validators for conditional requests, content type for decoding)
+KEPT_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+class CachedResponse:
+    def __init__(self, url: str, status: int, headers: Dict[str, str],
+                 body: str, stored_at: float) -> None:
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.stored_at = stored_at
+
+class ResponseCache:
+    # ───────────────────────────── CONSTRUCTION ──────────────────────────── #
+    def __init__(
+        self,
+        root: str | Path,
+        *,
+        ttl: Optional[float] = 86400.0,
+        max_bytes: int = 512 * 2**20,
+    ) -> None:
+        self.root = Path(root)
+        self.ttl = ttl  # None = never expires
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None  # computed on first write
+
+    # ───────────────────────────── PUBLIC ENTRY POINTS ───────────────────── #
+    @staticmethod
+    def key(url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        query = urlencode(sorted((params or {}).items()), doseq=True)
+        return hashlib.sha256(f"{url}?{query}".encode("utf-8")).hexdigest()
+
+    # Entry for url+params, or None when missing or older than ttl (unless allow_stale)
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        *,
+        allow_stale: bool = False,
+    ) -> Optional[CachedResponse]:
+        path = self._path(self.key(url, params))
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+        if (not allow_stale and self.ttl is not None
+                and time.time() - data["stored_at"] > self.ttl):
+            return None
+
+        # mtime doubles as "last used" for LRU eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return CachedResponse(data["url"], data["status"], data["headers"],
+                              data["body"], data["stored_at"])
+
+    def put(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        status: int,
+        body: str,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> None:
+        lowered = {k.lower(): v for k, v in (headers or {}).items()}
+        entry = json.dumps({
+            "url": url,
+            "params": params or {},
+            "status": status,
+            "headers": {h: lowered[h.lower()] for h in KEPT_HEADERS if h.lower() in lowered},
+            "stored_at": time.time(),
+            "body": body,
+        }, ensure_ascii=False).encode("utf-8")
+
+        path = self._path(self.key(url, params))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        old_size = path.stat().st_size if path.exists() else 0
+
+        # Write to a temp file first so a crash never leaves a half-written entry
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(entry)
+        os.replace(tmp, path)
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(size for _, size, _ in self._entries())
+            else:
+                self._total_bytes += len(entry) - old_size
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def clear(self) -> None:
+        for path, _, _ in self._entries():
+            path.unlink(missing_ok=True)
+        self._total_bytes = 0
+
+    # ───────────────────────────── HELPERS ────────────────────────── #
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def _entries(self) -> List[Tuple[Path, int, float]]:
+        entries = []
+        for path in self.root.glob("*/*.json"):
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((path, st.st_size, st.st_mtime))
+        return entries
+
+    # Drop least recently used entries until we are back under 90% of max_bytes
+    def _evict(self) -> None:
+        target = int(self.max_bytes * 0.9)
+        entries = sorted(self._entries(), key=lambda e: e[2])
+        total = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        self._total_bytes = total
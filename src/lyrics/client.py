@@ -0,0 +1,317 @@
+# One HTTP client for every Genius call (API and lyrics pages): keep-alive connection pooling, a token-bucket rate limit shared by all callers, retries with exponential backoff that honour Retry-After, a timeout on every request, and an optional on-disk response cache (with an offline mode that only serves from it).
+
+# Example use:
+# from lyrics.config import genius_client
+# tracks = genius_client().api("/albums/28192/tracks", params={"page": 1})
+
+from __future__ import annotations
+import asyncio, random, threading, time, requests
+from concurrent.futures import Future, ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Tuple
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from lyrics.cache import CachedResponse, ResponseCache
+from lyrics.metrics import Metrics
+
+# httpx is only needed by the async methods, which import it themselves
+if TYPE_CHECKING:
+    import httpx
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Raised in offline mode when a request has no cached response
+class CacheMiss(requests.ConnectionError):
+    pass
+
+# Classic token bucket: `rate` requests per second on average, bursts of up to `burst`
+class TokenBucket:
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    # Takes a token now and returns how long the caller must wait before using it
+    def reserve(self) -> float:
+        if self.rate <= 0:  # unlimited
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity,
+                               self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        wait = self.reserve()
+        if wait:
+            time.sleep(wait)
+
+    async def acquire_async(self) -> None:
+        wait = self.reserve()
+        if wait:
+            await asyncio.sleep(wait)
+
+class GeniusClient:
+    # ───────────────────────────── CONSTRUCTION ──────────────────────────── #
+    def __init__(
+        self,
+        *,
+        token: Optional[str] = None,
+        api_root: str = "https://api.genius.com",
+        rate: float = 5.0,
+        burst: int = 10,
+        retries: int = 4,
+        backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        timeout: float = 20.0,
+        pool_size: int = 16,
+        cache: Optional[ResponseCache] = None,
+        offline: bool = False,
+        metrics: Optional[Metrics] = None,
+    ) -> None:
+        self.token = token
+        self.api_root = api_root
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.bucket = TokenBucket(rate, burst)
+        self.cache = cache
+        self.offline = offline
+
+        # Requests, latencies, retries, cache hits and rate-limit waits, labelled by
+        # kind ("api" or "page"); a Scraper swaps in its own per run
+        self.metrics = metrics or Metrics()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                              max_retries=0)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def close(self) -> None:
+        self.session.close()
+
+    # ───────────────────────────── SYNC REQUESTS ─────────────────────────── #
+    # GET with rate limiting and retries; `auth` adds the API bearer token.
+    # Gives back the last response once retries run out (callers check status_code).
+    # `revalidate` skips the cache lookup and sends a conditional request instead, with the
+    # cached entry's ETag / Last-Modified (even when expired); a 304 renews the entry and
+    # returns its body, so callers always get a 200 with the current content.
+    def get(
+        self,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        auth: bool = True,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        revalidate: bool = False,
+    ) -> requests.Response:
+        kind = "api" if auth else "page"
+        stale: Optional[CachedResponse] = None
+        if revalidate and not self.offline:
+            if self.cache is not None:
+                stale = self.cache.get(url, params, allow_stale=True)
+            headers = {**(headers or {}), **_validators(stale)}
+        else:
+            hit = self._cached(url, params, kind)
+            if hit is not None:
+                return _requests_response(hit)
+
+        for attempt in range(self.retries + 1):
+            with self.metrics.timer("rate_limit_wait_seconds", kind=kind):
+                self.bucket.acquire()
+            try:
+                with self.metrics.timer("http_request_seconds", kind=kind):
+                    r = self.session.get(url, params=params,
+                                         headers=self._headers(auth, headers),
+                                         timeout=timeout or self.timeout)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self.metrics.inc("http_requests", kind=kind, status="error")
+                if attempt == self.retries:
+                    raise
+                self._sleep_before_retry(url, None, attempt, e, kind)
+                continue
+
+            self.metrics.inc("http_requests", kind=kind, status=str(r.status_code))
+            if r.status_code in RETRY_STATUSES and attempt < self.retries:
+                self._sleep_before_retry(url, r.headers.get("Retry-After"), attempt,
+                                         f"HTTP {r.status_code}", kind)
+                continue
+            if r.status_code == 304 and stale is not None:
+                self.metrics.inc("cache_lookups", kind=kind, result="revalidated")
+                self._store(url, params, 200, stale.body, stale.headers)
+                return _requests_response(stale)
+            self._store(url, params, r.status_code, r.text, r.headers)
+            return r
+        raise AssertionError("unreachable")
+
+    # JSON body of an API path ("/songs/123"); raises requests.HTTPError on a final non-2xx
+    def api(self, api_path: str, params: Optional[Dict[str, Any]] = None,
+            *, revalidate: bool = False) -> Dict:
+        r = self.get(self.api_root + api_path, params=params, revalidate=revalidate)
+        r.raise_for_status()
+        return r.json()
+
+    # ───────────────────────────── ASYNC REQUESTS ────────────────────────── #
+    # Same policy as get() over a caller-owned httpx.AsyncClient (bound to the running loop)
+    async def aget(
+        self,
+        http: httpx.AsyncClient,
+        url: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        auth: bool = True,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> httpx.Response:
+        import httpx
+        kind = "api" if auth else "page"
+        hit = self._cached(url, params, kind)
+        if hit is not None:
+            return _httpx_response(hit)
+
+        for attempt in range(self.retries + 1):
+            with self.metrics.timer("rate_limit_wait_seconds", kind=kind):
+                await self.bucket.acquire_async()
+            try:
+                with self.metrics.timer("http_request_seconds", kind=kind):
+                    r = await http.get(url, params=params,
+                                       headers=self._headers(auth, headers),
+                                       timeout=timeout or self.timeout)
+            except httpx.TransportError as e:
+                self.metrics.inc("http_requests", kind=kind, status="error")
+                if attempt == self.retries:
+                    raise
+                await asyncio.sleep(self._retry_delay(None, attempt, url, e, kind))
+                continue
+
+            self.metrics.inc("http_requests", kind=kind, status=str(r.status_code))
+            if r.status_code in RETRY_STATUSES and attempt < self.retries:
+                await asyncio.sleep(self._retry_delay(
+                    r.headers.get("Retry-After"), attempt, url, f"HTTP {r.status_code}", kind))
+                continue
+            self._store(url, params, r.status_code, r.text, r.headers)
+            return r
+        raise AssertionError("unreachable")
+
+    async def aapi(self, http: httpx.AsyncClient, api_path: str,
+                   params: Optional[Dict[str, Any]] = None) -> Dict:
+        r = await self.aget(http, self.api_root + api_path, params=params)
+        r.raise_for_status()
+        return r.json()
+
+    # ───────────────────────────── HELPERS ────────────────────────── #
+    # Cached entry for a request; offline mode also accepts expired entries and never hits the network
+    def _cached(self, url: str, params: Optional[Dict[str, Any]],
+                kind: str = "api") -> Optional[CachedResponse]:
+        if self.cache is not None:
+            hit = self.cache.get(url, params, allow_stale=self.offline)
+            self.metrics.inc("cache_lookups", kind=kind, result="miss" if hit is None else "hit")
+            if hit is not None:
+                return hit
+        if self.offline:
+            raise CacheMiss(f"📴 Not cached (offline): {url}")
+        return None
+
+    # Only successful responses are worth replaying
+    def _store(self, url: str, params: Optional[Dict[str, Any]], status: int,
+               body: str, headers) -> None:
+        if self.cache is not None and status == 200:
+            self.cache.put(url, params, status, body, dict(headers))
+
+    def _headers(self, auth: bool, extra: Optional[Dict[str, str]]) -> Dict[str, str]:
+        headers = dict(extra or {})
+        if auth and self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        return headers
+
+    def _sleep_before_retry(self, url: str, retry_after: Optional[str],
+                            attempt: int, reason: object, kind: str = "api") -> None:
+        time.sleep(self._retry_delay(retry_after, attempt, url, reason, kind))
+
+    # Retry-After wins when the server sends one; otherwise exponential backoff with jitter
+    def _retry_delay(self, retry_after: Optional[str], attempt: int,
+                     url: str, reason: object, kind: str = "api") -> float:
+        delay = _parse_retry_after(retry_after)
+        if delay is None:
+            delay = min(self.max_backoff, self.backoff * 2 ** attempt)
+            delay += random.uniform(0, self.backoff)
+        self.metrics.inc("http_retries", kind=kind)
+        self.metrics.observe("retry_backoff_seconds", delay, kind=kind)
+        print(f"🔁 Retry {attempt + 1}/{self.retries} in {delay:.1f}s ({reason}): {url}")
+        return delay
+
+# (page, items) of a paged Genius listing in page order from `start` on, with up to
+# `concurrency` pages requested ahead of the one being read. `fetch_page(page)` returns
+# (items, next page); Genius gives no page count, so the listing ends at the first page
+# with no next page (or no items) and nothing past it is requested once that page is in.
+def iter_pages(fetch_page: Callable[[int], Tuple[List[Any], Optional[int]]], start: int = 1,
+               concurrency: int = 4) -> Iterator[Tuple[int, List[Any]]]:
+    window = max(1, concurrency)
+    with ThreadPoolExecutor(max_workers=window) as pool:
+        in_flight: Dict[int, Future] = {}
+        next_request, last_page, page = start, None, start
+        try:
+            while last_page is None or page <= last_page:
+                while len(in_flight) < window and (last_page is None or next_request <= last_page):
+                    in_flight[next_request] = pool.submit(fetch_page, next_request)
+                    next_request += 1
+
+                items, next_page = in_flight.pop(page).result()
+                if not items:
+                    break
+                if next_page is None:
+                    last_page = page
+                yield page, items
+                page += 1
+        finally:
+            for future in in_flight.values():
+                future.cancel()
+
+def _requests_response(hit: CachedResponse) -> requests.Response:
+    r = requests.Response()
+    r.status_code = hit.status
+    r.url = hit.url
+    r.headers = CaseInsensitiveDict(hit.headers)
+    r.encoding = "utf-8"
+    r._content = hit.body.encode("utf-8")
+    return r
+
+# Conditional request headers for a cached entry (none without one)
+def _validators(hit: Optional[CachedResponse]) -> Dict[str, str]:
+    if hit is None:
+        return {}
+    headers = {}
+    if "ETag" in hit.headers:
+        headers["If-None-Match"] = hit.headers["ETag"]
+    if "Last-Modified" in hit.headers:
+        headers["If-Modified-Since"] = hit.headers["Last-Modified"]
+    return headers
+
+def _httpx_response(hit: CachedResponse) -> httpx.Response:
+    import httpx
+    return httpx.Response(hit.status, headers=hit.headers,
+                          content=hit.body.encode("utf-8"),
+                          request=httpx.Request("GET", hit.url))
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
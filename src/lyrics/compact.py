@@ -0,0 +1,109 @@
+# Compact, minified layout for lyrics.json: every distinct string is stored once in a table and songs become arrays of indices into it, with prev/next derived from position. Used by lyrics/lyrics_json.py (Scraper's --compact-json) and helpers/combine.py; components/catalog.js expands it again in the browser.
+
+# Layout of one artist's lyrics.json:
+# {"format": "compact-v1", "strings": ["", "line", ...], "albums": {album: {song: [entry, ...]}}}
+# The combined file holds one such body per artist, each with its own string table, so
+# combine can copy the block of an unchanged artist as is:
+# {"format": "compact-v1", "artists": {artist: {"strings": [...], "albums": {...}}}}
+#
+# An entry is one of
+#   i               lyric strings[i], multiplicity 1
+#   [i, m]          lyric strings[i], multiplicity m
+#   [i, m, p, n]    also prev = strings[p], next = strings[n]
+# The short forms mean prev/next are the lyrics of the neighbouring entries ("" at either
+# end of the song), which holds for most lines. strings[0] is always "".
+
+from __future__ import annotations
+import json
+from typing import Any, Dict, List, Sequence
+
+COMPACT_FORMAT = "compact-v1"
+
+Lines = List[Dict[str, Any]]  # [{"lyric", "prev", "next", "multiplicity"}, ...]
+Albums = Dict[str, Dict[str, Lines]]
+
+def is_compact(data: Any) -> bool:
+    return isinstance(data, dict) and data.get("format") == COMPACT_FORMAT
+
+# ───────────────────────────── ENCODING ──────────────────────────── #
+class StringTable:
+    def __init__(self) -> None:
+        self.strings: List[str] = [""]
+        self._index: Dict[str, int] = {"": 0}
+
+    def __call__(self, string: str) -> int:
+        i = self._index.get(string)
+        if i is None:
+            i = self._index[string] = len(self.strings)
+            self.strings.append(string)
+        return i
+
+# One song's entries from (lyric, prev, next, multiplicity) rows, the way lyrics.csv holds
+# them (a missing prev/next may be None or "")
+def encode_song_rows(rows: Sequence[Sequence[Any]], table: StringTable) -> List[Any]:
+    entries: List[Any] = []
+    for k, (lyric, prev, next_, multiplicity) in enumerate(rows):
+        derived_prev = rows[k - 1][0] if k else ""
+        derived_next = rows[k + 1][0] if k + 1 < len(rows) else ""
+        i, m = table(lyric), int(multiplicity)
+
+        if (prev or "") != derived_prev or (next_ or "") != derived_next:
+            entries.append([i, m, table(prev or ""), table(next_ or "")])
+        elif m != 1:
+            entries.append([i, m])
+        else:
+            entries.append(i)
+    return entries
+
+def _encode_song(lines: Lines, table: StringTable) -> List[Any]:
+    return encode_song_rows([(line["lyric"], line["prev"], line["next"], line["multiplicity"])
+                             for line in lines], table)
+
+# {"strings", "albums"} for one artist's album -> song -> lines
+def artist_block(albums: Albums) -> Dict[str, Any]:
+    table = StringTable()
+    encoded = {album: {song: _encode_song(lines, table) for song, lines in songs.items()}
+               for album, songs in albums.items()}
+    return {"strings": table.strings, "albums": encoded}
+
+# album -> song -> lines (one artist's lyrics.json)
+def encode_albums(albums: Albums) -> Dict[str, Any]:
+    return {"format": COMPACT_FORMAT, **artist_block(albums)}
+
+# artist -> album -> song -> lines (the combined lyrics.json)
+def encode_artists(artists: Dict[str, Albums]) -> Dict[str, Any]:
+    return {"format": COMPACT_FORMAT,
+            "artists": {artist: artist_block(albums) for artist, albums in artists.items()}}
+
+def dumps(data: Dict[str, Any]) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+# ───────────────────────────── DECODING ──────────────────────────── #
+def _decode_song(entries: List[Any], strings: List[str]) -> Lines:
+    lyrics = [strings[e if isinstance(e, int) else e[0]] for e in entries]
+    lines: Lines = []
+    for k, entry in enumerate(entries):
+        if isinstance(entry, int):
+            entry = [entry, 1]
+        if len(entry) == 4:
+            prev, next_ = strings[entry[2]], strings[entry[3]]
+        else:
+            prev = lyrics[k - 1] if k else ""
+            next_ = lyrics[k + 1] if k + 1 < len(lyrics) else ""
+        lines.append({"lyric": lyrics[k], "prev": prev, "next": next_,
+                      "multiplicity": entry[1]})
+    return lines
+
+def _decode_albums(albums: Dict[str, Dict[str, List[Any]]], strings: List[str]) -> Albums:
+    return {album: {song: _decode_song(entries, strings) for song, entries in songs.items()}
+            for album, songs in albums.items()}
+
+# Back to the verbose nesting: album -> song -> lines, or artist -> album -> ... for a
+# combined file. Verbose input is returned untouched.
+def decode(data: Dict[str, Any]) -> Dict[str, Any]:
+    if not is_compact(data):
+        return data
+    if "artists" in data:
+        return {artist: _decode_albums(block["albums"], block["strings"])
+                for artist, block in data["artists"].items()}
+    return _decode_albums(data["albums"], data["strings"])
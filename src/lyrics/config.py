@@ -1,21 +1,53 @@
 # Central place for tokens, API roots and a shortcut that turns 'Paramore' into its Genius artist‑id so you don't repeat numbers everywhere.
 
 from __future__ import annotations
-import os, json, functools, requests
+import os, json, functools
 from pathlib import Path
 from dotenv import load_dotenv
+from typing import TYPE_CHECKING
 
-load_dotenv() 
+# The HTTP stack is imported by genius_client() on first use, so reading settings is cheap
+if TYPE_CHECKING:
+    from lyrics.client import GeniusClient
+
+load_dotenv()
 
 CLIENT_ACCESS_TOKEN = os.getenv("CLIENT_ACCESS_TOKEN")
 API_ROOT = os.getenv("API_ROOT", "https://api.genius.com")
+# Genius' own site API (no token needed); some listings, like an artist's albums, only exist there
+WEB_API_ROOT = os.getenv("WEB_API_ROOT", "https://genius.com/api")
+
+# Requests per second (and burst) allowed against Genius, shared by every caller in a process
+RATE_LIMIT = float(os.getenv("GENIUS_RATE_LIMIT", "5"))
+RATE_BURST = int(os.getenv("GENIUS_RATE_BURST", "10"))
+
+# On-disk response cache shared by the scraper and helpers (GENIUS_CACHE_TTL=0 disables it)
+CACHE_DIR = Path(os.getenv("GENIUS_CACHE_DIR", Path(__file__).resolve().parent / ".cache" / "http"))
+CACHE_TTL = float(os.getenv("GENIUS_CACHE_TTL", "86400"))
+CACHE_MAX_BYTES = int(os.getenv("GENIUS_CACHE_MAX_BYTES", str(512 * 2**20)))
+
+# The one pooled client everybody uses, so connections, the rate limit and the cache are shared
+@functools.lru_cache(maxsize=None)
+def genius_client() -> GeniusClient:
+    from lyrics.cache import ResponseCache
+    from lyrics.client import GeniusClient
+    cache = None
+    if CACHE_TTL > 0:
+        cache = ResponseCache(CACHE_DIR, ttl=CACHE_TTL, max_bytes=CACHE_MAX_BYTES)
+    return GeniusClient(
+        token=CLIENT_ACCESS_TOKEN,
+        api_root=API_ROOT,
+        rate=RATE_LIMIT,
+        burst=RATE_BURST,
+        cache=cache,
+        offline=os.getenv("GENIUS_OFFLINE") == "1",
+    )
 
 # Simple cache so we only hit Genius once per unique artist name
 @functools.lru_cache(maxsize=None)
 def artist_name_to_id(name: str) -> int | None:
     # Return Genius artist‑id for a given display name (case‑insensitive)
-    headers = {"Authorization": f"Bearer {CLIENT_ACCESS_TOKEN}"}
-    r = requests.get(f"{API_ROOT}/search", params={"q": name}, headers=headers)
+    r = genius_client().get(f"{API_ROOT}/search", params={"q": name})
     if r.status_code != 200:
         return None
     hits = r.json()["response"]["hits"]
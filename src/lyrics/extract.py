@@ -0,0 +1,93 @@
+# Turns the lyrics blocks of a Genius song page into raw lyrics text, either from a rendered browser page or straight from the server HTML, with the same line filtering for every fetcher.
+
+from __future__ import annotations
+import re, requests, lxml.html
+from typing import Optional
+from lyrics.client import GeniusClient
+
+LYRICS_SELECTOR = "div[data-lyrics-container]"
+
+_DESCRIPTION_RE = re.compile(r'\b(song|track|lyrics)\b.*(is|was).*')
+
+# Remove any Genius description-like intro (not part of real lyrics)
+def filter_lyric_lines(raw_lyrics: str) -> str:
+    cleaned_lines = []
+    for line in raw_lyrics.split("\n"):
+        if (
+            "Read More" in line
+            or "You might also like" in line
+            or line.strip().startswith("“") and line.strip().endswith("”")
+            or _DESCRIPTION_RE.search(line.lower())
+        ):
+            continue
+        cleaned_lines.append(line.strip())
+
+    return "\n".join(cleaned_lines).strip()
+
+# ─────────────────────────── HTTP FAST PATH ──────────────────────────── #
+# Tags whose boundaries start a new line in the browser's inner_text()
+_BLOCK_TAGS = frozenset({
+    "div", "p", "section", "article", "header", "footer", "ul", "ol", "li",
+    "h1", "h2", "h3", "h4", "h5", "h6", "blockquote", "pre", "table", "tr",
+})
+_SKIP_TAGS = frozenset({"script", "style", "noscript", "template"})
+_LINE_BREAK = "\0"  # placeholder for a block boundary, collapsed like inner_text() does
+_WHITESPACE_RE = re.compile(r"[ \t\r\n\f]+")
+_LINE_BREAKS_RE = re.compile(r"(?:\0|\n)*\0(?:\0|\n)*")
+
+def _inner_text(element) -> str:
+    parts: list[str] = []
+
+    def text(value: str | None) -> None:
+        if value:
+            parts.append(_WHITESPACE_RE.sub(" ", value))
+
+    def walk(node) -> None:
+        tag = node.tag if isinstance(node.tag, str) else ""
+        if tag in _SKIP_TAGS:
+            return
+        if tag == "br":
+            parts.append("\n")
+            return
+        block = tag in _BLOCK_TAGS
+        if block:
+            parts.append(_LINE_BREAK)
+        text(node.text)
+        for child in node:
+            walk(child)
+            text(child.tail)
+        if block:
+            parts.append(_LINE_BREAK)
+
+    text(element.text)
+    for child in element:
+        walk(child)
+        text(child.tail)
+
+    # A run of block boundaries (and any <br> inside it) is a single line break
+    joined = _LINE_BREAKS_RE.sub(
+        lambda m: "\n" * max(1, m.group(0).count("\n")), "".join(parts))
+    return "\n".join(line.strip(" ") for line in joined.split("\n")).strip()
+
+# Lyrics text from server-rendered page HTML, or None when the page has no lyrics container
+def parse_lyrics_html(html: str) -> Optional[str]:
+    if not html:
+        return None
+    doc = lxml.html.fromstring(html)
+    containers = doc.xpath("//div[@data-lyrics-container]")
+    if not containers:
+        return None
+    raw_lyrics = "\n".join(_inner_text(el).strip() for el in containers)
+    return filter_lyric_lines(raw_lyrics)
+
+# Fetches a lyrics page with plain HTTP; None means "use the browser instead"
+def fetch_lyrics_http(url: str, client: GeniusClient, revalidate: bool = False) -> Optional[str]:
+    try:
+        r = client.get(url, auth=False, revalidate=revalidate)
+    except requests.RequestException as e:
+        print(f"⚠️ HTTP fetch failed for {url}: {e}")
+        return None
+    if r.status_code != 200:
+        print(f"⚠️ HTTP {r.status_code} for {url}")
+        return None
+    return parse_lyrics_html(r.text)
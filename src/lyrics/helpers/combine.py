@@ -1,39 +1,143 @@
 # Merges the lyrics.json files of multiple artists (Paramore & Hayley Williams) into one file, tagging every album with its artist. Run whenever any of the artists are re-scraped.
+# The combined file is written in the minified compact layout (lyrics/compact.py) the frontend expands on load; --pretty writes the old nested, indented JSON instead.
+# Also writes search_index.json (lyrics/search_index.py), the token -> lines index the search box looks queries up in.
+# Incremental: each artist's encoded lyrics block and index block are cached under .cache/combine/ together with a hash of the lyrics.json they came from and the block formats they were written in (manifest.json), so only artists whose file changed (or every artist, after a format change) are decoded and re-encoded; the outputs are then streamed together from the blocks.
 
 # Example use from CLI:
 # python -m lyrics.helpers.combine --artists paramore hayley
+# python -m lyrics.helpers.combine                            (every artist folder with a lyrics.json)
+# python -m lyrics.helpers.combine --artists paramore hayley --pretty
 
 from __future__ import annotations
-import argparse, json
+import argparse, hashlib, json, shutil
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from lyrics import compact, search_index
+from lyrics.artefacts import atomic_write_text, atomic_writer
+
+LYRICS_ROOT = Path(__file__).resolve().parents[1]
+
+# Formats the cached blocks are written in; a manifest entry stamped with anything else is rebuilt
+BLOCK_FORMAT = f"{compact.COMPACT_FORMAT}+{search_index.SEARCH_INDEX_FORMAT}"
 
 def parse_cli():
     ap = argparse.ArgumentParser()
-    ap.add_argument("--artists", nargs="+", required=True, help="Folder names under src/lyrics/ (paramore hayley)")
+    ap.add_argument("--artists", nargs="+", help="Folder names under src/lyrics/ (paramore hayley); default: every folder with a lyrics.json")
+    ap.add_argument("--pretty", action="store_true", help="Write indented artist → album → song JSON instead of the compact format")
+    ap.add_argument("--force", action="store_true", help="Ignore the manifest and rebuild every artist block")
     return ap.parse_args()
 
+# Per-artist files may be verbose or compact; either way we get album → song → lines back
 def load_lyrics(path: Path) -> dict:
     try:
-        return json.loads(path.read_text())
+        return compact.decode(json.loads(path.read_text(encoding="utf-8")))
     except Exception:
         print(f"⚠️  Cannot load {path}")
         return {}
 
-def merge(artists: list[str]) -> dict:
+def merge(artists: list[str], root: Path = LYRICS_ROOT) -> dict:
     combo: dict[str, dict] = {}
     for art in artists:
-        path = Path(__file__).resolve().parents[1] / art / "lyrics.json"
+        path = root / art / "lyrics.json"
         data = load_lyrics(path)
         for album, songs in data.items():
             combo.setdefault(art, {}).setdefault(album, {}).update(songs)
     return combo
 
+# Artists already in the combined file keep their order (it's the sidebar order); new folders follow
+def default_artists(root: Path = LYRICS_ROOT) -> list[str]:
+    try:
+        combined = json.loads((root / "lyrics.json").read_text(encoding="utf-8"))
+    except (FileNotFoundError, json.JSONDecodeError):
+        combined = {}
+    known = list(combined.get("artists", {}) if compact.is_compact(combined) else combined)
+    found = sorted(p.parent.name for p in root.glob("*/lyrics.json"))
+    return [a for a in known if a in found] + [a for a in found if a not in known]
+
+# Writes root/lyrics.json and root/search_index.json; returns (rebuilt, reused) artist counts
+def combine_artists(artists: list[str], root: Path = LYRICS_ROOT, *, force: bool = False) -> Tuple[int, int]:
+    cache_dir = root / ".cache" / "combine"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = cache_dir / "manifest.json"
+    manifest = {} if force else _load_manifest(manifest_path)
+
+    blocks: List[Tuple[str, Path, Path]] = []
+    new_manifest: Dict[str, Dict[str, Any]] = {}
+    rebuilt = reused = 0
+
+    for art in dict.fromkeys(artists):
+        source = root / art / "lyrics.json"
+        try:
+            raw = source.read_bytes()
+        except OSError:
+            print(f"⚠️  Cannot load {source}")
+            continue
+        digest = hashlib.sha256(raw).hexdigest()
+        lyrics_block = cache_dir / f"{art}.lyrics.json"
+        index_block = cache_dir / f"{art}.index.json"
+
+        entry = manifest.get(art, {})
+        if (entry.get("sha256") == digest and entry.get("format") == BLOCK_FORMAT
+                and lyrics_block.exists() and index_block.exists()):
+            reused += 1
+        else:
+            albums = _decode(raw, source)
+            if albums is None:
+                continue
+            atomic_write_text(lyrics_block, compact.dumps(compact.artist_block(albums)))
+            atomic_write_text(index_block, compact.dumps(search_index.build_artist_index(albums)))
+            entry = {"sha256": digest, "format": BLOCK_FORMAT, "albums": len(albums)}
+            rebuilt += 1
+
+        # An artist without albums gets no block, as in merge()
+        if entry["albums"]:
+            blocks.append((art, lyrics_block, index_block))
+        new_manifest[art] = entry
+
+    _stream(root / "lyrics.json", compact.COMPACT_FORMAT, [(a, lb) for a, lb, _ in blocks])
+    _stream(root / "search_index.json", search_index.SEARCH_INDEX_FORMAT, [(a, ib) for a, _, ib in blocks])
+
+    # Keep entries of artists not combined this time so a later run can still reuse them
+    atomic_write_text(manifest_path, json.dumps({**manifest, **new_manifest}, indent=2))
+    return rebuilt, reused
+
+# ───────────────────────────── HELPERS ────────────────────────── #
+def _load_manifest(path: Path) -> Dict[str, Dict[str, Any]]:
+    try:
+        return json.loads(path.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+def _decode(raw: bytes, source: Path) -> Optional[dict]:
+    try:
+        return compact.decode(json.loads(raw.decode("utf-8")))
+    except Exception:
+        print(f"⚠️  Cannot load {source}")
+        return None
+
+# {"format": ..., "artists": {artist: <block>, ...}} written piece by piece from the block files
+def _stream(path: Path, fmt: str, blocks: List[Tuple[str, Path]]) -> None:
+    with atomic_writer(path) as out:
+        out.write(f'{{"format":{json.dumps(fmt)},"artists":{{')
+        for i, (art, block) in enumerate(blocks):
+            out.write(("," if i else "") + json.dumps(art, ensure_ascii=False) + ":")
+            with block.open(encoding="utf-8") as f:
+                shutil.copyfileobj(f, out)
+        out.write("}}")
+
 if __name__ == "__main__":
     args = parse_cli()
-    merged = merge(args.artists)
-    
-    out_path = Path(__file__).resolve().parents[2] / "lyrics" / "lyrics.json"
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(json.dumps(merged, indent=2), encoding="utf-8")
-    
-    print(f"✅ Wrote combined file with {len(merged)} artist blocks → {out_path}")
+    artists = args.artists or default_artists()
+
+    if args.pretty:
+        merged = merge(artists)
+        out_path = LYRICS_ROOT / "lyrics.json"
+        out_path.write_text(json.dumps(merged, indent=2), encoding="utf-8")
+        print(f"✅ Wrote combined file with {len(merged)} artist blocks → {out_path}")
+        index_path = out_path.with_name("search_index.json")
+        index_path.write_text(compact.dumps(search_index.build_index(merged)), encoding="utf-8")
+        print(f"✅ Wrote search index → {index_path}")
+    else:
+        rebuilt, reused = combine_artists(artists, force=args.force)
+        print(f"✅ Wrote combined file with {rebuilt + reused} artist blocks "
+              f"({rebuilt} rebuilt, {reused} reused) → {LYRICS_ROOT / 'lyrics.json'}")
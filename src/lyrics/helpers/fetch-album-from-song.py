@@ -4,10 +4,8 @@
 # python -m lyrics.helpers.fetch-album-from-song --artist "Paramore" --song "The Only Exception"
 
 from __future__ import annotations
-import argparse, requests
-from lyrics.config import CLIENT_ACCESS_TOKEN, API_ROOT
-
-headers = {"Authorization": f"Bearer {CLIENT_ACCESS_TOKEN}"}
+import argparse
+from lyrics.config import API_ROOT, genius_client
 
 def parse_cli():
     p = argparse.ArgumentParser(description="Find album for a given song.")
@@ -17,8 +15,8 @@ def parse_cli():
 
 def get_song_id_and_album(song_title: str, artist_name: str) -> None:
     print(f"🔍 Searching for: {song_title} by {artist_name}")
-    r = requests.get(f"{API_ROOT}/search", params={"q": song_title},
-                     headers=headers)
+    client = genius_client()
+    r = client.get(f"{API_ROOT}/search", params={"q": song_title})
     if r.status_code != 200:
         print(f"❌ Failed search (HTTP {r.status_code}): {r.text}")
         return
@@ -30,7 +28,7 @@ def get_song_id_and_album(song_title: str, artist_name: str) -> None:
             title   = hit["result"]["full_title"]
             print(f"✅ Found: {title} → Song ID: {song_id}")
 
-            meta = requests.get(f"{API_ROOT}/songs/{song_id}", headers=headers)
+            meta = client.get(f"{API_ROOT}/songs/{song_id}")
             if meta.status_code != 200:
                 print("⚠️ Couldn't get song metadata.")
                 return
@@ -1,43 +1,259 @@
-# Fetches all albums for a given artist name
+# Discovers every album of an artist on Genius and onboards them: listing pages are fetched several at a time through the shared client (and its response cache), each album is classified as a studio album, deluxe edition, live album or remix album from the edition suffix of its name ("(Deluxe Edition)", "[Live]", " - Remixes"), and --write adds the new ones to the artist's ALBUMS (creating lyrics/<folder>/<folder>.py for a new artist), album_meta.json and album_map.json.
+# Live and remix albums are listed but only added with --include, the same way IGNORE_SONGS keeps live takes and remixes out of the dataset; entries already in those files are never changed.
 
 # Example use from CLI:
 # python -m lyrics.helpers.fetch-albums --artist "Paramore"
+# python -m lyrics.helpers.fetch-albums --artist "Paramore" --write
+# python -m lyrics.helpers.fetch-albums --artist "Hayley Williams" --folder hayley --include live --write
 
 from __future__ import annotations
-import argparse, requests, sys
-from lyrics.config import artist_name_to_id
+import argparse, ast, json, re, sys
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from lyrics.artefacts import LYRICS_ROOT, atomic_write_text
+from lyrics.client import iter_pages
+from lyrics.config import WEB_API_ROOT, artist_name_to_id, genius_client
+
+IMAGES_DIR = LYRICS_ROOT.parents[1] / "public" / "images"
+DEFAULT_KINDS = ("album", "deluxe")  # live and remix albums need --include
+
+# Markers looked for in a name's edition suffixes only (so "Live Through This" or "Special
+# Request" stay studio albums); checked in order, so a live deluxe edition counts as live
+EDITION_PATTERNS = [
+    ("live",   re.compile(r"\blive\b|\bunplugged\b|\bin concert\b", re.I)),
+    ("remix",  re.compile(r"\bremix(es|ed)?\b|\breimagined\b|\brework(s|ed)?\b", re.I)),
+    ("deluxe", re.compile(r"\bdeluxe\b|\bexpanded\b|\bedition\b|\banniversary\b|\bbonus\b|\bspecial\b", re.I)),
+]
+# "(Deluxe Edition)", "[Bonus Tracks]" or " - Live" at the end of a name
+_EDITION_SUFFIX_RE = re.compile(r"\s*(\([^()]*\)|\[[^\[\]]*\]|\s-\s[^()\[\]-]+)$")
 
 def parse_cli():
-    p = argparse.ArgumentParser(description="List all albums by artist name.")
+    p = argparse.ArgumentParser(description="Discover an artist's albums and add them to the artist config.")
     p.add_argument("--artist", required=True, help="Artist name, e.g. 'Paramore'")
+    p.add_argument("--folder", help="Artist folder under src/lyrics/ (default: the one whose ARTIST_ID matches, "
+                                    "else the artist name in snake_case)")
+    p.add_argument("--include", nargs="+", default=[], choices=["live", "remix"],
+                   help="Also add live and/or remix albums")
+    p.add_argument("--concurrency", type=int, default=4, help="Listing pages in flight at once (default: 4)")
+    p.add_argument("--write", action="store_true",
+                   help="Update <folder>.py, album_meta.json and album_map.json (default: only list)")
     return p.parse_args()
 
-def list_albums(artist_id: int) -> None:
-    page, total = 1, 0
-    base_url = f"https://genius.com/api/artists/{artist_id}/albums"
-    
-    while True:
-        r = requests.get(base_url, params={"page": page})
-        if r.status_code != 200:
-            print(f"❌ Failed to fetch page {page} – HTTP {r.status_code}")
-            break
+class Album:
+    def __init__(self, body: Dict[str, Any]) -> None:
+        self.id: int = body["id"]
+        self.path: str = body.get("api_path") or f"/albums/{body['id']}"
+        self.name: str = body["name"]
+        self.url: str = body["url"]
+        self.year: Optional[int] = (body.get("release_date_components") or {}).get("year")
+        self.kind = classify(self.name)
+        self.base = self.name  # the studio album a deluxe edition belongs to
+
+# (name without its trailing edition suffixes, those suffixes). Only suffixes carrying an
+# edition marker count, so a subtitle like "Title - Part Two" stays part of the name
+def split_edition(name: str) -> Tuple[str, List[str]]:
+    suffixes = []
+    match = _EDITION_SUFFIX_RE.search(name)
+    while match and match.start() > 0 and any(p.search(match.group(1)) for _, p in EDITION_PATTERNS):
+        suffixes.append(match.group(1))
+        name = name[:match.start()]
+        match = _EDITION_SUFFIX_RE.search(name)
+    return name, suffixes
+
+def classify(name: str) -> str:
+    _, suffixes = split_edition(name)
+    for kind, pattern in EDITION_PATTERNS:
+        if any(pattern.search(suffix) for suffix in suffixes):
+            return kind
+    return "album"
+
+# ───────────────────────────── FETCHING ──────────────────────────── #
+# One page of the artist's albums as (albums, next page). Only the site API lists albums;
+# when it leaves next_page out we keep going until a page comes back empty.
+def get_albums_page(artist_id: int, page: int) -> Tuple[List[Album], Optional[int]]:
+    r = genius_client().get(f"{WEB_API_ROOT}/artists/{artist_id}/albums", params={"page": page}, auth=False)
+    if r.status_code != 200:
+        raise RuntimeError(f"HTTP {r.status_code} on page {page}")
+    response = r.json()["response"]
+    return [Album(a) for a in response["albums"]], response.get("next_page", page + 1)
+
+def discover_albums(artist_id: int, concurrency: int = 4) -> List[Album]:
+    albums = [album for _, page in iter_pages(lambda n: get_albums_page(artist_id, n), 1, concurrency)
+              for album in page]
+    link_editions(albums)
+    return albums
+
+# Points each deluxe edition at its studio album ("Paramore (Deluxe Edition)" -> "Paramore",
+# matched case-insensitively so "RIOT! (…)" finds "Riot!"); an edition whose album Genius
+# doesn't list keeps the name without its suffix
+def link_editions(albums: List[Album]) -> None:
+    studio = {a.name.casefold(): a for a in albums if a.kind == "album"}
+    for album in albums:
+        if album.kind != "deluxe":
+            continue
+        stripped, _ = split_edition(album.name)
+        base = studio.get(stripped.casefold())
+        album.base = base.name if base else stripped
+        if album.year is None and base is not None:
+            album.year = base.year
+
+# Albums to add, in release order (editions after their album): not in ALBUMS yet and of
+# a kind this run adds
+def new_albums(albums: List[Album], known: Dict[str, str], include: Iterable[str] = ()) -> List[Album]:
+    wanted = {*DEFAULT_KINDS, *include}
+    return [a for a in sorted(albums, key=release_order) if a.path not in known and a.kind in wanted]
+
+def release_order(album: Album) -> Tuple[int, str, bool]:
+    return album.year or 9999, album.base.casefold(), album.kind != "album"
+
+# ───────────────────────────── CONFIG FILES ──────────────────────────── #
+# Literal module-level constants of an artist module as {name: (value, assignment node)},
+# read without importing it
+def module_constants(path: Path) -> Dict[str, Tuple[Any, ast.Assign]]:
+    constants = {}
+    for node in ast.parse(path.read_text(encoding="utf-8")).body:
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            try:
+                constants[node.targets[0].id] = (ast.literal_eval(node.value), node)
+            except ValueError:
+                pass
+    return constants
+
+# The folder of the artist module with this ARTIST_ID, else the artist name in snake_case
+def artist_folder(artist_id: int, name: str, root: Path = LYRICS_ROOT) -> str:
+    for module in sorted(root.glob("*/*.py")):
+        if module.stem == module.parent.name:
+            value, _ = module_constants(module).get("ARTIST_ID", (None, None))
+            if value == artist_id:
+                return module.stem
+    return re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
+
+def render_albums(albums: Dict[str, str]) -> str:
+    lines = [f"    {json.dumps(path)}: {json.dumps(name, ensure_ascii=False)}," for path, name in albums.items()]
+    return "ALBUMS = {\n" + "".join(line + "\n" for line in lines) + "}"
+
+def render_artist_module(artist_id: int, artist_name: str, albums: Dict[str, str]) -> str:
+    return f'''from pathlib import Path
+from lyrics.scraper import Scraper
+
+ARTIST_ID = {artist_id} # {artist_name}'s artist ID on Genius
+
+{render_albums(albums)}
+
+# Songs that don't have an album
+OTHER_SONGS = {{}}
 
-        albums = r.json()["response"]["albums"]
-        if not albums:
-            break
+# Songs for which there is trouble retrieving them
+EXTRA_SONG_API_PATHS = {{}}
 
-        for alb in albums:
-            print(f"{alb['name']} → ID: {alb['id']} → URL: {alb['url']}")
-        total += len(albums)
-        page += 1
+# Songs that are in multiple albums and aren't behaving how they need to be
+FORCE_ALBUM_OVERRIDES = {{}}
 
-    print(f"✅ {total} albums total")
+# Songs that are somehow duplicates / covers / etc.
+IGNORE_SONGS = {{}}
+
+if __name__ == "__main__":
+    Scraper(
+        artist_id=ARTIST_ID,
+        albums=ALBUMS,
+        force_album_overrides=FORCE_ALBUM_OVERRIDES,
+        ignore_songs=IGNORE_SONGS,
+        base_path=Path(__file__).parent,
+    ).run_from_cli()
+'''
+
+# album_meta.json keeps one tab-indented line per album
+def render_album_meta(meta: Dict[str, Dict[str, Any]]) -> str:
+    lines = ["\t" + json.dumps(name, ensure_ascii=False) + ": { "
+             + ", ".join(f"{json.dumps(k)}: {json.dumps(v, ensure_ascii=False)}" for k, v in entry.items())
+             + " }" for name, entry in meta.items()]
+    return "{\n" + ",\n".join(lines) + "\n}\n"
+
+# album_map.json keeps each artist's opening brace on its own line
+def render_album_map(album_map: Dict[str, Dict[str, List[str]]]) -> str:
+    blocks = []
+    for artist, albums in album_map.items():
+        lines = [f"    {json.dumps(name, ensure_ascii=False)}: {json.dumps(cats, ensure_ascii=False)}"
+                 for name, cats in albums.items()]
+        blocks.append(f"  {json.dumps(artist)}:\n  {{\n" + ",\n".join(lines) + "\n  }")
+    return "{\n" + ",\n".join(blocks) + "\n}"
+
+def _read_json(path: Path) -> Dict[str, Any]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8") or "{}")
+    except FileNotFoundError:
+        return {}
+
+def _image_name(album: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", album.lower()).strip("_") + ".webp"
+
+# Adds `new` albums to the artist module (created when missing), album_meta.json and
+# album_map.json; deluxe editions share their studio album's cover and category
+def write_albums(folder: str, artist_id: int, artist_name: str, new: List[Album],
+                 root: Path = LYRICS_ROOT) -> None:
+    module = root / folder / f"{folder}.py"
+    albums = {a.path: a.name for a in new}
+    if module.exists():
+        text = module.read_text(encoding="utf-8")
+        current, node = module_constants(module).get("ALBUMS", ({}, None))
+        if node is None:
+            sys.exit(f"❌ {module.name} has no literal ALBUMS dict to update")
+        lines = text.splitlines(keepends=True)
+        block = render_albums({**current, **albums}) + "\n"
+        text = "".join(lines[:node.lineno - 1]) + block + "".join(lines[node.end_lineno:])
+        atomic_write_text(module, text)
+    else:
+        module.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write_text(module, render_artist_module(artist_id, artist_name, albums))
+    print(f"📝 {len(albums)} albums added to {module.relative_to(root)}")
+
+    meta_path = root / "album_meta.json"
+    meta = _read_json(meta_path)
+    for album in new:
+        if album.name not in meta:
+            image = meta.get(album.base, {}).get("img") or _image_name(album.base)
+            meta[album.name] = {"year": album.year, "img": image}
+            if not (IMAGES_DIR / image).exists():
+                print(f"🖼️ No cover yet for {album.name}: add public/images/{image}")
+    atomic_write_text(meta_path, render_album_meta(meta))
+
+    map_path = root / "album_map.json"
+    album_map = _read_json(map_path)
+    categories = album_map.setdefault(folder, {})
+    for album in new:
+        categories.setdefault(album.name, [album.base])
+    atomic_write_text(map_path, render_album_map(album_map))
+    print("📝 album_meta.json and album_map.json updated")
 
 if __name__ == "__main__":
     cli = parse_cli()
     artist_id = artist_name_to_id(cli.artist)
-    
+
     if artist_id is None:
         sys.exit(f"❌ Could not find Genius artist‑id for '{cli.artist}'")
-        
-    list_albums(artist_id)
\ No newline at end of file
+
+    folder = cli.folder or artist_folder(artist_id, cli.artist)
+    module = LYRICS_ROOT / folder / f"{folder}.py"
+    known = module_constants(module).get("ALBUMS", ({}, None))[0] if module.exists() else {}
+
+    try:
+        albums = discover_albums(artist_id, cli.concurrency)
+    except Exception as e:
+        sys.exit(f"❌ Error fetching albums: {e}")
+
+    new = new_albums(albums, known, cli.include)
+    for album in sorted(albums, key=release_order):
+        mark = "✔️" if album.path in known else "➕" if album in new else "⏭️"
+        edition = f" of {album.base}" if album.kind == "deluxe" else ""
+        print(f"{mark} {album.name} → ID: {album.id} → {album.kind}{edition} ({album.year or '?'}) → URL: {album.url}")
+
+    skipped = sum(1 for a in albums if a.path not in known and a not in new)
+    print(f"✅ {len(albums)} albums total; {len(new)} new"
+          + (f", {skipped} live/remix skipped (--include adds them)" if skipped else ""))
+
+    if not new:
+        sys.exit(0)
+    if cli.write:
+        write_albums(folder, artist_id, cli.artist, new)
+    else:
+        print(f"ℹ️ Rerun with --write to add them to {folder}/{folder}.py, album_meta.json and album_map.json")
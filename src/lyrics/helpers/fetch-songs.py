@@ -1,55 +1,143 @@
-# Fetches all songs for a given artist name
+# Fetches all songs for a given artist name (pages are fetched several at a time over the shared client and written out as they arrive, in page order; an interrupted dump picks up after its last completed page with --resume)
 
 # Example use from CLI:
 # python -m lyrics.helpers.fetch-songs --artist "Paramore" --output "paramore_songs.json"
+# python -m lyrics.helpers.fetch-songs --artist "Paramore" --output "paramore_songs.ndjson" --concurrency 8
+# python -m lyrics.helpers.fetch-songs --artist "Paramore" --output "paramore_songs.ndjson" --resume
 
 from __future__ import annotations
-import argparse, json, requests, sys
-from lyrics.config import API_ROOT, CLIENT_ACCESS_TOKEN, artist_name_to_id
-
-HEADERS = {"Authorization": f"Bearer {CLIENT_ACCESS_TOKEN}"}
+import argparse, json, os, sys
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+from lyrics.client import iter_pages
+from lyrics.config import API_ROOT, artist_name_to_id, genius_client
 
 def parse_cli():
     p = argparse.ArgumentParser(description="Dump every song for an artist.")
     p.add_argument("--artist", required=True)
     p.add_argument("--output", default="all_songs.json",
-                   help="File name to save (default: all_songs.json)")
+                   help="File name to save (default: all_songs.json; *.ndjson writes one song per line)")
+    p.add_argument("--concurrency", type=int, default=4,
+                   help="Pages in flight at once (default: 4)")
+    p.add_argument("--per-page", type=int, default=50, help="Songs per page (Genius allows up to 50)")
+    p.add_argument("--resume", action="store_true",
+                   help="Continue an interrupted dump after its last completed page")
     return p.parse_args()
 
-def get_all_songs(artist_id: int) -> list[dict]:
-    page, per_page, songs = 1, 50, []
+# ───────────────────────────── FETCHING ──────────────────────────── #
+# One page of /artists/{id}/songs as (songs, next page)
+def get_songs_page(artist_id: int, page: int, per_page: int = 50) -> Tuple[List[dict], Optional[int]]:
+    r = genius_client().get(f"{API_ROOT}/artists/{artist_id}/songs",
+                            params={"page": page, "per_page": per_page, "sort": "title"})
+    if r.status_code != 200:
+        raise RuntimeError(f"HTTP {r.status_code} on page {page}: {r.text[:200]}")
+    response = r.json()["response"]
+    songs = [{
+        "title": s["title"],
+        "id":    s["id"],
+        "url":   s["url"],
+        "primary_artist": s["primary_artist"]["name"]
+    } for s in response["songs"]]
+    return songs, response.get("next_page")
+
+# (page, songs) in page order from `start` on, `concurrency` pages in flight at once
+def iter_song_pages(artist_id: int, start: int = 1, per_page: int = 50,
+                    concurrency: int = 4) -> Iterator[Tuple[int, List[dict]]]:
+    return iter_pages(lambda page: get_songs_page(artist_id, page, per_page), start, concurrency)
+
+# ───────────────────────────── OUTPUT ──────────────────────────── #
+# Writes songs as they come, either as one JSON array (laid out like json.dump(indent=2))
+# or as NDJSON. After every page the file is synced and `<output>.progress` records the
+# page, song count and byte offset, so a resumed dump truncates any half-written page
+# and carries on from the next one.
+class SongDump:
+    def __init__(self, path: Path, artist_id: int, resume: bool = False) -> None:
+        self.path = path
+        self.progress_path = path.with_name(path.name + ".progress")
+        self.ndjson = path.suffix == ".ndjson"
+        self.artist_id = artist_id
+        self.page, self.count, offset = 0, 0, 0
+
+        state = self._load_progress() if resume else None
+        if state is not None and path.exists():
+            self.page, self.count, offset = state["page"], state["count"], state["offset"]
+            self._f: BinaryIO = path.open("r+b")
+            self._f.truncate(offset)
+            self._f.seek(offset)
+            print(f"♻️ Resuming after page {self.page} ({self.count} songs)")
+        else:
+            self._f = path.open("wb")
+            if not self.ndjson:
+                self._f.write(b"[")
+
+    def write_page(self, page: int, songs: List[dict]) -> None:
+        for song in songs:
+            if self.ndjson:
+                self._f.write(json.dumps(song, ensure_ascii=False).encode("utf-8") + b"\n")
+            else:
+                item = json.dumps(song, indent=2, ensure_ascii=False).replace("\n", "\n  ")
+                self._f.write(((",\n  " if self.count else "\n  ") + item).encode("utf-8"))
+            self.count += 1
+        self._f.flush()
+        os.fsync(self._f.fileno())
+        self.page = page
+        self.progress_path.write_text(json.dumps({
+            "artist_id": self.artist_id, "page": page,
+            "count": self.count, "offset": self._f.tell()}))
+
+    # Closes the array and drops the progress file; only a complete dump is finished
+    def finish(self) -> None:
+        if not self.ndjson:
+            self._f.write(b"\n]" if self.count else b"]")
+        self._f.close()
+        self.progress_path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        if not self._f.closed:
+            self._f.close()
+
+    def _load_progress(self) -> Optional[Dict[str, Any]]:
+        try:
+            state = json.loads(self.progress_path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if state.get("artist_id") != self.artist_id:
+            print(f"⚠️ {self.progress_path.name} is for another artist. Starting over.")
+            return None
+        return state
+
+# Streams every song of the artist into `output`; False when it stopped part-way
+def dump_all_songs(artist_id: int, output: Path, *, per_page: int = 50,
+                   concurrency: int = 4, resume: bool = False) -> bool:
+    dump = SongDump(output, artist_id, resume=resume)
     print("🔍 Fetching songs …")
-    while True:
-        r = requests.get(f"{API_ROOT}/artists/{artist_id}/songs",
-                         params={"page": page, "per_page": per_page, "sort": "title"},
-                         headers=HEADERS)
-        if r.status_code != 200:
-            print("❌ Error fetching songs:", r.text)
-            break
-        batch = r.json()["response"]["songs"]
-        if not batch:
-            break
-        songs.extend({
-            "title": s["title"],
-            "id":    s["id"],
-            "url":   s["url"],
-            "primary_artist": s["primary_artist"]["name"]
-        } for s in batch)
-        print(f"📄 Page {page}: +{len(batch)} songs")
-        page += 1
-    print(f"✅ Total songs fetched: {len(songs)}")
-    return songs
+    try:
+        for page, songs in iter_song_pages(artist_id, dump.page + 1, per_page, concurrency):
+            dump.write_page(page, songs)
+            print(f"📄 Page {page}: +{len(songs)} songs")
+    except Exception as e:
+        print(f"❌ Error fetching songs: {e}")
+        print(f"💾 Kept {dump.count} songs; rerun with --resume to continue after page {dump.page}")
+        dump.close()
+        return False
+    dump.finish()
+    print(f"✅ Total songs fetched: {dump.count}")
+    return True
+
+# Whole catalogue in memory, for callers that want the list itself
+def get_all_songs(artist_id: int, per_page: int = 50, concurrency: int = 4) -> list[dict]:
+    return [song for _, songs in iter_song_pages(artist_id, 1, per_page, concurrency)
+            for song in songs]
 
 if __name__ == "__main__":
     cli = parse_cli()
     artist_id = artist_name_to_id(cli.artist)
-    
+
     if artist_id is None:
         sys.exit(f"❌ Could not find Genius artist‑id for '{cli.artist}'")
-    
-    data = get_all_songs(artist_id)
-    
-    with open(cli.output, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
-        
-    print(f"\n🎧 Song list saved to {cli.output}")
\ No newline at end of file
+
+    if not dump_all_songs(artist_id, Path(cli.output), per_page=cli.per_page,
+                          concurrency=cli.concurrency, resume=cli.resume):
+        sys.exit(1)
+
+    print(f"\n🎧 Song list saved to {cli.output}")
@@ -1,79 +1,108 @@
-# Removes an entire album (and its songs) from local scrape
+# Removes entire albums (and their songs) from local scrape (one or many per run: every artefact is read and rewritten once for the whole batch)
 
 # Example use from CLI:
 # python -m lyrics.helpers.remove-scraped-album --artist paramore --album "All We Know Is Falling (10th Anniversary Edition)"
+# python -m lyrics.helpers.remove-scraped-album --artist paramore --album "Riot!" --album "brand new eyes"
+# python -m lyrics.helpers.remove-scraped-album --artist paramore --file albums.txt   (one album title per line)
 
 from __future__ import annotations
 from pathlib import Path
-import argparse, json, pandas as pd
+from typing import Iterable
+import argparse, json
+from lyrics import compact
+from lyrics.artefacts import artist_paths, atomic_write_text, drop_csv_rows, read_entries
+from lyrics.storage import SQLiteStore
 
 def parse_cli() -> argparse.Namespace:
     p = argparse.ArgumentParser(
-        description="Remove an entire album (and its songs) from local scrape.")
+        description="Remove entire albums (and their songs) from local scrape.")
     p.add_argument("--artist", required=True,
                    help="Display name, e.g. 'paramore' or 'hayley'")
-    p.add_argument("--album", required=True,
-                   help="Exact album title as it appears in CSV")
-    return p.parse_args()
-
-def album_paths(artist: str) -> dict[str, Path]:
-    base = Path(__file__).resolve().parents[1] / artist.lower()
-    return {
-        "songs":  base / "songs.csv",
-        "lyrics": base / "lyrics.csv",
-        "lyrics_json":  base / "lyrics.json",
-        "titles": base / "song_titles.txt",
-        "scraped": base / "scraped_urls.json",
-    }
+    p.add_argument("--album", action="append", default=[],
+                   help="Exact album title as it appears in CSV (repeatable)")
+    p.add_argument("--file", type=Path,
+                   help="File with one album title per line")
+    args = p.parse_args()
+    if args.file:
+        args.album.extend(read_entries(args.file))
+    if not args.album:
+        p.error("nothing to remove: pass --album or --file")
+    return args
 
-def remove_scraped_album(artist: str, album: str) -> dict[str, int]:
-    paths = album_paths(artist)
-    
-    removed = {k: 0 for k in ["songs.csv", "lyrics.csv", "song_titles.txt", "scraped_urls.json", "lyrics.json"]}
+def remove_scraped_albums(artist: str, albums: Iterable[str]) -> dict[str, int]:
+    paths = artist_paths(artist)
+    albums = set(albums)
+
+    removed = {k: 0 for k in ["songs.csv", "lyrics.csv", "song_titles.txt", "scraped_urls.json", "lyrics.json", "lyrics.db"]}
 
     # songs.csv
+    titles = set()
     if paths["songs"].exists():
-        df = pd.read_csv(paths["songs"])
-        titles = set(df[df["Album"] == album]["Title"])
+        titles = {row["Title"] for row in drop_csv_rows(paths["songs"], lambda row: row["Album"] in albums)}
         removed["songs.csv"] = len(titles)
-        df = df[df["Album"] != album]
-        df.to_csv(paths["songs"], index=False)
-    else:
-        titles = set()
 
     # lyrics.csv
     if paths["lyrics"].exists():
-        df = pd.read_csv(paths["lyrics"])
-        orig = len(df)
-        df = df[df["Album"] != album]
-        removed["lyrics.csv"] = orig - len(df)
-        df.to_csv(paths["lyrics"], index=False)
+        removed["lyrics.csv"] = len(drop_csv_rows(paths["lyrics"], lambda row: row["Album"] in albums))
 
     # song_titles.txt
     if paths["titles"].exists():
         lines = paths["titles"].read_text().splitlines()
         kept = [l for l in lines if l not in titles]
         removed["song_titles.txt"] = len(lines) - len(kept)
-        paths["titles"].write_text("\n".join(kept))
+        if removed["song_titles.txt"]:
+            atomic_write_text(paths["titles"], "\n".join(kept))
 
     # scraped_urls.json
+    dropped_urls = set()
     if paths["scraped"].exists():
         data = json.loads(paths["scraped"].read_text() or "{}")
         orig = len(data)
-        data = {u: a for u, a in data.items() if a != album}
+        dropped_urls = {u for u, a in data.items() if a in albums}
+        data = {u: a for u, a in data.items() if a not in albums}
         removed["scraped_urls.json"] = orig - len(data)
-        paths["scraped"].write_text(json.dumps(data, indent=2))
+        if removed["scraped_urls.json"]:
+            atomic_write_text(paths["scraped"], json.dumps(data, indent=2))
 
     # lyrics.json
     if paths["lyrics_json"].exists():
-        data = json.loads(paths["lyrics_json"].read_text() or "{}")
-        if album in data:
-            removed["lyrics.json"] = len(data[album])
+        raw = json.loads(paths["lyrics_json"].read_text(encoding="utf-8") or "{}")
+        data = compact.decode(raw)
+        hits = albums & data.keys()
+        for album in hits:
+            removed["lyrics.json"] += len(data[album])
             del data[album]
-            paths["lyrics_json"].write_text(json.dumps(data, indent=4))
+        if hits:
+            # Keep whichever layout the file was written in
+            text = (compact.dumps(compact.encode_albums(data)) if compact.is_compact(raw)
+                    else json.dumps(data, indent=4))
+            atomic_write_text(paths["lyrics_json"], text)
+
+    # lyric_hashes.json
+    if titles and paths["hashes"].exists():
+        hashes = json.loads(paths["hashes"].read_text() or "{}")
+        kept_hashes = {t: h for t, h in hashes.items() if t not in titles}
+        if len(kept_hashes) != len(hashes):
+            atomic_write_text(paths["hashes"], json.dumps(kept_hashes, indent=2))
+
+    # song_versions.json (--refresh runs)
+    if dropped_urls and paths["versions"].exists():
+        versions = json.loads(paths["versions"].read_text() or "{}")
+        kept_versions = {u: v for u, v in versions.items() if u not in dropped_urls}
+        if len(kept_versions) != len(versions):
+            atomic_write_text(paths["versions"], json.dumps(kept_versions, indent=2, sort_keys=True))
+
+    # lyrics.db (--sqlite runs)
+    if paths["db"].exists():
+        with SQLiteStore(paths["db"]) as store:
+            removed["lyrics.db"] = store.delete_albums(albums)
 
     return removed
 
+# Single-album form kept for callers of the old helper
+def remove_scraped_album(artist: str, album: str) -> dict[str, int]:
+    return remove_scraped_albums(artist, [album])
+
 if __name__ == "__main__":
     cli = parse_cli()
-    print(remove_scraped_album(cli.artist, cli.album))
\ No newline at end of file
+    print(remove_scraped_albums(cli.artist, cli.album))
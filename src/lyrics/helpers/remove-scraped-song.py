@@ -1,74 +1,102 @@
-# Removes an entire song from local scrape
+# Removes songs from local scrape (one or many per run: every artefact is read and rewritten once for the whole batch)
 
 # Example use from CLI:
 # python -m lyrics.helpers.remove-scraped-song --artist paramore --song "Misery Business (Live from London)" --url "https://genius.com/Paramore-misery-business-live-from-london-lyrics"
+# python -m lyrics.helpers.remove-scraped-song --artist paramore --song "Decode (Live at Red Rocks)" --song "Proof (Live at Red Rocks)"
+# python -m lyrics.helpers.remove-scraped-song --artist paramore --file live_songs.txt   (one "Title" or "Title<TAB>URL" per line)
 
 from __future__ import annotations
-import argparse, json, pandas as pd
+import argparse, json
 from pathlib import Path
+from typing import Iterable
+from lyrics import compact
+from lyrics.artefacts import artist_paths, atomic_write_text, drop_csv_rows, read_entries
+from lyrics.storage import SQLiteStore
 
 def parse_cli():
-    p = argparse.ArgumentParser(description="Delete a single song from local data.")
+    p = argparse.ArgumentParser(description="Delete songs from local data.")
     p.add_argument("--artist", required=True, help ="Artist folder, e.g. 'paramore' or 'hayley'")
-    p.add_argument("--song",  required=True, help="Exact Title column value")
-    p.add_argument("--url",    help="Original Genius URL (removes from scraped_urls)")
-    return p.parse_args()
+    p.add_argument("--song", action="append", default=[], help="Exact Title column value (repeatable)")
+    p.add_argument("--url", action="append", default=[], help="Original Genius URL (removes from scraped_urls, repeatable)")
+    p.add_argument("--file", type=Path, help="File with one 'Title' or 'Title<TAB>URL' per line")
+    args = p.parse_args()
+    if args.file:
+        for entry in read_entries(args.file):
+            title, _, url = entry.partition("\t")
+            args.song.append(title.strip())
+            if url.strip():
+                args.url.append(url.strip())
+    if not args.song and not args.url:
+        p.error("nothing to remove: pass --song/--url or --file")
+    return args
 
-def artist_paths(artist: str) -> dict[str, Path]:
-    base = Path(__file__).resolve().parents[1] / artist.lower()
-    return {
-        "songs":  base / "songs.csv",
-        "lyrics": base / "lyrics.csv",
-        "lyrics_json":  base / "lyrics.json",
-        "titles": base / "song_titles.txt",
-        "scraped": base / "scraped_urls.json",
-    }
-
-def remove_song(artist: str, song: str, url: str | None) -> dict[str, int]:
+def remove_songs(artist: str, songs: Iterable[str], urls: Iterable[str] = ()) -> dict[str, int]:
     p = artist_paths(artist)
+    songs, urls = set(songs), set(urls)
     removed = {k: 0 for k in ["songs.csv", "lyrics.csv",
                               "song_titles.txt", "scraped_urls.json",
-                              "lyrics.json"]}
+                              "lyrics.json", "lyrics.db"]}
 
-    if p["songs"].exists():
-        df = pd.read_csv(p["songs"])
-        orig = len(df)
-        df = df[df["Title"] != song]
-        removed["songs.csv"] = orig - len(df)
-        df.to_csv(p["songs"], index=False)
+    if songs and p["songs"].exists():
+        removed["songs.csv"] = len(drop_csv_rows(p["songs"], lambda row: row["Title"] in songs))
 
-    if p["lyrics"].exists():
-        df = pd.read_csv(p["lyrics"])
-        orig = len(df)
-        df = df[df["Song"] != song]
-        removed["lyrics.csv"] = orig - len(df)
-        df.to_csv(p["lyrics"], index=False)
+    if songs and p["lyrics"].exists():
+        removed["lyrics.csv"] = len(drop_csv_rows(p["lyrics"], lambda row: row["Song"] in songs))
 
-    if p["titles"].exists():
+    if songs and p["titles"].exists():
         lines = p["titles"].read_text().splitlines()
-        if song in lines:
-            removed["song_titles.txt"] = 1
-            p["titles"].write_text("\n".join(l for l in lines if l != song))
+        kept = [l for l in lines if l not in songs]
+        removed["song_titles.txt"] = len(lines) - len(kept)
+        if removed["song_titles.txt"]:
+            atomic_write_text(p["titles"], "\n".join(kept))
 
-    if url and p["scraped"].exists():
+    if urls and p["scraped"].exists():
         data = json.loads(p["scraped"].read_text() or "{}")
-        if url in data:
-            del data[url]
-            removed["scraped_urls.json"] = 1
-            p["scraped"].write_text(json.dumps(data, indent=2))
+        kept_urls = {u: a for u, a in data.items() if u not in urls}
+        removed["scraped_urls.json"] = len(data) - len(kept_urls)
+        if removed["scraped_urls.json"]:
+            atomic_write_text(p["scraped"], json.dumps(kept_urls, indent=2))
 
-    if p["lyrics_json"].exists():
-        data = json.loads(p["lyrics_json"].read_text() or "{}")
+    if songs and p["lyrics_json"].exists():
+        raw = json.loads(p["lyrics_json"].read_text(encoding="utf-8") or "{}")
+        data = compact.decode(raw)
         for album in list(data.keys()):
-            if song in data[album]:
+            hits = songs & data[album].keys()
+            for song in hits:
                 del data[album][song]
-                removed["lyrics.json"] += 1
-                if not data[album]:
-                    del data[album]
-        p["lyrics_json"].write_text(json.dumps(data, indent=4))
+            removed["lyrics.json"] += len(hits)
+            if hits and not data[album]:
+                del data[album]
+        if removed["lyrics.json"]:
+            # Keep whichever layout the file was written in
+            text = (compact.dumps(compact.encode_albums(data)) if compact.is_compact(raw)
+                    else json.dumps(data, indent=4))
+            atomic_write_text(p["lyrics_json"], text)
+
+    # Dropped songs are simply no longer hashed; nothing else needs rebuilding
+    if songs and p["hashes"].exists():
+        hashes = json.loads(p["hashes"].read_text() or "{}")
+        kept_hashes = {t: h for t, h in hashes.items() if t not in songs}
+        if len(kept_hashes) != len(hashes):
+            atomic_write_text(p["hashes"], json.dumps(kept_hashes, indent=2))
+
+    # Version stamps from --refresh runs, keyed by URL
+    if urls and p["versions"].exists():
+        versions = json.loads(p["versions"].read_text() or "{}")
+        kept_versions = {u: v for u, v in versions.items() if u not in urls}
+        if len(kept_versions) != len(versions):
+            atomic_write_text(p["versions"], json.dumps(kept_versions, indent=2, sort_keys=True))
+
+    if p["db"].exists():
+        with SQLiteStore(p["db"]) as store:
+            removed["lyrics.db"] = store.delete_songs(songs) + store.delete_urls(urls)
 
     return removed
 
+# Single-song form kept for callers of the old helper
+def remove_song(artist: str, song: str, url: str | None) -> dict[str, int]:
+    return remove_songs(artist, [song], [url] if url else [])
+
 if __name__ == "__main__":
     cli = parse_cli()
-    print(remove_song(cli.artist, cli.song, cli.url))
\ No newline at end of file
+    print(remove_songs(cli.artist, cli.song, cli.url))
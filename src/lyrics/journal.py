@@ -0,0 +1,69 @@
+# Append-only checkpoint of a scrape in progress: one NDJSON record per lyrics page as soon as it is fetched, flushed and fsynced, so a crash or Ctrl-C loses at most the pages in flight. Scraper._run replays it on the next start (those pages are not fetched again) and clears it once songs.csv / scraped_urls.json are written.
+
+# Example use:
+# journal = ScrapeJournal(Path("paramore/journal.ndjson"))
+# journal.append({"url": url, "lyrics": lyrics})
+# for record in journal.replay(): ...
+# journal.clear()
+
+from __future__ import annotations
+import json, os
+from pathlib import Path
+from typing import Any, Dict, List, Optional, TextIO
+
+class ScrapeJournal:
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self._file: Optional[TextIO] = None
+
+    def append(self, record: Dict[str, Any]) -> None:
+        if self._file is None:
+            self._drop_torn_tail()
+            self._file = self.path.open("a", encoding="utf-8")
+        self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    # Records in the order they were written; a torn last line (killed mid-write) is dropped
+    def replay(self) -> List[Dict[str, Any]]:
+        if not self.path.exists():
+            return []
+        records = []
+        for n, line in enumerate(self.path.read_text(encoding="utf-8").splitlines(), 1):
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                print(f"⚠️ Skipping unreadable journal line {n} in {self.path}")
+        return records
+
+    # Cuts a torn last line (killed mid-write) off the file, so appending after a resume
+    # starts a line of its own instead of gluing the next record onto the partial one
+    def _drop_torn_tail(self) -> None:
+        try:
+            f = self.path.open("r+b")
+        except FileNotFoundError:
+            return
+        with f:
+            end = pos = f.seek(0, os.SEEK_END)
+            while pos > 0:
+                step = min(pos, 4096)
+                f.seek(pos - step)
+                newline = f.read(step).rfind(b"\n")
+                pos -= step
+                if newline >= 0:
+                    pos += newline + 1
+                    break
+            if pos < end:
+                f.truncate(pos)
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # Everything in the journal has made it into the regular artefacts
+    def clear(self) -> None:
+        self.close()
+        self.path.unlink(missing_ok=True)
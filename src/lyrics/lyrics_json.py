@@ -0,0 +1,127 @@
+# Writes one artist's lyrics.json song by song, in the verbose layout (what json.dump(albums, indent=4) gives) or the compact one (lyrics/compact.py), holding only one song's lines at a time.
+# The album -> song order is fixed up front from one cheap pass over songs.csv or lyrics.csv; each song's block is written the moment its rows are handed over, and a song that turns up before its place (its album's songs aren't next to each other in the CSV) waits in a temporary spool file until then.
+# The output is byte for byte the same as grouping every row into album -> song -> lines first and dumping that.
+
+# Example use:
+# order = album_order((album or title, title) for title, album in csv_rows(path, ["Song", "Album"]))
+# with LyricsJsonWriter(base / "lyrics.json", order) as out:
+#     out.add(album, title, [(lyric, prev, next, multiplicity), ...])
+
+from __future__ import annotations
+import json, shutil, tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, TextIO, Tuple
+from lyrics import compact
+from lyrics.artefacts import atomic_writer
+
+Row = Sequence[Any]  # (lyric, prev, next, multiplicity), as in lyrics.csv
+_SONG, _LINE, _FIELD = " " * 8, " " * 12, " " * 16  # verbose indent of songs, lines, fields
+
+# (album, title) pairs grouped by album, albums in order of first appearance
+def album_order(pairs: Iterable[Tuple[str, str]]) -> List[Tuple[str, str]]:
+    albums: Dict[str, Dict[str, None]] = {}
+    for album, title in pairs:
+        albums.setdefault(album, {})[title] = None
+    return [(album, title) for album, titles in albums.items() for title in titles]
+
+class LyricsJsonWriter:
+    def __init__(self, path: Path, order: Iterable[Tuple[str, str]], compact_layout: bool = False) -> None:
+        self.path = path
+        self.compact = compact_layout
+        self._order = list(order)
+        self._place = {key: i for i, key in enumerate(self._order)}
+        self._next = 0
+        self._spooled: Dict[Tuple[str, str], int] = {}  # key -> offset of its rows in the spool
+        self._spool: Optional[TextIO] = None
+        self._album: Optional[str] = None  # album whose object is open
+        self._table = compact.StringTable()
+
+    def __enter__(self) -> "LyricsJsonWriter":
+        self._writer = atomic_writer(self.path)
+        self._out = self._writer.__enter__()
+        # Compact files list the string table first, and it is only complete at the end,
+        # so the albums object is written to a scratch file and copied in after it
+        self._body = tempfile.TemporaryFile("w+", encoding="utf-8") if self.compact else self._out
+        self._body.write("{")
+        return self
+
+    def __exit__(self, *exc) -> None:
+        try:
+            if exc[0] is None:
+                self._finish()
+        finally:
+            if self._spool is not None:
+                self._spool.close()
+            if self.compact:
+                self._body.close()
+            self._writer.__exit__(*exc)
+
+    # Hands over one song's rows; written now if it is the next song, spooled otherwise
+    def add(self, album: str, title: str, rows: Sequence[Row]) -> None:
+        key = (album, title)
+        place = self._place.get(key)
+        if place is None or place < self._next or key in self._spooled:
+            print(f"⚠️ '{title}' ({album}) came up twice or out of nowhere; keeping its first rows")
+            return
+        if place > self._next:
+            if self._spool is None:
+                self._spool = tempfile.TemporaryFile("w+", encoding="utf-8")
+            self._spool.seek(0, 2)
+            self._spooled[key] = self._spool.tell()
+            self._spool.write(json.dumps(rows) + "\n")
+            return
+        self._emit(album, title, rows)
+        self._next += 1
+        self._drain()
+
+    # Writes spooled songs whose turn has come
+    def _drain(self) -> None:
+        while self._next < len(self._order) and self._order[self._next] in self._spooled:
+            album, title = self._order[self._next]
+            self._spool.seek(self._spooled.pop((album, title)))
+            self._emit(album, title, json.loads(self._spool.readline()))
+            self._next += 1
+
+    # Songs that never got rows are left out (as they would be with no rows to group)
+    def _finish(self) -> None:
+        while self._next < len(self._order):
+            if self._order[self._next] not in self._spooled:
+                self._next += 1
+            self._drain()
+        if self._album is not None:
+            self._body.write("}" if self.compact else "\n    }")
+        self._body.write("}" if self.compact or self._album is None else "\n}")
+
+        if self.compact:
+            self._out.write('{"format":' + compact.dumps(compact.COMPACT_FORMAT)
+                            + ',"strings":' + compact.dumps(self._table.strings) + ',"albums":')
+            self._body.seek(0)
+            shutil.copyfileobj(self._body, self._out)
+            self._out.write("}")
+
+    def _emit(self, album: str, title: str, rows: Sequence[Row]) -> None:
+        if not rows:
+            return
+        first_song = album != self._album
+        if first_song:
+            if self.compact:
+                self._body.write(("}," if self._album is not None else "") + compact.dumps(album) + ":{")
+            else:
+                self._body.write(("\n    }," if self._album is not None else "")
+                                 + "\n    " + json.dumps(album) + ": {")
+            self._album = album
+
+        if self.compact:
+            self._body.write(("" if first_song else ",") + compact.dumps(title) + ":"
+                             + compact.dumps(compact.encode_song_rows(rows, self._table)))
+        else:
+            self._body.write(("" if first_song else ",") + "\n" + _SONG + json.dumps(title) + ": "
+                             + _verbose_song(rows))
+
+# One song's lines as json.dump(..., indent=4) lays them out at song depth
+def _verbose_song(rows: Sequence[Row]) -> str:
+    lines = ",\n".join(
+        f'{_LINE}{{\n{_FIELD}"lyric": {json.dumps(lyric)},\n{_FIELD}"prev": {json.dumps(prev or "")},\n'
+        f'{_FIELD}"next": {json.dumps(next_ or "")},\n{_FIELD}"multiplicity": {int(multiplicity)}\n{_LINE}}}'
+        for lyric, prev, next_, multiplicity in rows)
+    return f"[\n{lines}\n{_SONG}]"
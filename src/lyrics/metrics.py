@@ -0,0 +1,144 @@
+# Counters and latency histograms for a scrape (API pagination, page navigation, lyrics wait, cleaning, artefact writing, HTTP requests, retries, cache hits, skips), written as a JSON run report and optionally as a Prometheus text file for node_exporter's textfile collector.
+
+# Example use:
+# metrics = Metrics()
+# with metrics.timer("stage_seconds", stage="cleaning"):
+#     ...
+# metrics.inc("songs_skipped", reason="ignored")
+# metrics.write_json(Path("run_report.json"))
+# metrics.write_prometheus(Path("/var/lib/node_exporter/paramore.prom"))
+
+from __future__ import annotations
+import json, threading, time
+from bisect import bisect_left
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Tuple
+from lyrics.artefacts import atomic_write_text
+
+# Upper bounds (seconds) of the histogram buckets; +Inf is implied
+BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+PROMETHEUS_PREFIX = "lyrics_"
+
+Key = Tuple[str, Tuple[Tuple[str, str], ...]]  # (name, sorted label pairs)
+
+class Histogram:
+    def __init__(self) -> None:
+        self.counts = [0] * (len(BUCKETS) + 1)  # per bucket, not cumulative; last is +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(BUCKETS, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def as_dict(self) -> Dict[str, Any]:
+        cumulative, buckets = 0, {}
+        for bound, n in zip(BUCKETS + (float("inf"),), self.counts):
+            cumulative += n
+            buckets["+Inf" if bound == float("inf") else f"{bound:g}"] = cumulative
+        return {"count": self.count, "sum": round(self.sum, 6),
+                "mean": round(self.sum / self.count, 6) if self.count else 0.0,
+                "min": round(self.min, 6) if self.count else 0.0,
+                "max": round(self.max, 6), "buckets": buckets}
+
+class Metrics:
+    def __init__(self) -> None:
+        self.started = time.time()
+        self._counters: Dict[Key, float] = {}
+        self._histograms: Dict[Key, Histogram] = {}
+        self._lock = threading.Lock()
+
+    # ───────────────────────────── RECORDING ──────────────────────────── #
+    def inc(self, name: str, n: float = 1, **labels: str) -> None:
+        key = _key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + n
+
+    def observe(self, name: str, seconds: float, **labels: str) -> None:
+        key = _key(name, labels)
+        with self._lock:
+            hist = self._histograms.get(key)
+            if hist is None:
+                hist = self._histograms[key] = Histogram()
+            hist.observe(seconds)
+
+    # Times the block (also when it raises); usable around awaits too
+    @contextmanager
+    def timer(self, name: str, **labels: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def counter(self, name: str, **labels: str) -> float:
+        return self._counters.get(_key(name, labels), 0)
+
+    def histogram(self, name: str, **labels: str) -> Histogram:
+        return self._histograms.get(_key(name, labels)) or Histogram()
+
+    # ───────────────────────────── REPORTS ──────────────────────────── #
+    def report(self, **info: Any) -> Dict[str, Any]:
+        with self._lock:
+            counters = {_series(k): v for k, v in sorted(self._counters.items())}
+            histograms = {_series(k): h.as_dict() for k, h in sorted(self._histograms.items())}
+        return {**info,
+                "started": time.strftime("%Y-%m-%dT%H:%M:%S%z", time.localtime(self.started)),
+                "duration_seconds": round(time.time() - self.started, 3),
+                "counters": counters, "histograms": histograms}
+
+    def write_json(self, path: Path, **info: Any) -> None:
+        atomic_write_text(path, json.dumps(self.report(**info), indent=2, ensure_ascii=False))
+
+    def write_prometheus(self, path: Path, **labels: str) -> None:
+        atomic_write_text(path, self.prometheus(**labels))
+
+    # Text exposition format; `labels` (e.g. artist="paramore") are added to every series
+    def prometheus(self, **labels: str) -> str:
+        lines: List[str] = []
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(self._histograms.items())
+
+        typed = set()
+        for (name, pairs), value in counters:
+            metric = f"{PROMETHEUS_PREFIX}{name}_total"
+            if metric not in typed:
+                lines.append(f"# TYPE {metric} counter")
+                typed.add(metric)
+            lines.append(f"{metric}{_labels(pairs, labels)} {value:g}")
+
+        for (name, pairs), hist in histograms:
+            metric = f"{PROMETHEUS_PREFIX}{name}"
+            if metric not in typed:
+                lines.append(f"# TYPE {metric} histogram")
+                typed.add(metric)
+            for bound, cumulative in hist.as_dict()["buckets"].items():
+                lines.append(f"{metric}_bucket{_labels(pairs, labels, le=bound)} {cumulative}")
+            lines.append(f"{metric}_sum{_labels(pairs, labels)} {hist.sum:.6f}")
+            lines.append(f"{metric}_count{_labels(pairs, labels)} {hist.count}")
+        return "\n".join(lines) + "\n"
+
+# ───────────────────────────── HELPERS ────────────────────────── #
+def _key(name: str, labels: Dict[str, str]) -> Key:
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+# "name{a=1,b=2}" for the JSON report
+def _series(key: Key) -> str:
+    name, pairs = key
+    return f"{name}{{{','.join(f'{k}={v}' for k, v in pairs)}}}" if pairs else name
+
+def _labels(pairs: Tuple[Tuple[str, str], ...], extra: Dict[str, str], **more: str) -> str:
+    merged = {**extra, **dict(pairs), **more}
+    if not merged:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in merged.items()) + "}"
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
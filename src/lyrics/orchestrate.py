@@ -0,0 +1,141 @@
+# Refreshes every artist in one command: discovers the artist modules (lyrics/<name>/<name>.py with ARTIST_ID, ALBUMS, ...), runs their Scrapers in a process pool, then runs helpers/combine.py once.
+# All workers share one cap on running browsers (a semaphore handed to every BrowserPool) and split the API rate limit between them, so N artists in parallel hit Genius no harder than one.
+
+# Example use from CLI:
+# python -m lyrics.orchestrate --headless
+# python -m lyrics.orchestrate --artists paramore hayley --jobs 2 --max-browsers 1 --concurrency 8
+# python -m lyrics.orchestrate --offline --no-combine
+# python -m lyrics.orchestrate --refresh --concurrency 8
+
+from __future__ import annotations
+import argparse, importlib, multiprocessing, os, time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Tuple
+from lyrics.client import TokenBucket
+from lyrics.config import RATE_BURST, RATE_LIMIT, genius_client
+from lyrics.helpers.combine import combine_artists, default_artists
+from lyrics.scraper import Scraper
+
+LYRICS_ROOT = Path(__file__).resolve().parent
+
+# Module constant -> Scraper keyword; ARTIST_ID and ALBUMS are required
+ARTIST_SETTINGS = {
+    "ARTIST_ID": "artist_id",
+    "ALBUMS": "albums",
+    "OTHER_SONGS": "other_songs",
+    "EXTRA_SONG_API_PATHS": "extra_song_api_paths",
+    "FORCE_ALBUM_OVERRIDES": "force_album_overrides",
+    "IGNORE_SONGS": "ignore_songs",
+}
+
+def parse_cli() -> argparse.Namespace:
+    ap = argparse.ArgumentParser(description="Scrape every artist in parallel, then combine once.")
+    ap.add_argument("--artists", nargs="+", help="Folder names under src/lyrics/ (default: every artist module)")
+    ap.add_argument("--jobs", type=int, help="Worker processes (default: one per artist, at most one per core)")
+    ap.add_argument("--max-browsers", type=int, default=2, help="Chromium instances allowed at once across all workers")
+    ap.add_argument("--rate", type=float, default=RATE_LIMIT, help="Total Genius requests per second, split between workers")
+    ap.add_argument("--append", action="store_true")
+    ap.add_argument("--appendpaths", action="store_true")
+    ap.add_argument("--refresh", action="store_true", help="Also re-check already scraped songs and pick up edited lyrics")
+    ap.add_argument("--headless", action="store_true", help="Run Chromium without a visible window")
+    ap.add_argument("--concurrency", type=int, default=1, help="Per-artist requests in flight (async engine when > 1)")
+    ap.add_argument("--browser-only", action="store_true", help="Skip the plain-HTTP lyrics fetch and always use the browser")
+    ap.add_argument("--offline", action="store_true", help="Serve every request from the response cache, never the network")
+    ap.add_argument("--no-cache", action="store_true", help="Neither read nor write the response cache")
+    ap.add_argument("--compact-json", action="store_true", help="Write each artist's lyrics.json in the compact format")
+    ap.add_argument("--sqlite", action="store_true", help="Store songs, lyric lines and scraped URLs in lyrics.db")
+    ap.add_argument("--export", action="store_true", help="With --sqlite: regenerate the CSV/JSON files afterwards")
+    ap.add_argument("--no-combine", action="store_true", help="Skip the combine step at the end")
+    ap.add_argument("--metrics-dir", type=Path, help="Write each artist's metrics to <dir>/lyrics_<artist>.prom (Prometheus textfile)")
+    return ap.parse_args()
+
+# ───────────────────────────── DISCOVERY ──────────────────────────── #
+def load_artist(name: str) -> Optional[ModuleType]:
+    if not (LYRICS_ROOT / name / f"{name}.py").exists():
+        return None
+    module = importlib.import_module(f"lyrics.{name}.{name}")
+    return module if hasattr(module, "ARTIST_ID") and hasattr(module, "ALBUMS") else None
+
+def discover_artists(root: Path = LYRICS_ROOT) -> List[str]:
+    return sorted(d.name for d in root.iterdir()
+                  if d.is_dir() and not d.name.startswith((".", "_")) and load_artist(d.name))
+
+def artist_settings(module: ModuleType) -> Dict[str, Any]:
+    return {kw: getattr(module, const) for const, kw in ARTIST_SETTINGS.items()
+            if hasattr(module, const)}
+
+# ───────────────────────────── WORKERS ──────────────────────────── #
+_browser_gate: Optional[Any] = None
+
+# Runs once in every worker: its share of the rate limit and the shared browser semaphore
+def _init_worker(gate: Any, rate: float, burst: int) -> None:
+    global _browser_gate
+    _browser_gate = gate
+    genius_client().bucket = TokenBucket(rate, burst)
+
+def run_artist(name: str, options: Dict[str, Any]) -> Tuple[str, float]:
+    start = time.perf_counter()
+    scraper = Scraper(
+        **artist_settings(load_artist(name)),
+        base_path=LYRICS_ROOT / name,
+        headless=options["headless"],
+        concurrency=options["concurrency"],
+        http_fast_path=not options["browser_only"],
+        compact_json=options["compact_json"],
+        use_sqlite=options["sqlite"],
+        browser_gate=_browser_gate,
+        metrics_textfile=(options["metrics_dir"] / f"lyrics_{name}.prom"
+                          if options.get("metrics_dir") else None),
+    )
+    scraper.client.offline = options["offline"]
+    if options["no_cache"] and not options["offline"]:
+        scraper.client.cache = None
+    scraper.run(append=options["append"], appendpaths=options["appendpaths"],
+                export=options["export"], refresh=options.get("refresh", False))
+    return name, time.perf_counter() - start
+
+# Returns the artists whose run raised; combine still runs over whatever is on disk
+def orchestrate(artists: List[str], options: Dict[str, Any], *, jobs: Optional[int] = None,
+                max_browsers: int = 2, rate: float = RATE_LIMIT,
+                combine: bool = True) -> List[str]:
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(artists) or 1))
+    gate = multiprocessing.BoundedSemaphore(max(1, max_browsers))
+    # rate <= 0 means unlimited, which TokenBucket already understands
+    share = rate / jobs if rate > 0 else 0.0
+    burst = max(1, RATE_BURST // jobs)
+    print(f"⚡ {len(artists)} artists on {jobs} workers "
+          f"({max_browsers} browsers, {share:g} req/s each)")
+
+    failed: List[str] = []
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                             initargs=(gate, share, burst)) as pool:
+        futures = {pool.submit(run_artist, name, options): name for name in artists}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                _, seconds = future.result()
+                print(f"✅ {name} done in {seconds:.1f}s")
+            except Exception as e:
+                print(f"⚠️  {name} failed: {e!r}")
+                failed.append(name)
+
+    if combine:
+        rebuilt, reused = combine_artists(default_artists())
+        print(f"💿 Combined lyrics.json: {rebuilt} artists rebuilt, {reused} reused")
+    return failed
+
+if __name__ == "__main__":
+    args = parse_cli()
+    artists = args.artists or discover_artists()
+    unknown = [a for a in artists if load_artist(a) is None]
+    if unknown:
+        raise SystemExit(f"⚠️  No artist module for: {', '.join(unknown)}")
+
+    options = {k: getattr(args, k) for k in (
+        "append", "appendpaths", "refresh", "headless", "concurrency", "browser_only",
+        "offline", "no_cache", "compact_json", "sqlite", "export", "metrics_dir")}
+    failed = orchestrate(artists, options, jobs=args.jobs, max_browsers=args.max_browsers,
+                         rate=args.rate, combine=not args.no_combine)
+    raise SystemExit(1 if failed else 0)
@@ -1,22 +1,70 @@
 from __future__ import annotations
 import time
-import re
-import os, json, socket, argparse, math, re, requests, pandas as pd
+import asyncio
+import sys, csv, json, argparse, contextlib, functools, hashlib, itertools, requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Any, Optional
-import lyricsgenius
-from lyricsgenius.types import Song
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeout
-from lyrics.config import API_ROOT, CLIENT_ACCESS_TOKEN
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Set, Tuple, Any, Optional
+from lyrics.artefacts import CsvRowIndex, atomic_writer, csv_rows
+from lyrics.browser import BrowserPool
+from lyrics.extract import LYRICS_SELECTOR, fetch_lyrics_http, filter_lyric_lines
+from lyrics.cache import ResponseCache
+from lyrics.client import GeniusClient
+from lyrics.config import API_ROOT, CLIENT_ACCESS_TOKEN, genius_client
+from lyrics.journal import ScrapeJournal
+from lyrics.lyrics_json import LyricsJsonWriter, album_order
+from lyrics.metrics import Metrics
+from lyrics.storage import SQLiteStore
+from lyrics.helpers.combine import combine_artists, default_artists
+from lyrics import normalize
+
+# lyricsgenius, Playwright and the async engine are imported where they are used,
+# so importing an artist module (or running --help) doesn't load them
+if TYPE_CHECKING:
+    from lyricsgenius import Genius
+    from lyricsgenius.types import Song
+    from lyrics.async_engine import AsyncEngine
+
+LYRIC_COLUMNS = ["Song", "Album", "Lyric", "Previous Lyric", "Next Lyric", "Multiplicity"]
+SONG_COLUMNS = ["Title", "Album", "Lyrics"]
+
+# Version of the lyric-line layout (_get_lyric_list, _Lyric, the lyrics.csv row and
+# lyrics.json shapes). It is part of every song hash, so bumping it whenever one of those
+# changes makes the next run rebuild every song instead of reusing stale rows
+LYRIC_FORMAT = 1
+
+# Song body fields that move when a song's lyrics are edited on Genius (whichever the
+# body carries); --refresh only re-checks the lyrics page when the stamp changed
+VERSION_FIELDS = ("lyrics_updated_at", "updated_by_human_at")
+
+# A song body's version stamp (None when it carries none of VERSION_FIELDS)
+def _version_stamp(song: Dict[str, Any]) -> Optional[str]:
+    for field in VERSION_FIELDS:
+        if song.get(field) is not None:
+            return f"{field}={song[field]}"
+    return None
 
 # Fetches raw lyrics text from a Genius song URL using Playwright
-def get_lyrics_from_url(url, timeout=60000) -> Optional[str]:
+# (pages come from a shared BrowserPool; without one a throwaway pool is used for this URL only).
+# With a cache, the rendered HTML is stored so later runs can replay it without a browser.
+def get_lyrics_from_url(
+    url,
+    timeout=60000,
+    pool: Optional[BrowserPool] = None,
+    cache: Optional[ResponseCache] = None,
+    metrics: Optional[Metrics] = None,
+) -> Optional[str]:
+    if pool is None:
+        with BrowserPool() as own_pool:
+            return get_lyrics_from_url(url, timeout, own_pool, cache, metrics)
+    metrics = metrics or Metrics()
+    from playwright.sync_api import TimeoutError as PlaywrightTimeout
+
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=False)
-            page = browser.new_page()
+        with pool.page() as page:
             print(f"🌐 Scraping: {url}")
-            page.goto(url, timeout=timeout)
+            with metrics.timer("stage_seconds", stage="page_navigation"):
+                page.goto(url, timeout=timeout)
 
             # Accept cookie banners or GDPR popups
             try:
@@ -29,38 +77,50 @@ def get_lyrics_from_url(url, timeout=60000) -> Optional[str]:
             time.sleep(2)  # let scripts/rendering finish
 
             try:
-                page.wait_for_selector("div[data-lyrics-container]", timeout=10000)
+                with metrics.timer("stage_seconds", stage="lyrics_wait"):
+                    page.wait_for_selector(LYRICS_SELECTOR, timeout=10000)
             except:
                 print("⚠️ Lyrics container not found.")
+                metrics.inc("lyrics_container_missing", source="browser")
                 return ""
 
+            if cache is not None:
+                cache.put(url, None, 200, page.content(), {"Content-Type": "text/html"})
+
             # Extract and clean
-            lyrics_elements = page.locator("div[data-lyrics-container]").all()
+            lyrics_elements = page.locator(LYRICS_SELECTOR).all()
             raw_lyrics = "\n".join([el.inner_text().strip() for el in lyrics_elements])
-            lines = raw_lyrics.split("\n")
-
-            # Remove any Genius description-like intro (not part of real lyrics)
-            cleaned_lines = []
-            for line in lines:
-                if (
-                    "Read More" in line
-                    or "You might also like" in line
-                    or line.strip().startswith("“") and line.strip().endswith("”")
-                    or re.search(r'\b(song|track|lyrics)\b.*(is|was).*', line.lower())
-                ):
-                    continue
-                cleaned_lines.append(line.strip())
-
-            browser.close()
-            return "\n".join(cleaned_lines).strip()
+            return filter_lyric_lines(raw_lyrics)
 
     except PlaywrightTimeout:
         print(f"❌ TimeoutError on: {url}")
+        metrics.inc("browser_errors", reason="timeout")
         return None
     except Exception as e:
         print(f"❌ Error while scraping {url}: {e}")
+        metrics.inc("browser_errors", reason="error")
         return None
 
+# Fetches lyrics over plain HTTP first and only opens a browser page when the
+# server HTML has no lyrics container (or the request fails). Offline, only the cache is used.
+def fetch_lyrics(
+    url: str,
+    client: GeniusClient,
+    pool: BrowserPool,
+    http_first: bool = True,
+) -> Optional[str]:
+    if http_first or client.offline:
+        with client.metrics.timer("stage_seconds", stage="lyrics_http"):
+            lyrics = fetch_lyrics_http(url, client)
+        if lyrics is not None:
+            print(f"⚡ Fetched: {url}")
+            return lyrics
+        if client.offline:
+            return None
+        print(f"🐢 Falling back to browser: {url}")
+        client.metrics.inc("browser_fallbacks")
+    return get_lyrics_from_url(url, pool=pool, cache=client.cache, metrics=client.metrics)
+
 # Scrapes every song for one artist and writes CSV / JSON artefacts
 class Scraper:
     # ───────────────────────────── CONSTRUCTION ──────────────────────────── #
@@ -73,6 +133,15 @@ class Scraper:
         force_album_overrides: Dict[str, str] | None = None,
         ignore_songs: Dict[str, str] | None = None,
         base_path: str | Path = ".",
+        headless: bool = False,
+        browser_max_uses: int = 50,
+        concurrency: int = 1,
+        http_fast_path: bool = True,
+        compact_json: bool = False,
+        use_sqlite: bool = False,
+        combine_after_run: bool = False,
+        browser_gate: Optional[Any] = None,
+        metrics_textfile: str | Path | None = None,
     ) -> None:
         self.artist_id = artist_id
         self.albums = albums
@@ -88,45 +157,202 @@ class Scraper:
         self.lyric_json_path = base / "lyrics.json"
         self.song_list_path = base / "song_titles.txt"
         self.scraped_urls_path = base / "scraped_urls.json"
+        self.lyric_hashes_path = base / "lyric_hashes.json"
+        self.db_path = base / "lyrics.db"
+        self.journal_path = base / "journal.ndjson"
+        self.run_report_path = base / "run_report.json"
+        self.song_versions_path = base / "song_versions.json"
 
         base.mkdir(parents=True, exist_ok=True)
 
+        # Cleaned title -> (album, Song) for every song picked up this run, for O(1) dedupe
+        self.title_index: Dict[str, Tuple[str, Song]] = {}
+
         self.api_root = API_ROOT
         self.artist_url = f"{self.api_root}/artists/{self.artist_id}"
-        self.genius = lyricsgenius.Genius(CLIENT_ACCESS_TOKEN, retries=3, timeout=20)
+
+        # One browser for the whole run, recycled page by page (browser_gate: see BrowserPool.gate)
+        self.browser_pool = BrowserPool(headless=headless, max_uses=browser_max_uses,
+                                        gate=browser_gate)
+
+        # > 1 switches album scraping to the async engine with that many requests in flight
+        self.concurrency = concurrency
+
+        # Shared pooled, rate-limited client for the API and plain-HTTP lyrics pages
+        self.client = genius_client()
+        self.http_fast_path = http_fast_path
+
+        # Write lyrics.json in the minified string-table layout (see lyrics/compact.py)
+        self.compact_json = compact_json
+
+        # Keep songs / lyric lines / scraped URLs in lyrics.db instead of the CSV/JSON
+        # files, which are then only written by export_store() (opened in run())
+        self.use_sqlite = use_sqlite
+        self.store: Optional[SQLiteStore] = None
+
+        # Lyrics pages fetched this run, checkpointed as they arrive (file runs only;
+        # lyrics.db already keeps each song). A run that died part-way is replayed
+        # from it: the scrape goes through the same steps but skips those fetches.
+        self.journal: Optional[ScrapeJournal] = None
+        self.replayed_lyrics: Dict[str, str] = {}
+
+        # Stage timings and counters for the current run, written to run_report.json
+        # (and metrics_textfile, in Prometheus text format) when run() ends
+        self.metrics = Metrics()
+        self.metrics_textfile = Path(metrics_textfile) if metrics_textfile else None
+
+        # Re-run helpers/combine.py once the scrape finishes (unchanged artists are reused)
+        self.combine_after_run = combine_after_run
+
+    # lyricsgenius client the scraped Song objects are built with; created on first use
+    @functools.cached_property
+    def genius(self) -> Genius:
+        import lyricsgenius
+        return lyricsgenius.Genius(CLIENT_ACCESS_TOKEN, retries=3, timeout=20)
 
     # ───────────────────────────── PUBLIC ENTRY POINTS ───────────────────── #
     def run_from_cli(self) -> None:
         parser = argparse.ArgumentParser()
         parser.add_argument("--append", action="store_true")
         parser.add_argument("--appendpaths", action="store_true")
+        parser.add_argument("--refresh", action="store_true",
+                            help="Also re-check already scraped songs and pick up edited lyrics")
+        parser.add_argument("--headless", action="store_true",
+                            help="Run Chromium without a visible window")
+        parser.add_argument("--browser-max-uses", type=int,
+                            default=self.browser_pool.max_uses,
+                            help="Recycle a browser page after this many songs")
+        parser.add_argument("--concurrency", type=int, default=self.concurrency,
+                            help="Fetch up to N tracks/lyrics pages in parallel (async engine when > 1)")
+        parser.add_argument("--browser-only", action="store_true",
+                            help="Skip the plain-HTTP lyrics fetch and always use the browser")
+        parser.add_argument("--offline", action="store_true",
+                            help="Serve every request from the response cache, never the network")
+        parser.add_argument("--no-cache", action="store_true",
+                            help="Neither read nor write the response cache")
+        parser.add_argument("--cache-ttl", type=float,
+                            help="Seconds before a cached response is re-fetched")
+        parser.add_argument("--compact-json", action="store_true",
+                            help="Write lyrics.json in the compact string-table format")
+        parser.add_argument("--sqlite", action="store_true",
+                            help="Store songs, lyric lines and scraped URLs in lyrics.db")
+        parser.add_argument("--export", action="store_true",
+                            help="With --sqlite: regenerate the CSV/JSON files from lyrics.db afterwards")
+        parser.add_argument("--combine", action="store_true",
+                            help="Rebuild the combined lyrics.json / search_index.json afterwards")
+        parser.add_argument("--metrics-textfile", type=Path,
+                            help="Also write the run's metrics to this file in Prometheus text format")
         args = parser.parse_args()
-        self.run(append=args.append, appendpaths=args.appendpaths)
-
-    def run(self, *, append: bool = False, appendpaths: bool = False) -> None:
+        self.client.offline = args.offline
+        if args.no_cache and not args.offline:
+            self.client.cache = None
+        if args.cache_ttl is not None and self.client.cache is not None:
+            self.client.cache.ttl = args.cache_ttl
+        self.http_fast_path = not args.browser_only
+        self.browser_pool.headless = args.headless
+        self.browser_pool.max_uses = args.browser_max_uses
+        self.concurrency = args.concurrency
+        self.compact_json = self.compact_json or args.compact_json
+        self.use_sqlite = self.use_sqlite or args.sqlite
+        self.combine_after_run = self.combine_after_run or args.combine
+        self.metrics_textfile = args.metrics_textfile or self.metrics_textfile
+        self.run(append=args.append, appendpaths=args.appendpaths, export=args.export,
+                 refresh=args.refresh)
+
+    def run(self, *, append: bool = False, appendpaths: bool = False,
+            export: bool = False, refresh: bool = False) -> None:
+        self.metrics = self.client.metrics = Metrics()
+        try:
+            if self.use_sqlite:
+                self.store = SQLiteStore(self.db_path)
+                self._run_store(appendpaths=appendpaths, export=export, refresh=refresh)
+            else:
+                self._run(append=append, appendpaths=appendpaths, refresh=refresh)
+        finally:
+            self.browser_pool.close()
+            if self.store is not None:
+                self.store.close()
+                self.store = None
+            if self.journal is not None:
+                self.journal.close()
+                self.journal = None
+            self._write_run_report()
+        if self.combine_after_run:
+            self._combine()
+
+    def _run(self, *, append: bool, appendpaths: bool, refresh: bool = False) -> None:
         scraped_urls = self._load_scraped_urls()
         original_url_count = len(scraped_urls)
 
-        existing_df, existing_titles = self._load_existing_songs()
-
-        songs_by_album, has_failed, last_album = {}, True, None
-        retries = 0
-        while has_failed and retries < 4:
-            songs_by_album, has_failed, last_album = self._get_songs_by_album(
-                songs_by_album,
-                last_album,
-                existing_titles,
-                appendpaths,
-                scraped_urls,
-            )
-            retries += 1
+        existing_titles = self._load_existing_titles()
+        self.title_index = {}
+
+        self.journal = ScrapeJournal(self.journal_path)
+        self.replayed_lyrics = {r["url"]: r["lyrics"] for r in self.journal.replay()}
+        self.metrics.inc("lyrics_replayed", len(self.replayed_lyrics))
+        if self.replayed_lyrics:
+            print(f"♻️ Resuming: {len(self.replayed_lyrics)} lyrics pages from {self.journal_path.name}")
+
+        # Transient failures are retried per request by the client
+        songs_by_album = self._get_songs_by_album(
+            {},
+            existing_titles,
+            appendpaths,
+            scraped_urls,
+        )
 
-        self._albums_to_songs_csv(songs_by_album, existing_df)
+        self._albums_to_songs_csv(songs_by_album)
         self._save_scraped_urls(scraped_urls)
+        # Everything fetched is in songs.csv / scraped_urls.json now
+        self.journal.clear()
+        self.replayed_lyrics = {}
+
+        updated = 0
+        if refresh:
+            current = {title: (album, lyrics) for title, album, lyrics in csv_rows(self.csv_path, SONG_COLUMNS)}
+            updates = self._refresh_songs(scraped_urls, current)
+            if updates:
+                self._update_songs_csv({title: lyrics for title, _, lyrics in updates})
+            updated = len(updates)
+
+        if len(scraped_urls) > original_url_count or updated:
+            with self.metrics.timer("stage_seconds", stage="songs_to_lyrics"):
+                self._songs_to_lyrics(write_json=True)
+
+    # SQLite variant of _run: songs and URLs are upserted as they are scraped, lyric
+    # lines are rebuilt only for songs whose hash changed, files only on --export
+    def _run_store(self, *, appendpaths: bool, export: bool, refresh: bool = False) -> None:
+        if self.store.is_empty():
+            self._import_artefacts()
+        if self.store.lyric_format != LYRIC_FORMAT:
+            self.store.rehash(self._song_hash, LYRIC_FORMAT)
+        self.title_index = {}
+
+        songs_by_album = self._get_songs_by_album(
+            {},
+            self.store.song_titles(),
+            appendpaths,
+            self.store.scraped_urls,
+        )
 
-        if len(scraped_urls) > original_url_count:
-            self._songs_to_lyrics()
-            self._lyrics_to_json()
+        # New songs take the row order _albums_to_songs_csv would have given them
+        self.store.resequence(self._clean_title(song.title)
+                              for songs in songs_by_album.values() for song in songs)
+        if refresh:
+            current = {title: (album, lyrics) for title, album, lyrics in self.store.songs()}
+            for title, album, lyrics in self._refresh_songs(self.store.scraped_urls, current):
+                self.store.update_lyrics(title, lyrics, self._song_hash(album, lyrics))
+        with self.metrics.timer("stage_seconds", stage="songs_to_lyrics"):
+            self._store_lyric_lines()
+
+        if export:
+            self.export_store()
+
+    # The artist folders sit side by side under the folder holding the combined files
+    def _combine(self) -> None:
+        root = self.lyric_json_path.parent.resolve().parent
+        rebuilt, reused = combine_artists(default_artists(root), root)
+        print(f"💿 Combined lyrics.json: {rebuilt} artists rebuilt, {reused} reused")
 
     # ───────────────────────────── HELPERS ────────────────────────── #
     def _load_scraped_urls(self) -> Dict[str, str]:
@@ -140,27 +366,24 @@ class Scraper:
     def _save_scraped_urls(self, scraped_urls: Dict[str, str]) -> None:
         self.scraped_urls_path.write_text(json.dumps(scraped_urls, indent=2))
 
-    def _load_existing_songs(self) -> Tuple[Optional[pd.DataFrame], List[str]]:
-        if self.csv_path.exists() and self.csv_path.stat().st_size > 0:
-            df = pd.read_csv(self.csv_path)
-            return df, list(df["Title"])
-        return None, []
+    def _load_existing_titles(self) -> Set[str]:
+        return {title for title, in csv_rows(self.csv_path, ["Title"])}
 
     # ─────────────────────────── SCRAPING LOGIC ────────────────────────── #
     def _get_songs_by_album(
         self,
         songs_by_album: Dict[str, List[Song]],
-        last_album: Optional[str],
-        songs_so_far: List[str],
+        songs_so_far: Set[str],
         append_paths: bool,
         scraped_urls: Dict[str, str],
-    ) -> Tuple[Dict[str, List[Song]], bool, Optional[str]]:
+    ) -> Dict[str, List[Song]]:
 
         def get_song_data(api_path: str) -> Optional[Dict]:
-            request_url = self.api_root + api_path
-            r = requests.get(request_url,
-                             headers={"Authorization": f"Bearer {CLIENT_ACCESS_TOKEN}"})
-            data = r.json()
+            try:
+                data = self.client.api(api_path)
+            except requests.RequestException as e:
+                print(f"⚠️ Failed to fetch song data from {api_path}: {e}")
+                return None
             if "response" in data and "song" in data["response"]:
                 return data["response"]["song"]
             print(f"⚠️ Failed to fetch song data from {api_path}")
@@ -178,100 +401,314 @@ class Scraper:
             if song_title in self.force_album_overrides:
                 album_name = self.force_album_overrides[song_title]
 
-            cleaned_lyrics = self.clean_lyrics(lyrics)
+            with self.metrics.timer("stage_seconds", stage="cleaning"):
+                cleaned_lyrics = self.clean_lyrics(lyrics)
+            from lyricsgenius.types import Song
             s = Song(self.genius, song_data, cleaned_lyrics)
 
             if album_name not in songs_by_album:
                 songs_by_album[album_name] = []
 
             # Avoid duplicates across albums
-            for album_songs in songs_by_album.values():
-                if any(self._clean_title(song.title) == song_title
-                       for song in album_songs):
-                    return
+            if song_title in self.title_index:
+                self.metrics.inc("songs_skipped", reason="duplicate")
+                return
 
+            self.metrics.inc("songs_scraped")
             songs_by_album[album_name].append(s)
-            
+            self.title_index[song_title] = (album_name, s)
+            if self.store is not None:
+                self.store.upsert_song(song_title, album_name, cleaned_lyrics,
+                                       self._song_hash(album_name, cleaned_lyrics))
+
             return album_name
 
-        album_index = 0
-
-        if not append_paths:
-            for album_api_path in self.albums:
-                if (last_album is None or
-                        album_index >= list(self.albums.keys()).index(last_album)):
-                    album_name = self.albums[album_api_path]
-                    print(f'💿 Getting songs for album "{album_name}"')
-                    next_page = 1
-                    tracks: List[Dict] = []
-
-                    while next_page is not None:
-                        try:
-                            request_url = (
-                                self.api_root
-                                + album_api_path
-                                + f"/tracks?page={next_page}"
-                            )
-                            r = requests.get(
-                                request_url,
-                                headers={"Authorization": f"Bearer {CLIENT_ACCESS_TOKEN}"}
-                            )
-                            track_data = r.json()
-                            tracks.extend(track_data["response"]["tracks"])
-                            next_page = track_data["response"]["next_page"]
-                        except Exception:
-                            print("Failed getting album", album_name,
-                                  "-- saving songs so far")
-                            return songs_by_album, True, album_api_path
-
-                    for track in tracks:
-                        song = track["song"]
-                        cleaned_song_title = self._clean_title(song["title"])
-
-                        try:
-                            song_url = song["url"]
-
-                            # Skip if URL already scraped
-                            if song_url in scraped_urls:
-                                print(f"⏩ Skipped (already scraped): "
-                                      f"'{song['title']}' {song_url}")
-                                continue
-
-                            # Ignore list
-                            if song["api_path"] in self.ignore_songs:
-                                print(f"⏩ Skipped (ignored manually): "
-                                      f"'{song['title']}' {song_url}")
-                                continue
-
-                            if (cleaned_song_title not in songs_so_far):
-                                lyrics = get_lyrics_from_url(song_url)
-                                if lyrics and self._has_song_identifier(lyrics):
-                                    songs_so_far.append(cleaned_song_title)
-                                    album_used = clean_lyrics_and_append(song, album_name, lyrics)
-                                    scraped_urls[song_url] = album_used
-                        except (requests.exceptions.Timeout, socket.timeout):
-                            print("Failed receiving song", cleaned_song_title,
-                                  "-- saving songs so far")
-                            return songs_by_album, True, album_api_path
-                album_index += 1
+        if not append_paths and self.concurrency > 1:
+            failed_album = asyncio.run(self._scrape_albums_async(
+                songs_so_far, scraped_urls, clean_lyrics_and_append))
+            if failed_album is not None:
+                return songs_by_album
+        elif not append_paths:
+            for album_api_path, album_name in self.albums.items():
+                print(f'💿 Getting songs for album "{album_name}"')
+                next_page = 1
+                tracks: List[Dict] = []
+
+                while next_page is not None:
+                    try:
+                        with self.metrics.timer("stage_seconds", stage="api_pagination"):
+                            track_data = self.client.api(
+                                album_api_path + "/tracks", params={"page": next_page})
+                        tracks.extend(track_data["response"]["tracks"])
+                        next_page = track_data["response"]["next_page"]
+                    except Exception:
+                        print("Failed getting album", album_name,
+                              "-- saving songs so far")
+                        return songs_by_album
+
+                for track in tracks:
+                    song = track["song"]
+                    cleaned_song_title = self._clean_title(song["title"])
+                    song_url = song["url"]
+
+                    # Skip if URL already scraped
+                    if song_url in scraped_urls:
+                        print(f"⏩ Skipped (already scraped): "
+                              f"'{song['title']}' {song_url}")
+                        self.metrics.inc("songs_skipped", reason="already_scraped")
+                        continue
+
+                    # Ignore list
+                    if song["api_path"] in self.ignore_songs:
+                        print(f"⏩ Skipped (ignored manually): "
+                              f"'{song['title']}' {song_url}")
+                        self.metrics.inc("songs_skipped", reason="ignored")
+                        continue
+
+                    if (cleaned_song_title not in songs_so_far):
+                        lyrics = self._fetch_lyrics(song_url)
+                        if lyrics and self._has_song_identifier(lyrics):
+                            songs_so_far.add(cleaned_song_title)
+                            album_used = clean_lyrics_and_append(song, album_name, lyrics)
+                            scraped_urls[song_url] = album_used
 
         for api_path, album_name in self.extra_song_api_paths.items():
             song_data = get_song_data(api_path)
             if (song_data
                     and self._clean_title(song_data["title"]) not in songs_so_far):
-                lyrics = get_lyrics_from_url(song_data["url"])
+                lyrics = self._fetch_lyrics(song_data["url"])
                 clean_lyrics_and_append(song_data, album_name, lyrics)
 
-        return songs_by_album, False, None
+        return songs_by_album
 
-    # Convert to CSV ------------------------------------------------------- #
-    def _albums_to_songs_csv(
+    # Async engine: fetch every tracks page and lyrics page in parallel, then apply
+    # results in album/track order so dedupe and overrides match the sequential loop.
+    # Returns the api path of the album whose tracks could not be fetched, if any.
+    async def _scrape_albums_async(
         self,
-        songs_by_album: Dict[str, List[Song]],
-        existing_df: Optional[pd.DataFrame] = None,
-    ) -> None:
-        songs_records: List[Dict[str, str]] = []
-        songs_titles: List[str] = []
+        songs_so_far: Set[str],
+        scraped_urls: Dict[str, str],
+        append_song,
+    ) -> Optional[str]:
+        album_paths = list(self.albums)
+        from lyrics.async_engine import AsyncEngine
+
+        async with AsyncEngine(
+            self.client,
+            concurrency=self.concurrency,
+            headless=self.browser_pool.headless,
+            max_uses=self.browser_pool.max_uses,
+            http_fast_path=self.http_fast_path,
+            browser_gate=self.browser_pool.gate,
+        ) as engine:
+            album_tracks = await asyncio.gather(
+                *(engine.album_tracks(path) for path in album_paths),
+                return_exceptions=True,
+            )
+
+            # Same skip rules and order as the sequential loop
+            failed_album: Optional[str] = None
+            candidates: List[Tuple[str, Dict]] = []
+            for album_api_path, tracks in zip(album_paths, album_tracks):
+                album_name = self.albums[album_api_path]
+                if isinstance(tracks, BaseException):
+                    print("Failed getting album", album_name,
+                          "-- saving songs so far")
+                    failed_album = album_api_path
+                    break
+
+                print(f'💿 Getting songs for album "{album_name}"')
+                for track in tracks:
+                    song = track["song"]
+                    if song["url"] in scraped_urls:
+                        print(f"⏩ Skipped (already scraped): "
+                              f"'{song['title']}' {song['url']}")
+                        self.metrics.inc("songs_skipped", reason="already_scraped")
+                        continue
+                    if song["api_path"] in self.ignore_songs:
+                        print(f"⏩ Skipped (ignored manually): "
+                              f"'{song['title']}' {song['url']}")
+                        self.metrics.inc("songs_skipped", reason="ignored")
+                        continue
+                    if self._clean_title(song["title"]) not in songs_so_far:
+                        candidates.append((album_name, song))
+
+            # A title only falls back to its next occurrence when the earlier one
+            # gave no usable lyrics, so fetch one occurrence per title per round
+            pending: Dict[str, List[int]] = {}
+            for i, (_, song) in enumerate(candidates):
+                pending.setdefault(self._clean_title(song["title"]), []).append(i)
+
+            found: Dict[int, str] = {}
+            while pending:
+                attempt = {title: indices.pop(0) for title, indices in pending.items()}
+                fetched = await asyncio.gather(
+                    *(self._fetch_lyrics_async(engine, candidates[i][1]["url"])
+                      for i in attempt.values()))
+
+                for (title, i), lyrics in zip(attempt.items(), fetched):
+                    if lyrics and self._has_song_identifier(lyrics):
+                        found[i] = lyrics
+                        del pending[title]
+                    elif not pending[title]:
+                        del pending[title]
+
+        for i in sorted(found):
+            album_name, song = candidates[i]
+            songs_so_far.add(self._clean_title(song["title"]))
+            scraped_urls[song["url"]] = append_song(song, album_name, found[i])
+
+        return failed_album
+
+    # Lyrics page fetches go through the journal: replayed pages are not fetched
+    # again, fresh ones are checkpointed the moment they arrive
+    def _fetch_lyrics(self, url: str) -> Optional[str]:
+        if url in self.replayed_lyrics:
+            return self.replayed_lyrics[url]
+        return self._checkpoint(url, fetch_lyrics(url, self.client, self.browser_pool,
+                                                  self.http_fast_path))
+
+    async def _fetch_lyrics_async(self, engine: AsyncEngine, url: str) -> Optional[str]:
+        if url in self.replayed_lyrics:
+            return self.replayed_lyrics[url]
+        return self._checkpoint(url, await engine.lyrics(url))
+
+    def _checkpoint(self, url: str, lyrics: Optional[str]) -> Optional[str]:
+        if lyrics and self.journal is not None:
+            self.journal.append({"url": url, "lyrics": lyrics})
+        return lyrics
+
+    # ─────────────────────────── REFRESH ────────────────────────── #
+    # Re-checks songs scraped on earlier runs and returns those whose lyrics changed on
+    # Genius, as (title, album, cleaned lyrics); `current` maps title -> (album, lyrics).
+    # Tracks pages (and extra songs) are re-read with conditional requests. A song whose
+    # version stamp there still matches song_versions.json is done; any other gets a
+    # conditional GET of its lyrics page (a 304 is answered from the cache) and its
+    # cleaned lyrics are compared with ours. A page whose server HTML has no lyrics (or
+    # whose request failed) is read through the browser instead, as fetch_lyrics does.
+    # Songs scraped this run are not re-checked.
+    def _refresh_songs(
+        self,
+        scraped_urls: Dict[str, str],
+        current: Dict[str, Tuple[Any, str]],
+    ) -> List[Tuple[str, Any, str]]:
+        with self.metrics.timer("stage_seconds", stage="refresh"):
+            versions = self._load_song_versions()
+            songs: Dict[str, Dict] = {}
+            for song in self._refresh_candidates():
+                title = self._clean_title(song["title"])
+                if (title in current and title not in songs and title not in self.title_index
+                        and song["api_path"] not in self.ignore_songs
+                        and (song["url"] in scraped_urls
+                             or song["api_path"] in self.extra_song_api_paths)):
+                    songs[title] = song
+
+            # Sync Playwright pages can't be shared across threads, so the browser
+            # fallbacks run on this thread once the HTTP checks are done
+            browser_titles: Set[str] = set()
+
+            # A fetched page against our lyrics: (title, album, cleaned lyrics) when they differ
+            def compare(title: str, lyrics: Optional[str]) -> Optional[Tuple[str, Any, str]]:
+                song = songs[title]
+                stamp = _version_stamp(song)
+                if not (lyrics and self._has_song_identifier(lyrics)):
+                    self.metrics.inc("songs_refreshed", result="unavailable")
+                    return None
+                if stamp is not None:
+                    versions[song["url"]] = stamp
+
+                album, old_lyrics = current[title]
+                with self.metrics.timer("stage_seconds", stage="cleaning"):
+                    lyrics = self.clean_lyrics(lyrics)
+                if lyrics == old_lyrics:
+                    self.metrics.inc("songs_refreshed", result="unchanged")
+                    return None
+                print(f"🔄 Lyrics changed: '{song['title']}' {song['url']}")
+                self.metrics.inc("songs_refreshed", result="updated")
+                return title, album, lyrics
+
+            def check(title: str) -> Optional[Tuple[str, Any, str]]:
+                song = songs[title]
+                stamp = _version_stamp(song)
+                if stamp is not None and versions.get(song["url"]) == stamp:
+                    self.metrics.inc("songs_refreshed", result="unchanged_metadata")
+                    return None
+
+                lyrics = fetch_lyrics_http(song["url"], self.client, revalidate=True)
+                if lyrics is None and not self.client.offline:
+                    browser_titles.add(title)
+                    return None
+                return compare(title, lyrics)
+
+            with ThreadPoolExecutor(max_workers=max(1, self.concurrency)) as pool:
+                updates = [u for u in pool.map(check, songs) if u is not None]
+            for title in [title for title in songs if title in browser_titles]:
+                url = songs[title]["url"]
+                print(f"🐢 Falling back to browser: {url}")
+                self.metrics.inc("browser_fallbacks")
+                update = compare(title, get_lyrics_from_url(url, pool=self.browser_pool,
+                                                            cache=self.client.cache,
+                                                            metrics=self.metrics))
+                if update is not None:
+                    updates.append(update)
+            if versions:
+                self.song_versions_path.write_text(json.dumps(versions, indent=2, sort_keys=True))
+
+        print(f"🔄 Refreshed {len(songs)} songs: {len(updates)} with new lyrics")
+        return updates
+
+    # Song bodies from every album's tracks pages and the extra songs, revalidated
+    def _refresh_candidates(self) -> Iterator[Dict]:
+        for album_api_path, album_name in self.albums.items():
+            next_page = 1
+            while next_page is not None:
+                try:
+                    with self.metrics.timer("stage_seconds", stage="api_pagination"):
+                        track_data = self.client.api(album_api_path + "/tracks",
+                                                     params={"page": next_page}, revalidate=True)
+                except requests.RequestException as e:
+                    print(f"⚠️ Failed to refresh album {album_name}: {e}")
+                    break
+                for track in track_data["response"]["tracks"]:
+                    yield track["song"]
+                next_page = track_data["response"]["next_page"]
+
+        for api_path in self.extra_song_api_paths:
+            try:
+                yield self.client.api(api_path, revalidate=True)["response"]["song"]
+            except (requests.RequestException, KeyError) as e:
+                print(f"⚠️ Failed to refresh {api_path}: {e}")
+
+    # URL -> version stamp seen on the last refresh
+    def _load_song_versions(self) -> Dict[str, str]:
+        try:
+            return json.loads(self.song_versions_path.read_text())
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    # Swaps in refreshed lyrics, keeping every songs.csv row where it is
+    def _update_songs_csv(self, updates: Dict[str, str]) -> None:
+        rows = list(csv_rows(self.csv_path, SONG_COLUMNS))
+        with atomic_writer(self.csv_path) as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(SONG_COLUMNS)
+            writer.writerows((title, album, updates.get(title, lyrics)) for title, album, lyrics in rows)
+
+    def _write_run_report(self) -> None:
+        artist = self.lyric_json_path.parent.resolve().name
+        self.metrics.write_json(self.run_report_path, artist=artist, artist_id=self.artist_id,
+                                concurrency=self.concurrency)
+        print(f"📊 Run report → {self.run_report_path}")
+        if self.metrics_textfile is not None:
+            self.metrics.write_prometheus(self.metrics_textfile, artist=artist)
+
+    # Convert to CSV ------------------------------------------------------- #
+    # Rewrites songs.csv as its old rows followed by the new songs. An old row is dropped
+    # when its title is re-scraped (or ignored), and of repeated old titles only the last
+    # row stays; the old rows are streamed from the file, not loaded
+    def _albums_to_songs_csv(self, songs_by_album: Dict[str, List[Song]]) -> None:
+        songs_records: List[Tuple[str, str, str]] = []
+        songs_titles: Set[str] = set()
 
         for album, songs in songs_by_album.items():
             for song in songs:
@@ -282,28 +719,84 @@ class Scraper:
                 if song_title in songs_titles:
                     continue
 
-                songs_records.append({
-                    "Title": song_title,
-                    "Album": album,
-                    "Lyrics": song.lyrics,
-                })
-                songs_titles.append(song_title)
+                songs_records.append((song_title, album, song.lyrics))
+                songs_titles.add(song_title)
 
         if not songs_records:
             print("📄 No new songs to write. Skipping CSV save.")
             return
 
-        song_df = pd.DataFrame.from_records(songs_records)
-        if existing_df is not None:
-            song_df = pd.concat([existing_df, song_df])
-            song_df = song_df[~song_df["Title"].isin(self.ignore_songs)]
-            song_df = song_df.drop_duplicates("Title", keep="last")
-
-        song_df.to_csv(self.csv_path, index=False)
+        last_row = {title: i for i, (title,) in enumerate(csv_rows(self.csv_path, ["Title"]))}
+        old_rows = (row for i, row in enumerate(csv_rows(self.csv_path, SONG_COLUMNS))
+                    if row[0] not in songs_titles and row[0] not in self.ignore_songs
+                    and last_row[row[0]] == i)
+        with atomic_writer(self.csv_path) as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(SONG_COLUMNS)
+            writer.writerows(old_rows)
+            writer.writerows(songs_records)
         print(f"✅ Saved {len(songs_records)} songs to CSV")
 
+    # ─────────────────────────── SQLITE STORAGE ────────────────────────── #
+    # Seeds an empty lyrics.db from the artist's existing files, keeping the lyric
+    # lines of every song whose hash still matches lyric_hashes.json
+    def _import_artefacts(self) -> None:
+        scraped_urls = self._load_scraped_urls()
+        songs = [(title, album, lyrics, self._song_hash(album, lyrics))
+                 for title, album, lyrics in csv_rows(self.csv_path, SONG_COLUMNS)]
+        if not songs and not scraped_urls:
+            return
+
+        old_hashes = self._load_lyric_hashes()
+        with CsvRowIndex(self.lyric_path if old_hashes else None, "Song", LYRIC_COLUMNS) as existing:
+            lines = (
+                (title, [(lyric, prev or None, next_ or None, int(multiplicity))
+                         for _, _, lyric, prev, next_, multiplicity in existing.rows(title)])
+                for title, _, _, song_hash in songs
+                if old_hashes.get(title) == song_hash and title in existing
+            )
+            self.store.bulk_load(songs, scraped_urls, lines)
+        print(f"🗄️ Imported {len(songs)} songs and {len(scraped_urls)} URLs into {self.db_path.name}")
+
+    def _store_lyric_lines(self) -> None:
+        stale = self.store.stale_songs()
+        lyric_lists = self._get_lyric_lists((title, lyrics) for title, _, lyrics, _ in stale)
+        for title, _, _, song_hash in stale:
+            lines = lyric_lists.get(title, {})
+            self.store.replace_lyric_lines(
+                title, song_hash,
+                [(obj.lyric, obj.prev, obj.next, count) for obj, count in lines.items()])
+        print(f"✅ Stored lyric lines ({len(stale)} songs rebuilt)")
+
+    # Regenerates songs.csv, scraped_urls.json, lyrics.csv, song_titles.txt,
+    # lyric_hashes.json and lyrics.json from lyrics.db
+    def export_store(self) -> None:
+        songs = self.store.songs()
+        with atomic_writer(self.csv_path) as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(SONG_COLUMNS)
+            writer.writerows(songs)
+        self._save_scraped_urls(dict(self.store.scraped_urls))
+
+        self._write_lyrics_csv(self.store.lyric_rows())
+
+        kept = [(title, album, lyrics) for title, album, lyrics in songs if len(lyrics) > 1]
+        self.song_list_path.write_text(
+            "\n".join(sorted({title for title, _, _ in kept})), encoding="utf-8")
+        self.lyric_hashes_path.write_text(json.dumps(
+            {title: self._song_hash(album, lyrics) for title, album, lyrics in kept}, indent=2))
+
+        with self.metrics.timer("stage_seconds", stage="lyrics_to_json"):
+            self._lyrics_to_json()
+        print(f"✅ Exported {len(songs)} songs from {self.db_path.name}")
+
     # ───────────────────────── LYRIC POST PROCESSING ──────────────────────── #
+    # One (lyric, previous, next) triple. Slotted, with the hash computed once, and the
+    # three fields point at interned line strings, so a line shared by neighbouring
+    # records (or by songs with the same chorus) is stored once
     class _Lyric:
+        __slots__ = ("lyric", "prev", "next", "_hash")
+
         def __init__(self,
                      lyric: str,
                      prev_lyric: Optional[str] = None,
@@ -311,162 +804,194 @@ class Scraper:
             self.lyric = lyric
             self.prev = prev_lyric
             self.next = next_lyric
+            self._hash = hash((lyric, prev_lyric, next_lyric))
 
         def __eq__(self, other: object) -> bool:  # type: ignore[override]
             if not isinstance(other, Scraper._Lyric):
                 return NotImplemented
-            return (self.lyric == other.lyric
+            return (self._hash == other._hash
+                    and self.lyric == other.lyric
                     and self.prev == other.prev
                     and self.next == other.next)
 
         def __hash__(self) -> int:
-            return hash((self.prev or "") + self.lyric + (self.next or ""))
+            return self._hash
 
         def __repr__(self) -> str:  # pragma: no cover
             return self.lyric
 
-    def _songs_to_lyrics(self) -> None:
-        if not (self.csv_path.exists() and self.csv_path.stat().st_size > 0):
-            print("⚠️ No song data found in CSV to process.")
-            return
-
-        try:
-            song_data = pd.read_csv(self.csv_path)
-        except pd.errors.EmptyDataError:
-            print("⚠️ CSV exists but is empty. Skipping lyrics processing.")
-            return
+    # LYRIC_FORMAT + album + cleaned lyrics fingerprint. lyric_hashes.json keys it by title,
+    # so a song is only re-processed when its album or lyrics (or the format) change
+    @staticmethod
+    def _song_hash(album: Any, lyrics: Any) -> str:
+        return hashlib.sha1(f"{LYRIC_FORMAT}\0{album}\0{lyrics}".encode("utf-8")).hexdigest()
 
-        lyric_records: List[Dict[str, str | int]] = []
-        song_titles: List[str] = []
+    def _load_lyric_hashes(self) -> Dict[str, str]:
+        if self.lyric_hashes_path.exists():
+            try:
+                return json.loads(self.lyric_hashes_path.read_text())
+            except json.JSONDecodeError:
+                print("⚠️ lyric_hashes.json is invalid. Rebuilding every song.")
+        return {}
 
-        for title, album, lyrics in song_data.to_records(index=False):
-            if title in song_titles or len(lyrics) <= 1:
+    # (title, album, lyrics) for each song in songs.csv, read one row at a time; repeated
+    # titles and empty lyrics are skipped
+    def _song_rows(self) -> Iterator[Tuple[str, str, str]]:
+        seen: Set[str] = set()
+        for title, album, lyrics in csv_rows(self.csv_path, SONG_COLUMNS):
+            if title in seen or len(lyrics) <= 1:
                 continue
+            seen.add(title)
+            yield title, album, lyrics
 
-            song_titles.append(title)
-            lyric_dict = self._get_lyric_list(str(lyrics))
-
-            for lyric_obj, multiplicity in lyric_dict.items():
-                lyric_records.append({
-                    "Song": title,
-                    "Album": album,
-                    "Lyric": lyric_obj.lyric,
-                    "Previous Lyric": lyric_obj.prev,
-                    "Next Lyric": lyric_obj.next,
-                    "Multiplicity": multiplicity,
-                })
-
-        lyric_df = pd.DataFrame.from_records(lyric_records)
-        lyric_df.to_csv(self.lyric_path, index=False)
+    # (title, album, lyrics.csv rows) song by song. Fills `hashes` as it goes and `rebuilt`
+    # with the songs whose rows were recomputed; an unchanged song's previous rows are read
+    # back from the old lyrics.csv just for that song
+    def _song_lyric_rows(
+        self,
+        old_hashes: Dict[str, str],
+        existing: CsvRowIndex,
+        hashes: Dict[str, str],
+        rebuilt: Set[str],
+    ) -> Iterator[Tuple[str, str, List[Tuple[Any, ...]]]]:
+        for title, album, lyrics in self._song_rows():
+            hashes[title] = self._song_hash(album, lyrics)
+            if old_hashes.get(title) == hashes[title] and title in existing:
+                yield title, album, existing.rows(title)
+                continue
 
-        self.song_list_path.write_text(
-            "\n".join(sorted(set(song_titles))), encoding="utf-8")
+            rebuilt.add(title)
+            yield title, album, [(title, album, lyric_obj.lyric, lyric_obj.prev, lyric_obj.next, multiplicity)
+                                 for lyric_obj, multiplicity in self._get_lyric_list(lyrics).items()]
 
-        print("✅ Generated lyrics CSV")
+    # Regenerates lyrics.csv from songs.csv in one streaming pass, so only one song's
+    # lines are held at a time. With write_json=True each song also goes straight into
+    # lyrics.json (album order comes from a first, cheap pass over songs.csv), so run()
+    # doesn't read lyrics.csv back.
+    def _songs_to_lyrics(self, write_json: bool = False) -> None:
+        if not (self.csv_path.exists() and self.csv_path.stat().st_size > 0):
+            print("⚠️ No song data found in CSV to process.")
+            return
 
+        old_hashes = self._load_lyric_hashes()
+        hashes: Dict[str, str] = {}
+        rebuilt: Set[str] = set()
+        json_out = (LyricsJsonWriter(self.lyric_json_path, self._album_order(), self.compact_json)
+                    if write_json else contextlib.nullcontext())
+
+        # The old lyrics.csv is read while the new one is written beside it; the index is
+        # closed before the new file replaces it
+        with atomic_writer(self.lyric_path) as f, json_out as out, \
+                CsvRowIndex(self.lyric_path if old_hashes else None, "Song", LYRIC_COLUMNS) as existing:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(LYRIC_COLUMNS)
+            for title, album, rows in self._song_lyric_rows(old_hashes, existing, hashes, rebuilt):
+                writer.writerows(rows)
+                if out is not None:
+                    out.add(album or title, title, [row[2:] for row in rows])
+
+        self.song_list_path.write_text("\n".join(sorted(hashes)), encoding="utf-8")
+        self.lyric_hashes_path.write_text(json.dumps(hashes, indent=2))
+
+        print(f"✅ Generated lyrics CSV ({len(rebuilt)}/{len(hashes)} songs rebuilt)")
+        if write_json:
+            print("✅ Generated lyrics JSON")
+
+    # (album, title) of every song _songs_to_lyrics will write, in lyrics.json order
+    # (songs without an album are filed under their own title)
+    def _album_order(self) -> List[Tuple[str, str]]:
+        return album_order((album or title, title) for title, album, _ in self._song_rows())
+
+    def _write_lyrics_csv(self, rows: Iterable[Tuple[Any, ...]]) -> None:
+        with atomic_writer(self.lyric_path) as f:
+            writer = csv.writer(f, lineterminator="\n")
+            writer.writerow(LYRIC_COLUMNS)
+            writer.writerows(rows)
+
+    # Regenerates lyrics.json from lyrics.csv: one pass for the album order, then the
+    # rows are read again and handed over song by song
     def _lyrics_to_json(self) -> None:
         if not (self.lyric_path.exists() and self.lyric_path.stat().st_size > 0):
             print("⚠️ No lyric data found. Skipping JSON generation.")
             return
 
-        try:
-            lyric_data = pd.read_csv(self.lyric_path)
-        except pd.errors.EmptyDataError:
-            print("⚠️ Lyrics CSV is empty. Skipping JSON generation.")
-            return
-
-        lyric_dict: Dict[str, Dict[str, List[Dict[str, str | int]]]] = {}
-
-        for song in lyric_data.to_records(index=False):
-            title, album, lyric, prev_lyric, next_lyric, multiplicity = song
-            if album != album:  # NaN
-                album = title
-            lyric_dict.setdefault(album, {}).setdefault(title, []).append({
-                "lyric": lyric,
-                "prev": "" if prev_lyric != prev_lyric else prev_lyric,
-                "next": "" if next_lyric != next_lyric else next_lyric,
-                "multiplicity": int(multiplicity),
-            })
-
-        self.lyric_json_path.write_text(json.dumps(lyric_dict, indent=4),
-                                        encoding="utf-8")
+        order = album_order((album or title, title)
+                            for title, album in csv_rows(self.lyric_path, ["Song", "Album"]))
+        with LyricsJsonWriter(self.lyric_json_path, order, self.compact_json) as out:
+            songs = itertools.groupby(csv_rows(self.lyric_path, LYRIC_COLUMNS), key=lambda row: row[:2])
+            for (title, album), rows in songs:
+                out.add(album or title, title, [row[2:] for row in rows])
         print("✅ Generated lyrics JSON")
 
     # ─────────────────────── STRING CLEANUP HELPERS ───────────────────────── #
     @staticmethod
     def _clean_string(string: str) -> str:
-        string = re.sub(r"\u2018|\u2019", "'", string)
-        string = re.sub(r"\u201C|\u201D", '"', string)
-        string = re.sub(r"\u200b", "", string)
-        string = re.sub(
-            r"[\u00A0\u1680\u180e\u2000-\u2009\u200a\u202f\u205f\u3000\u200e]",
-            " ",
-            string,
-        )
-        string = re.sub(r"\u0435", "e", string)
-        string = re.sub(r"\u2013|\u2014", " - ", string)
-        return string.strip(" ")
+        return normalize.clean_string(string)
 
+    # Memoized: the same titles are cleaned again at every dedupe step
     @classmethod
+    @functools.lru_cache(maxsize=None)
     def _clean_title(cls, title: str) -> str:  # keep original name
-        return cls._clean_string(title)
+        return normalize.clean_title(title)
 
     @classmethod
     def clean_lyrics(cls, lyrics: str) -> str:
-        lines = lyrics.split("\n")
-        cleaned_lines: List[str] = []
-        started = False
-
-        for line in lines:
-            line = line.strip()
-            if not started:
-                if re.search(r"\bLyrics\b", line):
-                    started = True
-                    continue
-            if started:
-                cleaned_lines.append(line)
-
-        lyrics = "\n".join(cleaned_lines)
-        lyrics = cls._clean_string(lyrics)
-
-        lyrics = re.sub(r"[0-9]*URLCopyEmbedCopy", "", lyrics)
-        lyrics = re.sub(r"[0-9]*Embed", "", lyrics)
-        lyrics = re.sub(r"[0-9]*EmbedShare", "", lyrics)
-        lyrics = re.sub(
-            r"See [\w\s]* LiveGet tickets as low as \$\d*You might also like",
-            "\n",
-            lyrics,
-        )
-        return lyrics
+        return normalize.clean_lyrics(lyrics)
 
     @staticmethod
     def _has_song_identifier(lyrics: str) -> bool:
         return any(tag in lyrics for tag in ("[Intro", "[Verse", "[Chorus"))
 
     # ─────────────────────── LYRIC LIST BUILDER ────────────────────────── #
+    # Unique (lyric, previous, next) triples of one song with their counts, in
+    # first-occurrence order. Two linear passes: a reverse scan finds each line's
+    # next lyric, a forward scan tracks the previous one.
     def _get_lyric_list(
         self,
         lyrics: str,
     ) -> Dict["Scraper._Lyric", int]:
-        lines = lyrics.split("\n")
-        lyric_dict: Dict[Scraper._Lyric, int] = {}
+        lines = [sys.intern(line.strip()) for line in lyrics.split("\n")]
+
+        # next_lines[i] = first non-empty line after i that doesn't start with "["
+        next_lines: List[Optional[str]] = [None] * len(lines)
+        upcoming: Optional[str] = None
+        for i in range(len(lines) - 1, -1, -1):
+            next_lines[i] = upcoming
+            line = lines[i]
+            if line and not line.startswith("["):
+                upcoming = line
+
+        counts: Dict[Tuple[str, Optional[str], Optional[str]], int] = {}
         prev_line: Optional[str] = None
 
-        for i, curr in enumerate(lines):
-            curr_line = curr.strip()
+        for curr_line, next_line in zip(lines, next_lines):
             if not curr_line or (curr_line.startswith("[")
                                  and curr_line.endswith("]")):
                 continue
 
-            next_line: Optional[str] = None
-            for j in range(i + 1, len(lines)):
-                peek = lines[j].strip()
-                if peek and not peek.startswith("["):
-                    next_line = peek
-                    break
-
-            lyric = Scraper._Lyric(curr_line, prev_line, next_line)
-            lyric_dict[lyric] = lyric_dict.get(lyric, 0) + 1
+            key = (curr_line, prev_line, next_line)
+            counts[key] = counts.get(key, 0) + 1
             prev_line = curr_line
 
-        return lyric_dict
\ No newline at end of file
+        return {Scraper._Lyric(*key): count for key, count in counts.items()}
+
+    # Batch form of _get_lyric_list: title -> lyric list for every (title, lyrics) pair,
+    # skipping repeated titles and empty lyrics the same way _songs_to_lyrics does
+    def _get_lyric_lists(
+        self,
+        songs: Iterable[Tuple[str, Any]],
+    ) -> Dict[str, Dict["Scraper._Lyric", int]]:
+        lyric_lists: Dict[str, Dict[Scraper._Lyric, int]] = {}
+        for title, lyrics in songs:
+            if title in lyric_lists or len(lyrics) <= 1:
+                continue
+            lyric_lists[title] = self._get_lyric_list(str(lyrics))
+        return lyric_lists
+
+    # Lyric lists for every song of a songs.csv (this artist's by default)
+    def lyric_lists_from_csv(
+        self,
+        csv_path: str | Path | None = None,
+    ) -> Dict[str, Dict["Scraper._Lyric", int]]:
+        return self._get_lyric_lists(
+            csv_rows(Path(csv_path or self.csv_path), ["Title", "Lyrics"]))
@@ -0,0 +1,89 @@
+# Inverted index over the combined catalogue (token -> lyric lines containing it) so the frontend can look up candidate lines instead of running containsQuery over every line. Written next to lyrics.json by helpers/combine.py and read by components/searchIndex.js.
+
+# Layout of search_index.json (one independent block per artist, so combine can reuse
+# the blocks of artists that did not change):
+# {"format": "search-v2",
+#  "artists": {artist: {
+#      "songs":    [[album, song], ...],          catalogue order
+#      "offsets":  [0, 31, 75, ...],              line id of each song's first line
+#      "tokens":   ["a", "again", ...],           sorted by UTF-16 code unit (JS string order)
+#      "postings": [[3, 1, 7, ...], ...]}}}       per token, ascending line ids as deltas
+#
+# A line id is offsets[song] + position of the line in that song's list. Tokens use
+# exactly what components/utils.js does before matching: é -> e, lowercase, cleanLyric,
+# split on containsQuery's word delimiters, apostrophes trimmed from both ends.
+
+from __future__ import annotations
+import re
+from typing import Any, Dict, Iterable, List, Set
+
+SEARCH_INDEX_FORMAT = "search-v2"
+
+# cleanLyric() from components/utils.js
+_JS_CLEAN_MAP = (
+    ("\u2018", "'"), ("\u2019", "'"),
+    ("\u201C", '"'), ("\u201D", '"'),
+    *((ch, " ") for ch in "\u00A0\u1680\u200b\u180e\u200a\u202f\u205f\u3000"),
+    *((chr(c), " ") for c in range(0x2000, 0x2009 + 1)),
+    ("\u2013", " - "), ("\u2014", " - "),
+    ("\u0435", "e"),
+)
+
+# containsQuery's boundary class [()\.\-?!;:,\s\u2026"], with \s spelled out the way
+# JavaScript defines it (Python's \s differs slightly)
+_JS_SPACE = "\t\n\v\f\r \u00A0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000\ufeff"
+_DELIMITERS_RE = re.compile(f'[()\\.\\-?!;:,\u2026"{_JS_SPACE}]+')
+
+def normalize_for_search(text: str) -> str:
+    text = text.replace("\u00e9", "e").lower()
+    if not text.isascii():
+        for char, replacement in _JS_CLEAN_MAP:
+            if char in text:
+                text = text.replace(char, replacement)
+    return text
+
+def tokenize(text: str) -> Set[str]:
+    tokens = {word.strip("'") for word in _DELIMITERS_RE.split(normalize_for_search(text))}
+    tokens.discard("")
+    return tokens
+
+def _js_order(token: str) -> bytes:
+    return token.encode("utf-16-be")
+
+# album -> song -> lines (one artist's decoded lyrics.json)
+def build_artist_index(albums: Dict[str, Dict[str, List[Dict[str, Any]]]]) -> Dict[str, Any]:
+    songs: List[List[str]] = []
+    offsets: List[int] = []
+    postings: Dict[str, List[int]] = {}
+    line_id = 0
+
+    for album, album_songs in albums.items():
+        for song, lines in album_songs.items():
+            songs.append([album, song])
+            offsets.append(line_id)
+            for line in lines:
+                for token in tokenize(line["lyric"]):
+                    postings.setdefault(token, []).append(line_id)
+                line_id += 1
+
+    tokens = sorted(postings, key=_js_order)
+    return {
+        "songs": songs,
+        "offsets": offsets,
+        "tokens": tokens,
+        "postings": [_deltas(postings[token]) for token in tokens],
+    }
+
+# artist -> album -> song -> lines (the decoded combined catalogue)
+def build_index(catalog: Dict[str, Dict[str, Dict[str, List[Dict[str, Any]]]]]) -> Dict[str, Any]:
+    return {
+        "format": SEARCH_INDEX_FORMAT,
+        "artists": {artist: build_artist_index(albums) for artist, albums in catalog.items()},
+    }
+
+def _deltas(ids: Iterable[int]) -> List[int]:
+    out, last = [], 0
+    for i in ids:
+        out.append(i - last)
+        last = i
+    return out
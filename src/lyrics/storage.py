@@ -0,0 +1,240 @@
+# Optional SQLite backend for one artist's scrape: indexed tables for songs, lyric lines and scraped URLs, updated with small transactions while scraping instead of rewriting songs.csv / lyrics.csv / lyrics.json / song_titles.txt / scraped_urls.json every run. Scraper.export_store() regenerates those files from it on demand.
+
+# Example use:
+# store = SQLiteStore(Path("paramore/lyrics.db"))
+# "https://genius.com/Paramore-decode-lyrics" in store.scraped_urls   -> indexed lookup
+# store.songs_on_album("Riot!")                                       -> [(title, lyrics), ...]
+
+from __future__ import annotations
+import sqlite3, threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, MutableMapping, Optional, Set, Tuple
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS songs (
+    title       TEXT PRIMARY KEY,
+    album       TEXT,
+    lyrics      TEXT NOT NULL,
+    seq         INTEGER NOT NULL,   -- row order of songs.csv
+    hash        TEXT NOT NULL,      -- Scraper._song_hash(album, lyrics)
+    lines_hash  TEXT                -- hash the stored lyric_lines were built from
+);
+CREATE INDEX IF NOT EXISTS songs_album ON songs (album);
+CREATE INDEX IF NOT EXISTS songs_seq ON songs (seq);
+
+CREATE TABLE IF NOT EXISTS lyric_lines (
+    song          TEXT NOT NULL REFERENCES songs (title) ON DELETE CASCADE,
+    position      INTEGER NOT NULL,
+    lyric         TEXT NOT NULL,
+    prev          TEXT,
+    next          TEXT,
+    multiplicity  INTEGER NOT NULL,
+    PRIMARY KEY (song, position)
+);
+
+CREATE TABLE IF NOT EXISTS scraped_urls (
+    url    TEXT PRIMARY KEY,
+    album  TEXT
+);
+CREATE INDEX IF NOT EXISTS scraped_urls_album ON scraped_urls (album);
+"""
+
+# url -> album view of the scraped_urls table; drop-in for the dict Scraper used to load
+# from scraped_urls.json (membership tests are primary-key lookups, writes commit at once)
+class ScrapedUrls(MutableMapping):
+    def __init__(self, store: "SQLiteStore") -> None:
+        self._store = store
+
+    def __contains__(self, url: object) -> bool:
+        return self._store._one("SELECT 1 FROM scraped_urls WHERE url = ?", (url,)) is not None
+
+    def __getitem__(self, url: str) -> Optional[str]:
+        row = self._store._one("SELECT album FROM scraped_urls WHERE url = ?", (url,))
+        if row is None:
+            raise KeyError(url)
+        return row[0]
+
+    def __setitem__(self, url: str, album: Optional[str]) -> None:
+        with self._store.transaction() as db:
+            db.execute("INSERT INTO scraped_urls (url, album) VALUES (?, ?) "
+                       "ON CONFLICT (url) DO UPDATE SET album = excluded.album", (url, album))
+
+    def __delitem__(self, url: str) -> None:
+        with self._store.transaction() as db:
+            if db.execute("DELETE FROM scraped_urls WHERE url = ?", (url,)).rowcount == 0:
+                raise KeyError(url)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter([url for url, in self._store._all("SELECT url FROM scraped_urls ORDER BY rowid")])
+
+    def __len__(self) -> int:
+        return self._store._one("SELECT COUNT(*) FROM scraped_urls")[0]
+
+class SQLiteStore:
+    # ───────────────────────────── CONSTRUCTION ──────────────────────────── #
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode = WAL")
+        self._db.execute("PRAGMA synchronous = NORMAL")
+        self._db.execute("PRAGMA foreign_keys = ON")
+        self._db.executescript(SCHEMA)
+        self.scraped_urls = ScrapedUrls(self)
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> "SQLiteStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # Everything inside commits together or not at all
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._db
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    # ───────────────────────────── SONGS ──────────────────────────── #
+    def is_empty(self) -> bool:
+        return self._one("SELECT 1 FROM songs LIMIT 1") is None
+
+    def song_titles(self) -> Set[str]:
+        return {title for title, in self._all("SELECT title FROM songs")}
+
+    def songs(self) -> List[Tuple[str, Optional[str], str]]:
+        return self._all("SELECT title, album, lyrics FROM songs ORDER BY seq")
+
+    def songs_on_album(self, album: str) -> List[Tuple[str, str]]:
+        return self._all("SELECT title, lyrics FROM songs WHERE album = ? ORDER BY seq", (album,))
+
+    # Insert or replace a song; a re-scraped title moves to the end like drop_duplicates(keep="last")
+    def upsert_song(self, title: str, album: Optional[str], lyrics: str, song_hash: str) -> None:
+        with self.transaction() as db:
+            db.execute(
+                "INSERT INTO songs (title, album, lyrics, seq, hash) "
+                "VALUES (?, ?, ?, (SELECT COALESCE(MAX(seq), 0) + 1 FROM songs), ?) "
+                "ON CONFLICT (title) DO UPDATE SET album = excluded.album, "
+                "lyrics = excluded.lyrics, seq = excluded.seq, hash = excluded.hash",
+                (title, album, lyrics, song_hash))
+
+    # New lyrics for a song already stored (a --refresh update); its position is kept
+    def update_lyrics(self, title: str, lyrics: str, song_hash: str) -> None:
+        with self.transaction() as db:
+            db.execute("UPDATE songs SET lyrics = ?, hash = ? WHERE title = ?",
+                       (lyrics, song_hash, title))
+
+    # Give `titles` consecutive positions after every other song, in the order given
+    def resequence(self, titles: Iterable[str]) -> None:
+        titles = list(titles)
+        if not titles:
+            return
+        with self.transaction() as db:
+            base = db.execute("SELECT COALESCE(MAX(seq), 0) FROM songs").fetchone()[0]
+            db.executemany("UPDATE songs SET seq = ? WHERE title = ?",
+                           [(base + i, title) for i, title in enumerate(titles, 1)])
+
+    # One transaction for a whole artist: songs as (title, album, lyrics, hash) in row order,
+    # url -> album, and (title, lines) for the songs whose lines are already built and up
+    # to date (taken one song at a time)
+    def bulk_load(
+        self,
+        songs: List[Tuple[str, Optional[str], str, str]],
+        scraped_urls: Dict[str, Optional[str]],
+        lyric_lines: Iterable[Tuple[str, List[Tuple[str, Optional[str], Optional[str], int]]]],
+    ) -> None:
+        with self.transaction() as db:
+            base = db.execute("SELECT COALESCE(MAX(seq), 0) FROM songs").fetchone()[0]
+            db.executemany(
+                "INSERT OR REPLACE INTO songs (title, album, lyrics, seq, hash, lines_hash) "
+                "VALUES (?, ?, ?, ?, ?, NULL)",
+                [(title, album, lyrics, base + i, song_hash)
+                 for i, (title, album, lyrics, song_hash) in enumerate(songs, 1)])
+            for title, lines in lyric_lines:
+                db.executemany(
+                    "INSERT INTO lyric_lines (song, position, lyric, prev, next, multiplicity) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [(title, i, *line) for i, line in enumerate(lines)])
+                db.execute("UPDATE songs SET lines_hash = hash WHERE title = ?", (title,))
+            db.executemany("INSERT OR REPLACE INTO scraped_urls (url, album) VALUES (?, ?)",
+                           list(scraped_urls.items()))
+
+    # Batch deletes for the remove-scraped-* helpers; each returns how many rows went
+    def delete_songs(self, titles: Iterable[str]) -> int:
+        with self.transaction() as db:
+            return sum(db.execute("DELETE FROM songs WHERE title = ?", (title,)).rowcount
+                       for title in titles)
+
+    def delete_urls(self, urls: Iterable[str]) -> int:
+        with self.transaction() as db:
+            return sum(db.execute("DELETE FROM scraped_urls WHERE url = ?", (url,)).rowcount
+                       for url in urls)
+
+    # Songs on the albums and the URLs recorded for them, in one transaction
+    def delete_albums(self, albums: Iterable[str]) -> int:
+        albums = list(albums)
+        with self.transaction() as db:
+            return sum(db.execute("DELETE FROM songs WHERE album = ?", (album,)).rowcount
+                       + db.execute("DELETE FROM scraped_urls WHERE album = ?", (album,)).rowcount
+                       for album in albums)
+
+    # ───────────────────────────── LYRIC LINES ──────────────────────────── #
+    # LYRIC_FORMAT the stored hashes were computed under (PRAGMA user_version, 0 when unset)
+    @property
+    def lyric_format(self) -> int:
+        return self._one("PRAGMA user_version")[0]
+
+    # Recomputes every song's hash as song_hash(album, lyrics) and records lyric_format;
+    # after a format change every song's lyric_lines turn stale
+    def rehash(self, song_hash: Callable[[Optional[str], str], str], lyric_format: int) -> None:
+        with self.transaction() as db:
+            songs = db.execute("SELECT title, album, lyrics FROM songs").fetchall()
+            db.executemany("UPDATE songs SET hash = ? WHERE title = ?",
+                           [(song_hash(album, lyrics), title) for title, album, lyrics in songs])
+            db.execute(f"PRAGMA user_version = {int(lyric_format)}")
+
+    # (title, album, lyrics, hash) of songs whose lyric_lines are missing or out of date
+    def stale_songs(self) -> List[Tuple[str, Optional[str], str, str]]:
+        return self._all("SELECT title, album, lyrics, hash FROM songs "
+                         "WHERE lines_hash IS NOT hash ORDER BY seq")
+
+    # lines: (lyric, prev, next, multiplicity) in first-occurrence order
+    def replace_lyric_lines(self, title: str, song_hash: str,
+                            lines: Iterable[Tuple[str, Optional[str], Optional[str], int]]) -> None:
+        with self.transaction() as db:
+            db.execute("DELETE FROM lyric_lines WHERE song = ?", (title,))
+            db.executemany(
+                "INSERT INTO lyric_lines (song, position, lyric, prev, next, multiplicity) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(title, i, *line) for i, line in enumerate(lines)])
+            db.execute("UPDATE songs SET lines_hash = ? WHERE title = ?", (song_hash, title))
+
+    # Rows shaped like lyrics.csv, in songs.csv order
+    def lyric_rows(self) -> List[Tuple[str, Optional[str], str, Optional[str], Optional[str], int]]:
+        return self._all(
+            "SELECT s.title, s.album, l.lyric, l.prev, l.next, l.multiplicity "
+            "FROM songs s JOIN lyric_lines l ON l.song = s.title "
+            "ORDER BY s.seq, l.position")
+
+    def lines_hashes(self) -> Dict[str, str]:
+        return dict(self._all("SELECT title, lines_hash FROM songs "
+                              "WHERE lines_hash IS NOT NULL ORDER BY seq"))
+
+    # ───────────────────────────── HELPERS ────────────────────────── #
+    def _one(self, sql: str, params: Tuple[Any, ...] = ()) -> Optional[Tuple]:
+        with self._lock:
+            return self._db.execute(sql, params).fetchone()
+
+    def _all(self, sql: str, params: Tuple[Any, ...] = ()) -> List[Tuple]:
+        with self._lock:
+            return self._db.execute(sql, params).fetchall()
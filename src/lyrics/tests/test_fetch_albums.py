@@ -0,0 +1,51 @@
+# Album classification in helpers/fetch-albums.py: edition markers only count in a trailing suffix, so studio titles containing "live", "special" or "remix" stay studio albums, and the artists' current ALBUMS are all added by a default run.
+
+# Example use from CLI (from src/):
+# python -m pytest -q lyrics/tests
+
+from __future__ import annotations
+import importlib
+import pytest
+from lyrics.artefacts import LYRICS_ROOT
+
+fetch_albums = importlib.import_module("lyrics.helpers.fetch-albums")
+
+@pytest.mark.parametrize("name", [
+    "Live Through This", "Live Laugh Love", "Special Request", "Remix the Heart",
+    "Bonus Round", "Re: This Is Why", "Decode / I Caught Myself", "The Final Riot!",
+    "Riot!", "This Is Why - Part Two", "Alive (Again)",
+])
+def test_studio_titles(name: str) -> None:
+    assert fetch_albums.classify(name) == "album"
+
+@pytest.mark.parametrize("name, kind", [
+    ("Paramore (Deluxe Edition)", "deluxe"),
+    ("RIOT! (International Deluxe Version)", "deluxe"),
+    ("brand new eyes [Bonus Tracks]", "deluxe"),
+    ("After Laughter - Special Edition", "deluxe"),
+    ("Riot! (Live)", "live"),
+    ("Live Through This - Live", "live"),
+    ("MTV Unplugged (Live) (Deluxe)", "live"),
+    ("This Is Why - Remixes", "remix"),
+    ("Petals for Armor [Remixed]", "remix"),
+])
+def test_edition_suffixes(name: str, kind: str) -> None:
+    assert fetch_albums.classify(name) == kind
+
+def test_deluxe_editions_link_to_their_album() -> None:
+    albums = [fetch_albums.Album({"id": n, "name": name, "url": "", "release_date_components": year})
+              for n, (name, year) in enumerate([("Riot!", {"year": 2007}),
+                                                ("RIOT! (International Deluxe Version)", None),
+                                                ("Unknown (Deluxe Edition)", None)])]
+    fetch_albums.link_editions(albums)
+    assert [(a.base, a.year) for a in albums] == [
+        ("Riot!", 2007), ("Riot!", 2007), ("Unknown", None)]
+
+# Onboarding an existing artist from scratch with default flags adds every album in its ALBUMS
+@pytest.mark.parametrize("artist", ["paramore", "hayley"])
+def test_current_albums_are_added_by_default(artist: str) -> None:
+    current, _ = fetch_albums.module_constants(LYRICS_ROOT / artist / f"{artist}.py")["ALBUMS"]
+    albums = [fetch_albums.Album({"id": int(path.rsplit("/", 1)[1]), "api_path": path, "name": name, "url": ""})
+              for path, name in current.items()]
+    fetch_albums.link_editions(albums)
+    assert {a.path for a in fetch_albums.new_albums(albums, {})} == set(current)
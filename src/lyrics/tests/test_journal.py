@@ -0,0 +1,42 @@
+# ScrapeJournal across crashes: a record torn mid-write is dropped, and appending after a resume must not glue the next record onto it.
+
+# Example use from CLI (from src/):
+# python -m pytest -q lyrics/tests
+
+from __future__ import annotations
+from pathlib import Path
+from lyrics.journal import ScrapeJournal
+
+def _crash_mid_write(path: Path, record: str) -> None:
+    with path.open("a", encoding="utf-8") as f:
+        f.write(record[:len(record) // 2])
+
+def test_resume_twice_after_torn_writes(tmp_path: Path) -> None:
+    path = tmp_path / "journal.ndjson"
+    journal = ScrapeJournal(path)
+    journal.append({"url": "a", "lyrics": "one"})
+    journal.append({"url": "b", "lyrics": "two"})
+    journal.close()
+    _crash_mid_write(path, '{"url": "c", "lyrics": "three"}\n')
+
+    # First resume: the torn record is gone and the next one lands on its own line
+    journal = ScrapeJournal(path)
+    assert [r["url"] for r in journal.replay()] == ["a", "b"]
+    journal.append({"url": "c", "lyrics": "three"})
+    journal.close()
+    _crash_mid_write(path, '{"url": "d", "lyrics": "four"}\n')
+
+    # Second resume still sees every completed record
+    journal = ScrapeJournal(path)
+    assert [r["url"] for r in journal.replay()] == ["a", "b", "c"]
+    journal.append({"url": "d", "lyrics": "four"})
+    journal.close()
+    assert [r["url"] for r in ScrapeJournal(path).replay()] == ["a", "b", "c", "d"]
+
+def test_torn_first_record_is_dropped(tmp_path: Path) -> None:
+    path = tmp_path / "journal.ndjson"
+    _crash_mid_write(path, '{"url": "a", "lyrics": "one"}\n')
+    journal = ScrapeJournal(path)
+    journal.append({"url": "b", "lyrics": "two"})
+    journal.close()
+    assert ScrapeJournal(path).replay() == [{"url": "b", "lyrics": "two"}]
@@ -0,0 +1,71 @@
+# Incremental lyric rebuilds: unchanged songs reuse their lyrics.csv rows, and a LYRIC_FORMAT bump rebuilds every song (files and lyrics.db alike).
+
+# Example use from CLI (from src/):
+# python -m pytest -q lyrics/tests
+
+from __future__ import annotations
+import csv
+from pathlib import Path
+from typing import Set
+import pytest
+from lyrics import scraper
+from lyrics.scraper import SONG_COLUMNS, Scraper
+from lyrics.storage import SQLiteStore
+
+SONGS = [
+    ("Decode", "Twilight", "How can I decide what's right\nWhen you're clouding up my mind"),
+    ("Misery Business", "Riot!", "I'm in the business of misery\nLet's take it from the top"),
+    ("Hard Times", "After Laughter", "All that I want\nIs to wake up fine"),
+]
+
+def _scraper(tmp_path: Path) -> Scraper:
+    with (tmp_path / "songs.csv").open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f, lineterminator="\n")
+        writer.writerow(SONG_COLUMNS)
+        writer.writerows(SONGS)
+    return Scraper(artist_id=1, albums={}, base_path=tmp_path)
+
+# Records the title of every song whose lyric lines are recomputed
+def _spy_rebuilds(sc: Scraper, monkeypatch: pytest.MonkeyPatch) -> Set[str]:
+    rebuilt: Set[str] = set()
+    get_lyric_list = sc._get_lyric_list
+    def spy(lyrics: str):
+        rebuilt.update(title for title, _, text in SONGS if text == lyrics)
+        return get_lyric_list(lyrics)
+    monkeypatch.setattr(sc, "_get_lyric_list", spy)
+    return rebuilt
+
+def test_unchanged_songs_are_reused(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    sc = _scraper(tmp_path)
+    rebuilt = _spy_rebuilds(sc, monkeypatch)
+    sc._songs_to_lyrics()
+    assert rebuilt == {title for title, _, _ in SONGS}
+
+    rebuilt.clear()
+    sc._songs_to_lyrics()
+    assert rebuilt == set()
+
+def test_format_change_rebuilds_every_song(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    sc = _scraper(tmp_path)
+    sc._songs_to_lyrics()
+    before = (tmp_path / "lyrics.csv").read_bytes()
+
+    rebuilt = _spy_rebuilds(sc, monkeypatch)
+    monkeypatch.setattr(scraper, "LYRIC_FORMAT", scraper.LYRIC_FORMAT + 1)
+    sc._songs_to_lyrics()
+    assert rebuilt == {title for title, _, _ in SONGS}
+    assert (tmp_path / "lyrics.csv").read_bytes() == before
+
+def test_format_change_rebuilds_every_stored_song(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    sc = _scraper(tmp_path)
+    with SQLiteStore(sc.db_path) as store:
+        sc.store = store
+        sc._import_artefacts()
+        store.rehash(sc._song_hash, scraper.LYRIC_FORMAT)
+        sc._store_lyric_lines()
+        assert store.stale_songs() == []
+
+        monkeypatch.setattr(scraper, "LYRIC_FORMAT", scraper.LYRIC_FORMAT + 1)
+        assert store.lyric_format != scraper.LYRIC_FORMAT
+        store.rehash(sc._song_hash, scraper.LYRIC_FORMAT)
+        assert [title for title, *_ in store.stale_songs()] == [title for title, _, _ in SONGS]